@@ -0,0 +1,25 @@
+"""Paths and run metadata shared by the benchmarks.
+
+Kept free of the benchmarks' own dependencies, so importing it does not pull in numpy, the
+client factory or the fake algod.
+"""
+
+import subprocess
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def git_commit() -> str | None:
+    """The commit the project is checked out at, recorded with each run; None outside git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
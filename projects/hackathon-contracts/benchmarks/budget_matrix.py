@@ -0,0 +1,323 @@
+"""Cost matrix for every ABI method in `smart_contracts/artifacts`, swept over input sizes.
+
+Deploys each app like `benchmarks.opcode_budget` and simulates each ABI method with arguments
+generated from its ABI types, with every variable-length argument (strings, byte arrays and
+dynamic arrays) sized to each of `--sizes` bytes in turn. Methods whose arguments must agree
+with each other, such as a region and its colors, take theirs from `MATRIX_CALLS` instead. For
+each size it records the opcode budget, the bytes the call logged and its fee:
+
+    poetry run python -m benchmarks.budget_matrix --sizes 1 64 1024 4096
+
+The matrix goes to a JSON file in `benchmarks/results/`. `--check` exits non-zero when a method
+costs more than `benchmarks/baselines/budget_matrix.json` records at some size, stops working at
+a size it used to handle, or when its budget or log bytes grow faster than linearly in input
+size; `--update-baseline` stores the matrix measured instead.
+
+Sizes past the AVM's limits are recorded with the error simulate gave: a call's application
+arguments are capped at 2KB in total and each log at 1KB, so e.g. `hello` stops short of 4KB
+names. Methods with transaction or asset arguments are skipped unless `MATRIX_CALLS` has them.
+"""
+
+import argparse
+import base64
+import json
+import logging
+import sys
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from algokit_utils import AlgorandClient, AppClient
+from algosdk import abi
+
+from benchmarks._common import PROJECT_ROOT, RESULTS_DIR, git_commit
+from benchmarks.opcode_budget import (
+    ARTIFACTS_DIR,
+    BUY,
+    DEPLOYER_FUNDING,
+    OWNED_ROW,
+    PAINT,
+    PIXEL_CANVAS_WIDTH,
+    PayApp,
+    artifact_specs,
+    deploy_app,
+    simulate_trace,
+)
+from smart_contracts.hello_world.contract import COLOR_BYTES, PRICE_PER_PIXEL
+
+logger = logging.getLogger(__name__)
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "budget_matrix.json"
+DEFAULT_SIZES = (1, 16, 64, 256, 1024, 2048, 4096)
+# Metrics that should grow at most linearly in input size. Fees do not grow with size at all
+# unless a method sends inner transactions per byte, which the baseline check catches.
+LINEAR_METRICS = ("budget", "log_bytes")
+# How much steeper a metric may get over the larger half of the sizes than over the smaller
+# half before it counts as growing faster than linearly; the slack absorbs per-chunk steps.
+GROWTH_TOLERANCE = 1.5
+GROWTH_SLACK_PER_BYTE = 0.05
+
+
+class UnsupportedArgument(Exception):  # noqa: N818
+    """An ABI argument the matrix cannot generate a representative value for."""
+
+
+def _paint_args(size: int) -> tuple[Any, ...]:
+    """A region of the rows the setup bought, with about `size` bytes of colors.
+
+    Colors come in whole pixels, in rows as wide as the canvas allows; a region taller than a
+    paint call allows fails, as past any other limit.
+    """
+    pixels = max(1, size // COLOR_BYTES)
+    rows = -(-pixels // PIXEL_CANVAS_WIDTH)
+    width = -(-pixels // rows)
+    return (0, OWNED_ROW, width, rows, bytes(width * rows * COLOR_BYTES))
+
+
+# Arguments by app name and method signature, as a function of the input size in bytes.
+MATRIX_CALLS: dict[str, dict[str, Callable[[int], tuple[Any, ...]]]] = {
+    "PixelCanvas": {
+        # A pixel in a row the setup left unowned.
+        BUY: lambda size: (0, 0, 1, 1, PayApp(PRICE_PER_PIXEL)),
+        PAINT: _paint_args,
+    },
+}
+
+
+def abi_argument(
+    arg_type: abi.ABIType | str, size: int, app_client: AppClient
+) -> Any:  # noqa: ANN401
+    """A representative value of `arg_type`, with variable-length values `size` bytes long."""
+    if isinstance(arg_type, str):
+        if arg_type == "account":
+            return app_client.app_address
+        if arg_type == "application":
+            return app_client.app_id
+        raise UnsupportedArgument(f"{arg_type} arguments are not generated")
+    if isinstance(arg_type, abi.StringType):
+        return "a" * size
+    if isinstance(arg_type, abi.ArrayDynamicType):
+        if isinstance(arg_type.child_type, abi.ByteType):
+            return b"a" * size
+        child = arg_type.child_type
+        count = 1 if child.is_dynamic() else max(1, size // child.byte_len())
+        return [abi_argument(child, size, app_client) for _ in range(count)]
+    if isinstance(arg_type, abi.ArrayStaticType):
+        if isinstance(arg_type.child_type, abi.ByteType):
+            return bytes(arg_type.static_length)
+        return [
+            abi_argument(arg_type.child_type, size, app_client)
+            for _ in range(arg_type.static_length)
+        ]
+    if isinstance(arg_type, abi.TupleType):
+        return tuple(
+            abi_argument(child, size, app_client) for child in arg_type.child_types
+        )
+    if isinstance(arg_type, abi.BoolType):
+        return True
+    if isinstance(arg_type, abi.AddressType):
+        return app_client.app_address
+    if isinstance(arg_type, abi.UintType | abi.UfixedType | abi.ByteType):
+        return 1
+    raise UnsupportedArgument(f"{arg_type} arguments are not generated")
+
+
+def is_sized(method: abi.Method) -> bool:
+    """Whether any of the method's arguments has a variable length, so its cost can depend on size."""
+    return any(
+        isinstance(arg.type, abi.ABIType) and arg.type.is_dynamic()
+        for arg in method.args
+    )
+
+
+def measure(
+    app_client: AppClient, method: abi.Method, size: int, sender: str
+) -> dict[str, Any]:
+    """Simulate one call of `method` with arguments of `size` bytes and record what it cost."""
+    signature = method.get_signature()
+    matrix_call = MATRIX_CALLS.get(app_client.app_spec.name, {}).get(signature)
+    args = (
+        list(matrix_call(size))
+        if matrix_call
+        else [abi_argument(arg.type, size, app_client) for arg in method.args]
+    )
+    try:
+        _, txn_result = simulate_trace(app_client, signature, args, sender)
+    except Exception as e:
+        return {"error": str(e).splitlines()[0][:200]}
+    result: dict[str, Any] = txn_result.get("txn-result", {})
+    return {
+        "budget": txn_result.get("app-budget-consumed", 0),
+        "log_bytes": sum(len(base64.b64decode(log)) for log in result.get("logs", [])),
+        "fee": result.get("txn", {}).get("txn", {}).get("fee", 0),
+    }
+
+
+def superlinear_metrics(points: dict[str, dict[str, Any]]) -> list[str]:
+    """The metrics that grow faster than linearly over the sizes that succeeded.
+
+    Compares each metric's cost per byte over the larger half of the sizes with that over the
+    smaller half; for linear growth the two match.
+    """
+    sizes = sorted(int(size) for size, point in points.items() if "error" not in point)
+    if len(sizes) < 3:
+        return []
+    low, mid, high = sizes[0], sizes[len(sizes) // 2], sizes[-1]
+    growing = []
+    for metric in LINEAR_METRICS:
+        value = {size: points[str(size)][metric] for size in (low, mid, high)}
+        lower_slope = (value[mid] - value[low]) / (mid - low)
+        upper_slope = (value[high] - value[mid]) / (high - mid)
+        if upper_slope > lower_slope * GROWTH_TOLERANCE + GROWTH_SLACK_PER_BYTE:
+            growing.append(metric)
+    return growing
+
+
+def run(
+    algorand: AlgorandClient,
+    deployer: str,
+    sizes: Sequence[int],
+    artifacts_dir: Path = ARTIFACTS_DIR,
+) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+    """The matrix: app name -> method signature -> size -> budget, log bytes and fee, or error."""
+    matrix: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+    for _, app_spec in artifact_specs(artifacts_dir):
+        app_client = deploy_app(algorand, app_spec, deployer)
+        if app_client is None:
+            continue
+        for arc56_method in app_spec.methods:
+            method = arc56_method.to_abi_method()
+            signature = method.get_signature()
+            points = {}
+            try:
+                for size in sizes if is_sized(method) else sizes[:1]:
+                    points[str(size)] = measure(app_client, method, size, deployer)
+            except UnsupportedArgument as e:
+                logger.warning(f"Skipping {app_spec.name}.{signature}: {e}")
+                continue
+            matrix.setdefault(app_spec.name, {})[signature] = points
+            summary = ", ".join(
+                f"{size}B: {point.get('budget', point.get('error'))}"
+                for size, point in points.items()
+            )
+            logger.info(
+                f"{app_spec.name}.{signature} opcode budget by input size: {summary}"
+            )
+    return matrix
+
+
+def check_matrix(
+    measured: dict[str, dict[str, dict[str, dict[str, Any]]]],
+    baseline: dict[str, dict[str, dict[str, dict[str, Any]]]],
+    tolerance: float = 0.0,
+) -> list[str]:
+    """Describe every regression: a cost past its baseline, a size that now fails, or superlinear growth."""
+    regressions: list[str] = []
+    for app, methods in sorted(measured.items()):
+        for method, points in sorted(methods.items()):
+            name = f"{app}.{method}"
+            regressions.extend(
+                f"{name} grows faster than linearly in input size in {metric}"
+                for metric in superlinear_metrics(points)
+            )
+            expected_points = baseline.get(app, {}).get(method)
+            if expected_points is None:
+                logger.warning(
+                    f"{name} has no baseline, run with --update-baseline to add one"
+                )
+                continue
+            for size, point in points.items():
+                expected = expected_points.get(size)
+                if expected is None or "error" in expected:
+                    continue
+                if "error" in point:
+                    regressions.append(
+                        f"{name} fails with {size}B inputs, which it used to handle: {point['error']}"
+                    )
+                    continue
+                regressions.extend(
+                    f"{name} with {size}B inputs: {metric} {point[metric]}, up from {expected[metric]}"
+                    for metric in ("budget", "log_bytes", "fee")
+                    if point[metric] > expected[metric] * (1 + tolerance)
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure each ABI method's costs over a range of input sizes."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="variable-length argument sizes in bytes",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="fail on regressions against the baseline"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store the measured matrix as the baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.0,
+        help="fraction a cost may grow by before --check fails",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="JSON file to write (default: a timestamped file in results/)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    # The client factory lives with the contracts' deploy scripts, which import each other by bare name.
+    sys.path.insert(0, str(PROJECT_ROOT / "smart_contracts" / "hello_world"))
+    import client_factory
+
+    algorand = client_factory.get_algorand()
+    deployer = client_factory.get_account("DEPLOYER")
+    algorand.account.ensure_funded_from_environment(deployer.address, DEPLOYER_FUNDING)
+    matrix = run(algorand, deployer.address, sorted(set(args.sizes)))
+
+    output = (
+        args.output
+        or RESULTS_DIR / f"budget_matrix-{datetime.now(UTC):%Y%m%dT%H%M%SZ}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "matrix": matrix,
+    }
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    logger.info(f"Wrote the cost matrix to {output}")
+
+    if args.update_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(
+            json.dumps(matrix, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        logger.info(f"Stored the measured matrix as the baseline in {BASELINE_PATH}")
+    elif args.check:
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+        regressions = check_matrix(matrix, baseline, args.tolerance)
+        for regression in regressions:
+            logger.error(f"❌ {regression}")
+        if regressions:
+            sys.exit(1)
+        logger.info(
+            f"✅ {sum(len(methods) for methods in matrix.values())} methods within the baseline"
+        )
+
+
+if __name__ == "__main__":
+    main()
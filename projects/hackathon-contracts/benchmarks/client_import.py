@@ -0,0 +1,146 @@
+"""Startup benchmark for the generated typed clients.
+
+Imports a client in fresh interpreters, the way a short-lived CLI worker or a pytest run does,
+and records how long each step takes: importing algokit_utils, importing the client itself and
+first use of its app spec, with the pickled spec cache next to the artifacts missing (cold) or
+present (warm):
+
+    poetry run python -m benchmarks.client_import --runs 20
+
+Results go to a JSON file in `benchmarks/results/`, like the throughput benchmarks.
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks._common import PROJECT_ROOT, RESULTS_DIR, git_commit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODULE = "smart_contracts.artifacts.hello_world.hello_world_client"
+STEPS = ("algokit_utils", "client", "app_spec")
+
+_PROBE = """
+import json, time
+started = time.perf_counter()
+import algokit_utils
+imported_algokit = time.perf_counter()
+import {module} as client
+imported_client = time.perf_counter()
+client.APP_SPEC
+parsed = time.perf_counter()
+print(json.dumps({{
+    "algokit_utils": imported_algokit - started,
+    "client": imported_client - imported_algokit,
+    "app_spec": parsed - imported_client,
+}}))
+"""
+
+
+def spec_cache_paths(module: str) -> list[Path]:
+    spec = importlib.util.find_spec(module)
+    if spec is None or spec.origin is None:
+        raise ValueError(f"Cannot find client module {module}")
+    return list(Path(spec.origin).parent.glob("*.arc56.pickle"))
+
+
+def probe(module: str) -> dict[str, float]:
+    """Import `module` in a fresh interpreter and return the seconds each step took."""
+    # Let the client's bytecode be cached, as it is wherever it is installed.
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if name != "PYTHONDONTWRITEBYTECODE"
+    }
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, float] = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["process"] = time.perf_counter() - started
+    return timings
+
+
+def _summarize(runs: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    summary = {}
+    for step in (*STEPS, "process"):
+        values = sorted(run[step] * 1000 for run in runs)
+        summary[step] = {
+            "median_ms": round(statistics.median(values), 3),
+            "max_ms": round(values[-1], 3),
+        }
+    return summary
+
+
+def run(module: str, runs: int) -> dict[str, Any]:
+    results = {}
+    probe(module)  # Compile and cache bytecode, so neither measurement pays for it.
+    for cache in ("cold", "warm"):
+        timings = []
+        for _ in range(runs):
+            if cache == "cold":
+                for path in spec_cache_paths(module):
+                    path.unlink()
+            timings.append(probe(module))
+        results[cache] = _summarize(timings)
+        logger.info(
+            f"✅ {cache} spec cache: client import {results[cache]['client']['median_ms']}ms, "
+            f"first APP_SPEC use {results[cache]['app_spec']['median_ms']}ms, "
+            f"algokit_utils {results[cache]['algokit_utils']['median_ms']}ms (median of {runs})"
+        )
+    return {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "module": module,
+        "runs": runs,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the import time of a generated client."
+    )
+    parser.add_argument(
+        "--module", default=DEFAULT_MODULE, help="client module to import"
+    )
+    parser.add_argument(
+        "--runs", type=int, default=10, help="fresh interpreters per measurement"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="JSON file to write (default: a timestamped file in results/)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    report = run(args.module, args.runs)
+    output = (
+        args.output
+        or RESULTS_DIR / f"client_import-{datetime.now(UTC):%Y%m%dT%H%M%SZ}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    logger.info(f"Wrote client import timings to {output}")
+
+
+if __name__ == "__main__":
+    main()
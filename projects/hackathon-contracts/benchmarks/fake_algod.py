@@ -0,0 +1,571 @@
+"""An in-process stand-in for algod (and the few indexer endpoints we use), for load tests without LocalNet.
+
+It serves the algod REST API over HTTP, so `AlgorandClient` talks to it exactly as it would to a
+node. It keeps just enough ledger state to settle the pixel flows: Algo balances with minimum
+balances, ASA creation, opt-ins and transfers. Atomic groups are applied all-or-nothing, and
+transactions outside their validity window or short of the minimum fee are rejected.
+Signatures are not verified, and app calls are not supported.
+
+`latency` delays every response; `block_time` closes a block every so many seconds. With
+`block_time=0` each submitted group is confirmed at once in its own round, like LocalNet's dev
+mode. To drive the deploy scripts or the pixel UI against it, run
+
+    poetry run python -m benchmarks.fake_algod --latency 0.02 --block-time 2.8
+
+and export the environment variables it prints.
+"""
+
+import argparse
+import base64
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import msgpack  # type: ignore[import-untyped]
+from algosdk import account, mnemonic, transaction
+
+DEFAULT_GENESIS_ID = (
+    "dockernet-v1"  # A LocalNet genesis ID, so clients treat the fake as LocalNet.
+)
+MIN_FEE = 1_000
+MIN_BALANCE = 100_000
+ASSET_MIN_BALANCE = 100_000
+DISPENSER_BALANCE = 10**15
+MAX_WAIT_SECONDS = 60.0
+
+Json = dict[str, Any]
+
+
+class TransactionRejected(Exception):  # noqa: N818
+    """A submitted transaction or group that the fake ledger would not accept."""
+
+
+class FakeLedger:
+    """Balances, assets and transactions of the fake network. All methods hold `self.lock`."""
+
+    def __init__(self, genesis_id: str) -> None:
+        self.genesis_id = genesis_id
+        self.genesis_hash = base64.b64encode(os.urandom(32)).decode()
+        self.lock = threading.Condition()
+        self.round = 1
+        self.round_started = time.monotonic()
+        self.balances: dict[str, int] = {}
+        self.assets: dict[int, Json] = {}
+        self.holdings: dict[str, dict[int, int]] = {}
+        self.transactions: dict[str, Json] = {}
+        self.pending: list[str] = []
+        self.blocks: dict[int, list[str]] = {}
+        self._next_asset_id = 1001
+
+    # --- Reads ---
+
+    def min_balance(
+        self, address: str, holdings: dict[str, dict[int, int]] | None = None
+    ) -> int:
+        # Creating an asset also opts the creator in, so every created asset is also a holding.
+        return MIN_BALANCE + ASSET_MIN_BALANCE * len(
+            (self.holdings if holdings is None else holdings).get(address, {})
+        )
+
+    def holding_json(self, address: str, asset_id: int) -> Json:
+        return {
+            "asset-id": asset_id,
+            "amount": self.holdings[address][asset_id],
+            "is-frozen": False,
+        }
+
+    def account_json(self, address: str) -> Json:
+        amount = self.balances.get(address, 0)
+        holdings = self.holdings.get(address, {})
+        created = [
+            asset
+            for asset in self.assets.values()
+            if asset["params"]["creator"] == address
+        ]
+        return {
+            "address": address,
+            "amount": amount,
+            "amount-without-pending-rewards": amount,
+            "min-balance": self.min_balance(address) if address in self.balances else 0,
+            "pending-rewards": 0,
+            "rewards": 0,
+            "round": self.round,
+            "status": "Offline",
+            "total-assets-opted-in": len(holdings),
+            "total-created-assets": len(created),
+            "assets": [self.holding_json(address, asset_id) for asset_id in holdings],
+            "created-assets": created,
+        }
+
+    # --- Writes ---
+
+    def fund(self, address: str, microalgos: int) -> None:
+        self.balances[address] = self.balances.get(address, 0) + microalgos
+
+    def submit(
+        self, signed: list[transaction.SignedTransaction], *, instant: bool
+    ) -> str:
+        """Apply a group atomically and queue it for the next block. Returns the first transaction ID."""
+        txns = [stxn.transaction for stxn in signed]
+        if sum(txn.fee for txn in txns) < MIN_FEE * len(txns):
+            raise TransactionRejected(
+                f"txgroup had {sum(txn.fee for txn in txns)} in fees, less than the minimum"
+            )
+        for txn in txns:
+            txid = txn.get_txid()
+            if txid in self.transactions:
+                raise TransactionRejected(f"transaction already in ledger: {txid}")
+            if txn.genesis_hash != self.genesis_hash:
+                raise TransactionRejected("genesis hash mismatch")
+            if not txn.first_valid_round <= self.round + 1 <= txn.last_valid_round:
+                raise TransactionRejected(
+                    f"txn dead: round {self.round + 1} outside of {txn.first_valid_round}--{txn.last_valid_round}"
+                )
+
+        # Apply to copies of the accounts the group touches, so a failing transaction leaves the ledger unchanged.
+        touched = {txn.sender for txn in txns} | {
+            txn.receiver for txn in txns if getattr(txn, "receiver", None)
+        }
+        balances = {address: self.balances.get(address, 0) for address in touched}
+        holdings = {
+            address: dict(self.holdings.get(address, {})) for address in touched
+        }
+        assets: dict[int, Json] = {}
+        next_asset_id = self._next_asset_id
+        results: list[Json] = []
+        for txn in txns:
+            result: Json = {}
+            self._debit(balances, txn.sender, txn.fee)
+            if isinstance(txn, transaction.PaymentTxn):
+                self._debit(balances, txn.sender, txn.amt)
+                balances[txn.receiver] = balances.get(txn.receiver, 0) + txn.amt
+            elif isinstance(txn, transaction.AssetCreateTxn) or (
+                isinstance(txn, transaction.AssetConfigTxn) and not txn.index
+            ):
+                asset_id, next_asset_id = next_asset_id, next_asset_id + 1
+                assets[asset_id] = {
+                    "index": asset_id,
+                    "params": self._asset_params(txn),
+                }
+                holdings[txn.sender][asset_id] = txn.total
+                result["asset-index"] = asset_id
+            elif isinstance(txn, transaction.AssetTransferTxn):
+                if txn.index not in self.assets and txn.index not in assets:
+                    raise TransactionRejected(f"asset {txn.index} does not exist")
+                self._transfer_asset(holdings, txn)
+            else:
+                raise TransactionRejected(f"unsupported transaction type {txn.type!r}")
+            results.append(result)
+
+        for address in touched:
+            if balances[address] < self.min_balance(address, holdings):
+                raise TransactionRejected(
+                    f"account {address} balance {balances[address]} below min"
+                )
+        self.assets.update(assets)
+        self.holdings.update(holdings)
+        self.balances.update(balances)
+        self._next_asset_id = next_asset_id
+
+        for stxn, txn, result in zip(signed, txns, results, strict=True):
+            txid = txn.get_txid()
+            self.transactions[txid] = {
+                "confirmed-round": 0,
+                "pool-error": "",
+                # Signatures decode as base64 strings already.
+                "txn": {"sig": stxn.signature or "", "txn": self._txn_json(txn)},
+                **result,
+            }
+            self.pending.append(txid)
+        if instant:
+            self.close_block()
+        return txns[0].get_txid()
+
+    def close_block(self) -> None:
+        self.round += 1
+        self.round_started = time.monotonic()
+        for txid in self.pending:
+            self.transactions[txid]["confirmed-round"] = self.round
+        self.blocks[self.round] = self.pending
+        self.pending = []
+        self.lock.notify_all()
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _debit(balances: dict[str, int], address: str, amount: int) -> None:
+        if balances.get(address, 0) < amount:
+            raise TransactionRejected(
+                f"overspend: account {address} tried to spend {amount}"
+            )
+        balances[address] -= amount
+
+    @staticmethod
+    def _transfer_asset(
+        holdings: dict[str, dict[int, int]], txn: transaction.AssetTransferTxn
+    ) -> None:
+        if txn.sender == txn.receiver and txn.amount == 0:
+            holdings[txn.sender].setdefault(txn.index, 0)
+            return
+        sender_holding = holdings[txn.sender]
+        if txn.index not in sender_holding:
+            raise TransactionRejected(f"asset {txn.index} missing from {txn.sender}")
+        if txn.index not in holdings[txn.receiver]:
+            raise TransactionRejected(
+                f"receiver {txn.receiver} not opted in to asset {txn.index}"
+            )
+        if sender_holding[txn.index] < txn.amount:
+            raise TransactionRejected(f"underflow on asset {txn.index}")
+        sender_holding[txn.index] -= txn.amount
+        holdings[txn.receiver][txn.index] += txn.amount
+
+    @staticmethod
+    def _asset_params(txn: transaction.AssetConfigTxn) -> Json:
+        return {
+            "creator": txn.sender,
+            "total": txn.total,
+            "decimals": txn.decimals,
+            "default-frozen": bool(txn.default_frozen),
+            "name": txn.asset_name or "",
+            "unit-name": txn.unit_name or "",
+            "url": txn.url or "",
+        }
+
+    @staticmethod
+    def _txn_json(txn: transaction.Transaction) -> Json:
+        return {
+            "type": txn.type,
+            "snd": txn.sender,
+            "fee": txn.fee,
+            "fv": txn.first_valid_round,
+            "lv": txn.last_valid_round,
+        }
+
+
+Route = tuple[str, re.Pattern[str], Callable[..., tuple[int, Json]]]
+
+
+class FakeAlgod:
+    """Serves a FakeLedger over the algod REST API on a local port, from a background thread."""
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        block_time: float = 0.0,
+        genesis_id: str = DEFAULT_GENESIS_ID,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.block_time = block_time
+        self.ledger = FakeLedger(genesis_id)
+        self.token = "a" * 64
+        dispenser_key, self.dispenser_address = account.generate_account()
+        deployer_key, self.deployer_address = account.generate_account()
+        self.dispenser_mnemonic = mnemonic.from_private_key(dispenser_key)
+        self.deployer_mnemonic = mnemonic.from_private_key(deployer_key)
+        self.ledger.fund(self.dispenser_address, DISPENSER_BALANCE)
+        self.ledger.fund(self.deployer_address, DISPENSER_BALANCE)
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._routes: list[Route] = [
+            ("GET", re.compile(r"/health"), lambda: (200, {})),
+            ("GET", re.compile(r"/versions"), self._versions),
+            ("GET", re.compile(r"/v2/status"), self._status),
+            (
+                "GET",
+                re.compile(r"/v2/status/wait-for-block-after/(\d+)"),
+                self._wait_for_block_after,
+            ),
+            ("GET", re.compile(r"/v2/transactions/params"), self._suggested_params),
+            ("POST", re.compile(r"/v2/transactions"), self._send_raw),
+            ("GET", re.compile(r"/v2/transactions/pending/(\w+)"), self._pending_info),
+            ("GET", re.compile(r"/v2/blocks/(\d+)"), self._block),
+            ("GET", re.compile(r"/v2/blocks/(\d+)/txids"), self._block_txids),
+            ("GET", re.compile(r"/v2/accounts/(\w+)"), self._account),
+            ("GET", re.compile(r"/v2/accounts/(\w+)/assets"), self._account_assets),
+            (
+                "GET",
+                re.compile(r"/v2/accounts/(\w+)/assets/(\d+)"),
+                self._account_asset,
+            ),
+            (
+                "GET",
+                re.compile(r"/v2/accounts/(\w+)/created-assets"),
+                self._created_assets,
+            ),
+            ("GET", re.compile(r"/v2/assets/(\d+)"), self._asset),
+        ]
+
+    @property
+    def port(self) -> int:
+        return int(self._server.server_address[1])
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._server.server_address[0]}:{self.port}"
+
+    def environ(self) -> dict[str, str]:
+        """Environment variables that point `AlgorandClient.from_environment()` and the deploy accounts here."""
+        return {
+            "ALGOD_SERVER": f"http://{self._server.server_address[0]}",
+            "ALGOD_PORT": str(self.port),
+            "ALGOD_TOKEN": self.token,
+            "INDEXER_SERVER": f"http://{self._server.server_address[0]}",
+            "INDEXER_PORT": str(self.port),
+            "INDEXER_TOKEN": self.token,
+            "DISPENSER_MNEMONIC": self.dispenser_mnemonic,
+            "DEPLOYER_MNEMONIC": self.deployer_mnemonic,
+        }
+
+    def start(self) -> "FakeAlgod":
+        self._threads.append(
+            threading.Thread(
+                target=self._server.serve_forever, daemon=True, name="fake-algod"
+            )
+        )
+        if self.block_time > 0:
+            self._threads.append(
+                threading.Thread(
+                    target=self._produce_blocks, daemon=True, name="fake-algod-blocks"
+                )
+            )
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+        with self.ledger.lock:
+            self.ledger.lock.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    @contextmanager
+    def running(self) -> Iterator["FakeAlgod"]:
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def _produce_blocks(self) -> None:
+        while not self._stopped.wait(self.block_time):
+            with self.ledger.lock:
+                self.ledger.close_block()
+
+    # --- Endpoints ---
+
+    def _versions(self) -> tuple[int, Json]:
+        return 200, {
+            "genesis_id": self.ledger.genesis_id,
+            "genesis_hash_b64": self.ledger.genesis_hash,
+            "versions": ["v2"],
+            "build": {
+                "major": 0,
+                "minor": 0,
+                "build_number": 0,
+                "commit_hash": "fake",
+                "branch": "fake",
+                "channel": "dev",
+            },
+        }
+
+    def _status(self) -> tuple[int, Json]:
+        return 200, {
+            "last-round": self.ledger.round,
+            "time-since-last-round": int(
+                (time.monotonic() - self.ledger.round_started) * 1e9
+            ),
+            "catchup-time": 0,
+            "last-version": "future",
+            "next-version": "future",
+            "next-version-round": self.ledger.round + 1,
+            "next-version-supported": True,
+            "stopped-at-unsupported-round": False,
+        }
+
+    def _wait_for_block_after(self, round_: str) -> tuple[int, Json]:
+        deadline = time.monotonic() + MAX_WAIT_SECONDS
+        while self.ledger.round <= int(round_) and not self._stopped.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self.ledger.lock.wait(remaining)
+        return self._status()
+
+    def _suggested_params(self) -> tuple[int, Json]:
+        return 200, {
+            "consensus-version": "future",
+            "fee": 0,
+            "genesis-hash": self.ledger.genesis_hash,
+            "genesis-id": self.ledger.genesis_id,
+            "last-round": self.ledger.round,
+            "min-fee": MIN_FEE,
+        }
+
+    def _send_raw(self, body: bytes) -> tuple[int, Json]:
+        try:
+            signed = _decode_signed(body)
+        except Exception as e:
+            return 400, {"message": f"msgpack decode failed: {e}"}
+        try:
+            txid = self.ledger.submit(signed, instant=self.block_time <= 0)
+        except TransactionRejected as e:
+            return 400, {"message": f"TransactionPool.Remember: {e}"}
+        return 200, {"txId": txid}
+
+    def _pending_info(self, txid: str) -> tuple[int, Json]:
+        info = self.ledger.transactions.get(txid)
+        if info is None:
+            return 404, {"message": "txn does not exist"}
+        return 200, info
+
+    def _block(self, round_: str) -> tuple[int, Json]:
+        if int(round_) > self.ledger.round:
+            return 404, {"message": "ledger does not have entry"}
+        txids = self.ledger.blocks.get(int(round_), [])
+        # Only the apply data the clients read is filled in.
+        txns = [
+            {"caid": info["asset-index"]} if "asset-index" in info else {}
+            for info in (self.ledger.transactions[txid] for txid in txids)
+        ]
+        return 200, {
+            "block": {"rnd": int(round_), "gen": self.ledger.genesis_id, "txns": txns}
+        }
+
+    def _block_txids(self, round_: str) -> tuple[int, Json]:
+        if int(round_) > self.ledger.round:
+            return 404, {"message": "ledger does not have entry"}
+        return 200, {"blockTxids": self.ledger.blocks.get(int(round_), [])}
+
+    def _account(self, address: str) -> tuple[int, Json]:
+        return 200, self.ledger.account_json(address)
+
+    def _account_assets(self, address: str) -> tuple[int, Json]:
+        holdings = self.ledger.holdings.get(address, {})
+        return 200, {
+            "assets": [
+                self.ledger.holding_json(address, asset_id) for asset_id in holdings
+            ],
+            "current-round": self.ledger.round,
+        }
+
+    def _account_asset(self, address: str, asset_id: str) -> tuple[int, Json]:
+        if int(asset_id) not in self.ledger.holdings.get(address, {}):
+            return 404, {"message": "account asset info not found"}
+        return 200, {
+            "asset-holding": self.ledger.holding_json(address, int(asset_id)),
+            "round": self.ledger.round,
+        }
+
+    def _created_assets(self, address: str) -> tuple[int, Json]:
+        assets = [
+            asset
+            for asset in self.ledger.assets.values()
+            if asset["params"]["creator"] == address
+        ]
+        return 200, {"assets": assets, "current-round": self.ledger.round}
+
+    def _asset(self, asset_id: str) -> tuple[int, Json]:
+        asset = self.ledger.assets.get(int(asset_id))
+        if asset is None:
+            return 404, {"message": "asset does not exist"}
+        return 200, asset
+
+    # --- HTTP plumbing ---
+
+    def dispatch(self, method: str, path: str, body: bytes) -> tuple[int, Json]:
+        if self.latency:
+            time.sleep(self.latency)
+        path = path.partition("?")[0]
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                args: tuple[Any, ...] = (body,) if method == "POST" else match.groups()
+                with self.ledger.lock:
+                    try:
+                        return handler(*args)
+                    except Exception as e:
+                        return 500, {"message": f"fake algod error: {e!r}"}
+        return 404, {"message": f"{method} {path} is not implemented by the fake algod"}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this every response waits on delayed ACKs.
+            disable_nagle_algorithm = True
+
+            def _respond(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                status, payload = fake.dispatch(
+                    method, self.path, self.rfile.read(length)
+                )
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._respond("GET")
+
+            def do_POST(self) -> None:  # noqa: N802
+                self._respond("POST")
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        return Handler
+
+
+def _decode_signed(body: bytes) -> list[transaction.SignedTransaction]:
+    """Split a raw transaction submission, concatenated msgpack-encoded signed transactions, into transactions."""
+    unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+    unpacker.feed(body)
+    return [transaction.SignedTransaction.undictify(signed) for signed in unpacker]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run a fake algod for load testing without LocalNet."
+    )
+    parser.add_argument("--port", type=int, default=4001)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to every response"
+    )
+    parser.add_argument(
+        "--block-time",
+        type=float,
+        default=0.0,
+        help="seconds per block (0: confirm instantly)",
+    )
+    args = parser.parse_args()
+
+    fake = FakeAlgod(
+        latency=args.latency, block_time=args.block_time, port=args.port
+    ).start()
+    for name, value in fake.environ().items():
+        print(f'export {name}="{value}"')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,570 @@
+"""Opcode-budget profiler for the contracts in `smart_contracts/artifacts`.
+
+Deploys each app to the algod configured in the environment (LocalNet by default), simulates a
+call of each ABI method with execution tracing on, and maps every executed opcode back to its
+line in the contract source through the `*.puya.map` source maps the build writes next to the
+TEAL. Apps created through an ABI method are created with the arguments in `CREATE_ARGS`, and
+`SETUP_CALLS` are sent to each app before it is profiled, e.g. so there are pixels to paint:
+
+    poetry run python -m benchmarks.opcode_budget
+
+It logs a per-line cost report for each method and writes it to a JSON file in
+`benchmarks/results/`, with folded stacks for flame graphs (`flamegraph.pl` or speedscope) next
+to it. `--check` exits non-zero when a method's budget grew past the one stored in
+`benchmarks/baselines/opcode_budget.json`, as CI runs it; `--update-baseline` stores the budgets
+measured instead, for a change that is meant to cost more.
+"""
+
+import argparse
+import bisect
+import dataclasses
+import json
+import logging
+import sys
+from collections import Counter
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AppClient,
+    AppClientMethodCallParams,
+    AppFactoryCreateMethodCallParams,
+    Arc56Contract,
+    OnSchemaBreak,
+    OnUpdate,
+    PaymentParams,
+)
+from algosdk.v2client.models import SimulateTraceConfig
+
+from benchmarks._common import PROJECT_ROOT, RESULTS_DIR, git_commit
+from smart_contracts.hello_world.contract import (
+    COLOR_BYTES,
+    MAX_REGION_HEIGHT,
+    PRICE_PER_PIXEL,
+)
+
+logger = logging.getLogger(__name__)
+
+ARTIFACTS_DIR = PROJECT_ROOT / "smart_contracts" / "artifacts"
+BASELINE_PATH = Path(__file__).parent / "baselines" / "opcode_budget.json"
+
+# Enough for the deployer to pay for the setup calls below.
+DEPLOYER_FUNDING = AlgoAmount.from_algo(1_000)
+
+
+@dataclasses.dataclass(frozen=True)
+class PayApp:
+    """A `pay` argument: a payment of `micro_algo` from the caller to the app being called."""
+
+    micro_algo: int
+
+
+PIXEL_CANVAS_WIDTH = PIXEL_CANVAS_HEIGHT = 32
+# The first row of the region the setup buys. With 32 pixels a row, a band holds 10 rows, so
+# the region straddles the first two bands and painting it costs as much as a paint can.
+OWNED_ROW = 7
+BUY = "buy(uint64,uint64,uint64,uint64,pay)void"
+PAINT = "paint(uint64,uint64,uint64,uint64,byte[])void"
+LARGEST_REGION = (PIXEL_CANVAS_WIDTH, MAX_REGION_HEIGHT)
+LARGEST_REGION_PRICE = PIXEL_CANVAS_WIDTH * MAX_REGION_HEIGHT * PRICE_PER_PIXEL
+
+# Arguments for the ABI method each app that has no bare create is created with, by app name.
+# Apps without an entry are reported and skipped.
+CREATE_ARGS: dict[str, tuple[Any, ...]] = {
+    "PixelCanvas": (PIXEL_CANVAS_WIDTH, PIXEL_CANVAS_HEIGHT),
+}
+# Calls sent to each app once it is deployed, by app name: method signature and arguments.
+SETUP_CALLS: dict[str, list[tuple[str, tuple[Any, ...]]]] = {
+    "PixelCanvas": [
+        (BUY, (0, OWNED_ROW, *LARGEST_REGION, PayApp(LARGEST_REGION_PRICE))),
+    ],
+}
+# Arguments each ABI method is profiled with, by app name and method signature. Methods without
+# an entry are reported and skipped.
+PROFILE_CALLS: dict[str, dict[str, tuple[Any, ...]]] = {
+    "HelloWorld": {"hello(string)string": ("World",)},
+    # Regions as large as a call allows, as they cost the most.
+    "PixelCanvas": {
+        "create(uint64,uint64)void": (PIXEL_CANVAS_WIDTH, PIXEL_CANVAS_HEIGHT),
+        BUY: (0, 0, *LARGEST_REGION, PayApp(LARGEST_REGION_PRICE)),
+        PAINT: (
+            0,
+            OWNED_ROW,
+            *LARGEST_REGION,
+            bytes(PIXEL_CANVAS_WIDTH * MAX_REGION_HEIGHT * COLOR_BYTES),
+        ),
+    },
+}
+
+# Opcodes that cost more than 1 (AVM v11). Those whose cost depends on their input or curve are
+# listed at their lowest cost; the rest of what they used shows up as unattributed budget.
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "divmodw": 20,
+    "sqrt": 4,
+    "expw": 10,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+}
+
+_BASE64 = {
+    char: index
+    for index, char in enumerate(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    )
+}
+
+
+def _vlq_values(segment: str) -> list[int]:
+    """Decode one source map segment, a run of base64 VLQ numbers."""
+    values = []
+    value = shift = 0
+    for char in segment:
+        digit = _BASE64[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+        else:
+            values.append(-(value >> 1) if value & 1 else value >> 1)
+            value = shift = 0
+    return values
+
+
+@dataclasses.dataclass(frozen=True)
+class ProgramMap:
+    """The opcode, source line and subroutine at each program counter of a compiled program."""
+
+    sources: list[Path]
+    lines: dict[int, tuple[int, int]]  # pc -> (index into sources, 1-based line)
+    ops: dict[int, str]  # pc -> opcode, e.g. "extract_uint16"
+    subroutines: list[tuple[int, str]]  # (first pc, name), by pc
+
+    @classmethod
+    def load(cls, map_path: Path) -> "ProgramMap":
+        """Read a `*.puya.map`: a version 3 source map with one line per program counter."""
+        data = json.loads(map_path.read_text(encoding="utf-8"))
+        if data.get("version") != 3:
+            raise ValueError(
+                f"{map_path.name}: unsupported source map version {data.get('version')}"
+            )
+        lines = {}
+        source = line = 0
+        for pc, group in enumerate(
+            data["mappings"].split(";"), start=data.get("op_pc_offset", 0)
+        ):
+            for index, segment in enumerate(group.split(",") if group else ()):
+                values = _vlq_values(segment)
+                if len(values) >= 3:
+                    source += values[1]
+                    line += values[2]
+                    if index == 0:
+                        lines[pc] = (source, line + 1)
+        events = data.get("pc_events", {})
+        return cls(
+            sources=[
+                (map_path.parent / source_path).resolve()
+                for source_path in data["sources"]
+            ],
+            lines=lines,
+            ops={
+                int(pc): event["op"].split()[0]
+                for pc, event in events.items()
+                if "op" in event
+            },
+            subroutines=sorted(
+                (int(pc), event["subroutine"])
+                for pc, event in events.items()
+                if "subroutine" in event
+            ),
+        )
+
+    def subroutine_at(self, pc: int) -> str:
+        index = (
+            bisect.bisect_right(self.subroutines, pc, key=lambda start: start[0]) - 1
+        )
+        return self.subroutines[index][1] if index >= 0 else "?"
+
+
+@dataclasses.dataclass
+class LineCost:
+    source: str
+    line: int
+    code: str
+    ops: int = 0
+    cost: int = 0
+
+
+@dataclasses.dataclass
+class MethodProfile:
+    app: str
+    method: str
+    budget: int  # app-budget-consumed, as simulate reports it
+    lines: list[LineCost]
+    # Folded stacks for flame graphs, "app.method;subroutine;...;source:line" -> cost.
+    stacks: dict[str, int]
+
+    @property
+    def unattributed(self) -> int:
+        return self.budget - sum(line.cost for line in self.lines)
+
+
+def _source_label(path: Path) -> str:
+    return (
+        str(path.relative_to(PROJECT_ROOT))
+        if path.is_relative_to(PROJECT_ROOT)
+        else str(path)
+    )
+
+
+def profile_trace(
+    program: ProgramMap, pcs: Sequence[int], app: str, method: str, budget: int
+) -> MethodProfile:
+    """Attribute the cost of each executed opcode in `pcs` to its source line and call stack."""
+    line_costs: dict[tuple[int, int], LineCost] = {}
+    stacks: Counter[str] = Counter()
+    source_lines: dict[int, list[str]] = {}
+    callers: list[str] = []
+    for pc in pcs:
+        op = program.ops.get(pc, "?")
+        cost = OPCODE_COSTS.get(op, 1)
+        source, line = program.lines.get(pc, (0, 0))
+        if (source, line) not in line_costs:
+            if source not in source_lines:
+                path = program.sources[source]
+                source_lines[source] = (
+                    path.read_text(encoding="utf-8").splitlines()
+                    if path.exists()
+                    else []
+                )
+            code = (
+                source_lines[source][line - 1].strip()
+                if 0 < line <= len(source_lines[source])
+                else ""
+            )
+            line_costs[source, line] = LineCost(
+                _source_label(program.sources[source]), line, code
+            )
+        line_cost = line_costs[source, line]
+        line_cost.ops += 1
+        line_cost.cost += cost
+        subroutine = program.subroutine_at(pc)
+        frames = [
+            f"{app}.{method}",
+            *callers,
+            subroutine,
+            f"{Path(line_cost.source).name}:{line}",
+        ]
+        stacks[";".join(frames)] += cost
+        if op == "callsub":
+            callers.append(subroutine)
+        elif op == "retsub" and callers:
+            callers.pop()
+    lines = sorted(
+        line_costs.values(), key=lambda line_cost: (line_cost.source, line_cost.line)
+    )
+    return MethodProfile(app, method, budget, lines, dict(stacks))
+
+
+def format_profile(profile: MethodProfile) -> str:
+    rows = [f"{profile.app}.{profile.method}: {profile.budget} opcode budget"]
+    for line in profile.lines:
+        rows.append(
+            f"  {line.cost:6} {line.ops:6} ops  {line.source}:{line.line}  {line.code}"
+        )
+    if profile.unattributed:
+        rows.append(
+            f"  {profile.unattributed:6}             unattributed (input-dependent opcode costs)"
+        )
+    return "\n".join(rows)
+
+
+def call_args(app_client: AppClient, sender: str, args: Sequence[Any]) -> list[Any]:
+    """`args` with each `PayApp` replaced by the payment transaction it stands for."""
+    return [
+        (
+            app_client.algorand.create_transaction.payment(
+                PaymentParams(
+                    sender=sender,
+                    receiver=app_client.app_address,
+                    amount=AlgoAmount(micro_algo=arg.micro_algo),
+                )
+            )
+            if isinstance(arg, PayApp)
+            else arg
+        )
+        for arg in args
+    ]
+
+
+def is_create_only(app_spec: Arc56Contract, method: str) -> bool:
+    """Whether `method` can only be called to create the app."""
+    return any(
+        arc56_method.to_abi_method().get_signature() == method
+        and bool(arc56_method.actions.create)
+        and not arc56_method.actions.call
+        for arc56_method in app_spec.methods
+    )
+
+
+def simulate_trace(
+    app_client: AppClient, method: str, args: Sequence[Any], sender: str
+) -> tuple[list[int], dict[str, Any]]:
+    """Simulate one call of `method` from `sender` with execution tracing on.
+
+    A method that can only create the app is simulated creating another one. Returns the program
+    counters the approval program executed, in order, and the method call's transaction result
+    from the simulate response.
+    """
+    group = app_client.algorand.new_group()
+    if is_create_only(app_client.app_spec, method):
+        factory = app_client.algorand.client.get_app_factory(
+            app_spec=app_client.app_spec, default_sender=sender
+        )
+        group.add_app_create_method_call(
+            factory.params.create(
+                AppFactoryCreateMethodCallParams(method=method, args=list(args))
+            )
+        )
+    else:
+        group.add_app_call_method_call(
+            app_client.params.call(
+                AppClientMethodCallParams(
+                    method=method,
+                    args=call_args(app_client, sender, args),
+                    sender=sender,
+                )
+            )
+        )
+    result = group.simulate(
+        skip_signatures=True,
+        allow_unnamed_resources=True,
+        exec_trace_config=SimulateTraceConfig(enable=True),
+    )
+    # Transaction arguments go ahead of the method call in its group.
+    txn_result: dict[str, Any] = result.simulate_response["txn-groups"][0][
+        "txn-results"
+    ][-1]
+    trace = txn_result.get("exec-trace", {}).get("approval-program-trace", [])
+    return [step["pc"] for step in trace], txn_result
+
+
+def artifact_specs(
+    artifacts_dir: Path = ARTIFACTS_DIR,
+) -> list[tuple[Path, Arc56Contract]]:
+    return [
+        (path, Arc56Contract.from_json(path.read_text(encoding="utf-8")))
+        for path in sorted(artifacts_dir.glob("**/*.arc56.json"))
+    ]
+
+
+def deploy_app(
+    algorand: AlgorandClient, app_spec: Arc56Contract, deployer: str
+) -> AppClient | None:
+    """Deploy an app for simulating against and send its `SETUP_CALLS`.
+
+    An app without a bare create is created through its create method with its `CREATE_ARGS`;
+    None if it has none.
+    """
+    factory = algorand.client.get_app_factory(
+        app_spec=app_spec, default_sender=deployer
+    )
+    if "NoOp" in app_spec.bare_actions.create:
+        app_client, _ = factory.deploy(
+            on_update=OnUpdate.AppendApp, on_schema_break=OnSchemaBreak.AppendApp
+        )
+    elif app_spec.name in CREATE_ARGS:
+        create = next(
+            method.to_abi_method().get_signature()
+            for method in app_spec.methods
+            if "NoOp" in (method.actions.create or [])
+        )
+        app_client, _ = factory.send.create(
+            AppFactoryCreateMethodCallParams(
+                method=create, args=list(CREATE_ARGS[app_spec.name])
+            )
+        )
+    else:
+        logger.warning(
+            f"No arguments to create {app_spec.name} with, add them to CREATE_ARGS"
+        )
+        return None
+    for method, args in SETUP_CALLS.get(app_spec.name, []):
+        app_client.send.call(
+            AppClientMethodCallParams(
+                method=method, args=call_args(app_client, deployer, args)
+            )
+        )
+    return app_client
+
+
+def run(
+    algorand: AlgorandClient, deployer: str, artifacts_dir: Path = ARTIFACTS_DIR
+) -> list[MethodProfile]:
+    profiles = []
+    for spec_path, app_spec in artifact_specs(artifacts_dir):
+        app_client = deploy_app(algorand, app_spec, deployer)
+        if app_client is None:
+            continue
+        program = ProgramMap.load(
+            spec_path.with_name(f"{app_spec.name}.approval.puya.map")
+        )
+        calls = PROFILE_CALLS.get(app_spec.name, {})
+        for method in app_spec.methods:
+            signature = method.to_abi_method().get_signature()
+            if signature not in calls:
+                logger.warning(
+                    f"No arguments to profile {app_spec.name}.{signature} with, add them to PROFILE_CALLS"
+                )
+                continue
+            pcs, txn_result = simulate_trace(
+                app_client, signature, calls[signature], deployer
+            )
+            profile = profile_trace(
+                program,
+                pcs,
+                app_spec.name,
+                signature,
+                txn_result["app-budget-consumed"],
+            )
+            logger.info(format_profile(profile))
+            profiles.append(profile)
+    return profiles
+
+
+def budgets(profiles: Sequence[MethodProfile]) -> dict[str, dict[str, int]]:
+    by_app: dict[str, dict[str, int]] = {}
+    for profile in profiles:
+        by_app.setdefault(profile.app, {})[profile.method] = profile.budget
+    return by_app
+
+
+def check_baseline(
+    measured: dict[str, dict[str, int]],
+    baseline: dict[str, dict[str, int]],
+    tolerance: float = 0.0,
+) -> list[str]:
+    """Describe each method whose budget grew by more than `tolerance` (a fraction) over its baseline."""
+    regressions = []
+    for app, methods in sorted(measured.items()):
+        for method, budget in sorted(methods.items()):
+            expected = baseline.get(app, {}).get(method)
+            if expected is None:
+                logger.warning(
+                    f"{app}.{method} has no baseline budget, run with --update-baseline to add one"
+                )
+            elif budget > expected * (1 + tolerance):
+                regressions.append(
+                    f"{app}.{method} used {budget} opcode budget, up from {expected}"
+                )
+            elif budget < expected:
+                logger.info(
+                    f"{app}.{method} used {budget} opcode budget, down from {expected}"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Profile the opcode budget of each contract's ABI methods."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if a method's budget exceeds the baseline",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store the measured budgets as the baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.0,
+        help="fraction a budget may grow by before --check fails",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="JSON file to write (default: a timestamped file in results/)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    # The client factory lives with the contracts' deploy scripts, which import each other by bare name.
+    sys.path.insert(0, str(PROJECT_ROOT / "smart_contracts" / "hello_world"))
+    import client_factory
+
+    algorand = client_factory.get_algorand()
+    deployer = client_factory.get_account("DEPLOYER")
+    algorand.account.ensure_funded_from_environment(deployer.address, DEPLOYER_FUNDING)
+    profiles = run(algorand, deployer.address)
+
+    output = (
+        args.output
+        or RESULTS_DIR / f"opcode_budget-{datetime.now(UTC):%Y%m%dT%H%M%SZ}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "profiles": [
+            {**dataclasses.asdict(profile), "unattributed": profile.unattributed}
+            for profile in profiles
+        ],
+    }
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    folded = [
+        f"{stack} {cost}"
+        for profile in profiles
+        for stack, cost in profile.stacks.items()
+    ]
+    stacks_path = output.with_suffix(".folded")
+    stacks_path.write_text("\n".join(folded) + "\n", encoding="utf-8")
+    logger.info(
+        f"Wrote {len(profiles)} method profiles to {output} and flame graph stacks to {stacks_path}"
+    )
+
+    measured = budgets(profiles)
+    if args.update_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(
+            json.dumps(measured, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        logger.info(f"Stored the measured budgets as the baseline in {BASELINE_PATH}")
+    elif args.check:
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+        regressions = check_baseline(measured, baseline, args.tolerance)
+        for regression in regressions:
+            logger.error(f"❌ {regression}")
+        if regressions:
+            sys.exit(1)
+        logger.info(f"✅ {len(profiles)} method budgets within the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""Throughput benchmarks for pixel minting and settlement.
+
+Runs against the algod configured in the environment (LocalNet by default) and writes one JSON
+document per run with txns/sec, p50/p99 confirmation latency and fees for every operation, mode
+and grid size, so runs from different commits can be compared:
+
+    poetry run python -m benchmarks.pixel_throughput --sizes 5 10 25 50 100
+
+Pass `--fake-algod` to run against the in-process stand-in in `benchmarks.fake_algod` instead,
+e.g. to load-test the batching and pipelining logic on a machine without LocalNet.
+
+Every run mints into fresh, funded accounts, so runs never reuse each other's pixels.
+"""
+
+import argparse
+import dataclasses
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks._common import PROJECT_ROOT, RESULTS_DIR, git_commit
+
+# The pixel modules import each other by bare name.
+sys.path.insert(0, str(PROJECT_ROOT / "smart_contracts" / "hello_world"))
+
+import client_factory
+import numpy as np
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AlgorandClientTransactionSender,
+    SendAtomicTransactionComposerResults,
+    SigningAccount,
+    TransactionComposer,
+    TransactionComposerBuildResult,
+)
+from algosdk import transaction
+from instrumentation import TimedSigner
+from pixel_minting import (
+    MintedPixel,
+    Pixel,
+    mint_pixel_assets_batched,
+    mint_pixel_assets_pipelined,
+    mint_pixel_assets_sequential,
+    mint_pixel_assets_tracked,
+)
+from pixel_settlement import (
+    PIXELS_PER_GROUP,
+    PRICE_PER_PIXEL_ALGO,
+    preflight_opt_ins,
+    send_opt_ins,
+    settle_pixels,
+)
+
+from benchmarks.fake_algod import FakeAlgod
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = (5, 10, 25, 50, 100)
+MINT_MODES = ("sequential", "batched", "pipelined", "tracked")
+# Settlement always pays and transfers in atomic groups; "sequential" settles one pixel per group.
+SETTLE_MODES = ("sequential", "batched")
+
+# Minimum balance an account needs per ASA it creates or holds, plus headroom for fees.
+ASSET_MIN_BALANCE_ALGO = 0.1
+FEE_HEADROOM_ALGO = 0.01
+
+
+@dataclasses.dataclass
+class Submission:
+    """One `send` call: a single transaction or an atomic group, and how long it took to confirm."""
+
+    transactions: int
+    latency: float
+    fees: int
+
+
+class RecordingAlgorand:
+    """Wraps an AlgorandClient and records every transaction and group sent through it.
+
+    Minting and settlement send through `new_group().send()` and `send.*`, so timing those calls
+    measures submit-to-confirmation latency without touching the code under test. Groups that are
+    only built here and submitted elsewhere, as the tracked minter does, are timed from when they
+    were built until `record_minted` sees them confirmed.
+    """
+
+    def __init__(self, algorand: AlgorandClient) -> None:
+        self._algorand = algorand
+        self._lock = threading.Lock()
+        self.submissions: list[Submission] = []
+        self._built: dict[str, tuple[float, int]] = {}
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self._algorand, name)
+
+    def new_group(self) -> "_RecordingComposer":
+        return _RecordingComposer(self, self._algorand.new_group())
+
+    @property
+    def send(self) -> "_RecordingSender":
+        return _RecordingSender(self, self._algorand.send)
+
+    def record(self, latency: float, confirmations: list[dict[str, Any]]) -> None:
+        fees = sum(
+            int(confirmation["txn"]["txn"].get("fee", 0))
+            for confirmation in confirmations
+        )
+        with self._lock:
+            self.submissions.append(Submission(len(confirmations), latency, fees))
+
+    def record_built(self, transactions: list[transaction.Transaction]) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            self._built.update((txn.get_txid(), (now, txn.fee)) for txn in transactions)
+
+    def record_minted(self, minted: list[MintedPixel]) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            for pixel in minted:
+                if pixel.txid in self._built:
+                    built_at, fee = self._built.pop(pixel.txid)
+                    self.submissions.append(Submission(1, now - built_at, fee))
+
+
+class _RecordingComposer:
+    def __init__(
+        self, recorder: RecordingAlgorand, composer: TransactionComposer
+    ) -> None:
+        self._recorder = recorder
+        self._composer = composer
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        method = getattr(self._composer, name)
+        if not name.startswith("add_"):
+            return method
+
+        def add(*args: Any, **kwargs: Any) -> _RecordingComposer:
+            method(*args, **kwargs)
+            return self
+
+        return add
+
+    def build(self) -> TransactionComposerBuildResult:
+        result = self._composer.build()
+        self._recorder.record_built(
+            [txn_with_signer.txn for txn_with_signer in result.transactions]
+        )
+        return result
+
+    def send(self, *args: Any, **kwargs: Any) -> SendAtomicTransactionComposerResults:
+        started = time.perf_counter()
+        result = self._composer.send(*args, **kwargs)
+        self._recorder.record(time.perf_counter() - started, result.confirmations)
+        return result
+
+
+class _RecordingSender:
+    def __init__(
+        self, recorder: RecordingAlgorand, sender: AlgorandClientTransactionSender
+    ) -> None:
+        self._recorder = recorder
+        self._sender = sender
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        method = getattr(self._sender, name)
+
+        def send(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            started = time.perf_counter()
+            result = method(*args, **kwargs)
+            self._recorder.record(time.perf_counter() - started, [result.confirmation])
+            return result
+
+        return send
+
+
+def summarize(
+    operation: str,
+    mode: str,
+    rows: int,
+    cols: int,
+    elapsed: float,
+    submissions: list[Submission],
+) -> dict[str, Any]:
+    """One result row. Each transaction's latency is that of the `send` call it went out in."""
+    transactions = sum(submission.transactions for submission in submissions)
+    fees = sum(submission.fees for submission in submissions)
+    latencies = np.repeat(
+        [submission.latency for submission in submissions],
+        [submission.transactions for submission in submissions],
+    )
+    p50, p99 = (
+        np.percentile(latencies, [50, 99]).tolist() if latencies.size else (0.0, 0.0)
+    )
+    return {
+        "operation": operation,
+        "mode": mode,
+        "grid": f"{rows}x{cols}",
+        "pixels": rows * cols,
+        "transactions": transactions,
+        "submissions": len(submissions),
+        "elapsed_seconds": round(elapsed, 4),
+        "txns_per_second": round(transactions / elapsed, 2) if elapsed else 0.0,
+        "confirmation_latency_seconds": {"p50": round(p50, 4), "p99": round(p99, 4)},
+        "fees_microalgos": {
+            "total": fees,
+            "per_transaction": round(fees / transactions, 1) if transactions else 0.0,
+        },
+    }
+
+
+def _funded_account(algorand: AlgorandClient, algo: float) -> SigningAccount:
+    account = algorand.account.random()
+    algorand.account.set_signer(account.address, TimedSigner(account.signer))
+    algorand.account.ensure_funded_from_environment(
+        account, AlgoAmount(micro_algo=round(algo * 1_000_000))
+    )
+    return account
+
+
+def _pixels(rows: int, cols: int) -> list[Pixel]:
+    return [(row, col) for row in range(rows) for col in range(cols)]
+
+
+def benchmark_mint(
+    algorand: AlgorandClient, mode: str, rows: int, cols: int
+) -> dict[str, Any]:
+    pixels = _pixels(rows, cols)
+    creator = _funded_account(
+        algorand, len(pixels) * (ASSET_MIN_BALANCE_ALGO + FEE_HEADROOM_ALGO) + 1
+    )
+    recorder = RecordingAlgorand(algorand)
+    mint = {
+        "sequential": mint_pixel_assets_sequential,
+        "batched": mint_pixel_assets_batched,
+        "pipelined": lambda *args: mint_pixel_assets_pipelined(*args)[0],
+        "tracked": lambda *args: mint_pixel_assets_tracked(
+            *args, on_minted=recorder.record_minted
+        )[0],
+    }[mode]
+
+    started = time.perf_counter()
+    mint(recorder, creator.address, pixels)
+    return summarize(
+        "mint", mode, rows, cols, time.perf_counter() - started, recorder.submissions
+    )
+
+
+def benchmark_settle(
+    algorand: AlgorandClient, mode: str, rows: int, cols: int
+) -> dict[str, Any]:
+    # Setup is untimed: mint the pixels and opt the receiver in to all of them.
+    pixels = _pixels(rows, cols)
+    per_pixel = ASSET_MIN_BALANCE_ALGO + FEE_HEADROOM_ALGO
+    creator = _funded_account(
+        algorand, len(pixels) * (per_pixel + PRICE_PER_PIXEL_ALGO) + 1
+    )
+    receiver = _funded_account(algorand, len(pixels) * per_pixel + 1)
+    pixel_assets, _ = mint_pixel_assets_pipelined(algorand, creator.address, pixels)
+    send_opt_ins(
+        algorand,
+        preflight_opt_ins(algorand, receiver.address, pixel_assets.values()),
+        receiver.signer,
+    )
+
+    recorder = RecordingAlgorand(algorand)
+    started = time.perf_counter()
+    summary = settle_pixels(
+        recorder,  # type: ignore[arg-type]
+        creator.address,
+        receiver.address,
+        pixels,
+        pixel_assets,
+        pixels_per_group=1 if mode == "sequential" else PIXELS_PER_GROUP,
+    )
+    elapsed = time.perf_counter() - started
+    if summary.failed:
+        raise RuntimeError(
+            f"Settlement benchmark failed for {len(summary.failed)} pixels: {summary}"
+        )
+    return summarize("settle", mode, rows, cols, elapsed, recorder.submissions)
+
+
+def run(
+    algorand: AlgorandClient,
+    sizes: list[int],
+    operations: list[str],
+    mint_modes: list[str],
+    settle_modes: list[str],
+) -> dict[str, Any]:
+    network = algorand.client.network()
+    results = []
+    for size in sizes:
+        for operation, modes, benchmark in (
+            ("mint", mint_modes, benchmark_mint),
+            ("settle", settle_modes, benchmark_settle),
+        ):
+            if operation not in operations:
+                continue
+            for mode in modes:
+                logger.info(
+                    f"Benchmarking {operation} ({mode}) on a {size}x{size} grid"
+                )
+                result = benchmark(algorand, mode, size, size)
+                logger.info(
+                    f"✅ {operation} {mode} {result['grid']}: {result['txns_per_second']} txns/sec, "
+                    f"p50 {result['confirmation_latency_seconds']['p50']}s, "
+                    f"p99 {result['confirmation_latency_seconds']['p99']}s"
+                )
+                results.append(result)
+    return {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "network": {"genesis_id": network.genesis_id, "localnet": network.is_localnet},
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark pixel minting and settlement throughput."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="grid side lengths (N for an NxN grid)",
+    )
+    parser.add_argument(
+        "--operations",
+        nargs="+",
+        choices=("mint", "settle"),
+        default=["mint", "settle"],
+    )
+    parser.add_argument(
+        "--mint-modes", nargs="+", choices=MINT_MODES, default=list(MINT_MODES)
+    )
+    parser.add_argument(
+        "--settle-modes", nargs="+", choices=SETTLE_MODES, default=list(SETTLE_MODES)
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="JSON file to write (default: a timestamped file in results/)",
+    )
+    parser.add_argument(
+        "--fake-algod", action="store_true", help="run against an in-process fake algod"
+    )
+    parser.add_argument(
+        "--fake-latency",
+        type=float,
+        default=0.0,
+        help="fake algod response latency in seconds",
+    )
+    parser.add_argument(
+        "--fake-block-time",
+        type=float,
+        default=0.0,
+        help="fake algod block time in seconds",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    fake = None
+    if args.fake_algod:
+        fake = FakeAlgod(
+            latency=args.fake_latency, block_time=args.fake_block_time
+        ).start()
+        os.environ.update(fake.environ())
+        client_factory.reset()
+        logger.info(f"Started fake algod at {fake.url}")
+    try:
+        report = run(
+            client_factory.get_algorand(),
+            args.sizes,
+            args.operations,
+            args.mint_modes,
+            args.settle_modes,
+        )
+    finally:
+        if fake:
+            fake.stop()
+    report["backend"] = (
+        {
+            "fake_algod": {
+                "latency": args.fake_latency,
+                "block_time": args.fake_block_time,
+            }
+        }
+        if fake
+        else "algod"
+    )
+
+    output = (
+        args.output
+        or RESULTS_DIR / f"pixel_throughput-{datetime.now(UTC):%Y%m%dT%H%M%SZ}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    logger.info(f"Wrote {len(report['results'])} results to {output}")
+
+
+if __name__ == "__main__":
+    main()
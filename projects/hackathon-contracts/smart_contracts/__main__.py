@@ -1,19 +1,33 @@
-import dataclasses
-import importlib
-import logging
-import subprocess
-import sys
-from collections.abc import Callable
-from pathlib import Path
-from shutil import rmtree
-
-from algokit_utils.config import config
-from dotenv import load_dotenv
-
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
+from smart_contracts._helpers.startup_profile import StartupProfile
+
+profile = StartupProfile()
+
+with profile.phase("smart_contracts.__main__"):
+    import argparse
+    import dataclasses
+    import functools
+    import importlib
+    import logging
+    import os
+    import subprocess
+    import sys
+    import tempfile
+    import time
+    from collections.abc import Callable
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from pathlib import Path
+    from shutil import rmtree
+
+    from dotenv import load_dotenv
+
+    from smart_contracts._helpers.build_cache import (
+        compute_manifest,
+        is_up_to_date,
+        write_manifest,
+    )
+    from smart_contracts._helpers.client_batches import add_batch_calls
+    from smart_contracts._helpers.client_codecs import add_method_codecs
+    from smart_contracts._helpers.client_spec_cache import add_lazy_app_spec
 
 # Set up logging and load environment variables.
 logging.basicConfig(
@@ -29,11 +43,32 @@ root_path = Path(__file__).parent
 # ----------------------- Contract Configuration ----------------------- #
 
 
+@functools.cache  # type: ignore[misc]
+def configure_algokit() -> None:
+    """Configures algokit_utils before the first deploy. Builds never import it."""
+    with profile.phase("algokit_utils"):
+        from algokit_utils.config import config
+
+    # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(debug=True, trace_all=False)
+
+
 @dataclasses.dataclass
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+    has_deploy_config: bool = False
+
+    @functools.cached_property
+    def deploy(self) -> Callable[[], None] | None:
+        """The folder's deploy hook, imported on first use so builds never load deploy dependencies."""
+        if not self.has_deploy_config:
+            return None
+        configure_algokit()
+        with profile.phase(f"{self.name}.deploy_config"):
+            return import_deploy_if_exists(self.path.parent)
 
 
 def import_contract(folder: Path) -> Path:
@@ -47,11 +82,15 @@ def import_contract(folder: Path) -> Path:
 
 def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
     """Imports the deploy function from a folder if it exists."""
+    # Contract folders import their sibling modules by bare name.
+    if str(folder) not in sys.path:
+        sys.path.insert(0, str(folder))
     try:
         module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
         deploy_module = importlib.import_module(module_name)
         return deploy_module.deploy  # type: ignore[no-any-return, misc]
     except ImportError:
+        logger.exception(f"Could not import deploy_config for {folder.name}")
         return None
 
 
@@ -60,17 +99,25 @@ def has_contract_file(directory: Path) -> bool:
     return (directory / "contract.py").exists()
 
 
-# Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
-contracts: list[SmartContract] = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
-    )
-    for folder in root_path.iterdir()
-    if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
-]
+def discover_contracts(base: Path) -> list[SmartContract]:
+    """
+    Finds contract folders with a directory scan only; nothing in them is imported.
+    Folders that start with '_' (internal helpers) are excluded.
+    """
+    return [
+        SmartContract(
+            path=import_contract(folder),
+            name=folder.name,
+            has_deploy_config=(folder / "deploy_config.py").exists(),
+        )
+        for folder in sorted(base.iterdir())
+        if folder.is_dir()
+        and has_contract_file(folder)
+        and not folder.name.startswith("_")
+    ]
+
+
+contracts: list[SmartContract] = discover_contracts(root_path)
 
 # -------------------------- Build Logic -------------------------- #
 
@@ -86,18 +133,77 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+def _build_result_path(output_dir: Path) -> Path:
+    app_spec_file = next(iter(sorted(output_dir.glob("*.arc56.json"))), None)
+    return app_spec_file or output_dir
+
+
+def _replace_dir(target: Path, new: Path) -> None:
+    """Swap `new` into place at `target`, so `target` is never left half-written."""
+    if target.exists():
+        old = target.with_name(f".{target.name}.old")
+        if old.exists():
+            rmtree(old)
+        target.rename(old)
+        new.rename(target)
+        rmtree(old)
+    else:
+        new.rename(target)
+
+
+def _run(command: list[str], prefix: str) -> subprocess.CompletedProcess[str]:
+    """Runs `command`, streaming each line of its output to the log prefixed with `prefix`."""
+    output: list[str] = []
+    with subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            output.append(line)
+            logger.info(f"[{prefix}] {line.rstrip()}")
+    return subprocess.CompletedProcess(command, process.returncode, "".join(output))
+
+
+def build(output_dir: Path, contract_path: Path, *, force: bool = False) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    The build is skipped when the contract's sources, the modules it imports and the
+    compiler versions all match the build manifest in the output directory. Otherwise
+    the artifacts are built in a temporary directory that then replaces the output
+    directory.
     """
     output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
+    manifest = compute_manifest(contract_path, root_path, deployment_extension)
+    if not force and is_up_to_date(output_dir, manifest):
+        logger.info(f"{contract_path} is up to date, skipping build")
+        return _build_result_path(output_dir)
+
+    output_dir.parent.mkdir(exist_ok=True, parents=True)
+    # Build next to the final location so relative source map paths are unchanged.
+    staging_dir = Path(
+        tempfile.mkdtemp(prefix=f".{output_dir.name}-", dir=output_dir.parent)
+    )
+    try:
+        _compile_and_generate(staging_dir, contract_path)
+        write_manifest(staging_dir, manifest)
+        _replace_dir(output_dir, staging_dir)
+    finally:
+        if staging_dir.exists():
+            rmtree(staging_dir)
+    return _build_result_path(output_dir)
+
+
+def _compile_and_generate(output_dir: Path, contract_path: Path) -> None:
+    """
+    Compiles the contract into `output_dir` and generates a client for each app spec.
+    Python clients then get prebuilt per-method ABI codecs, bulk `<method>_many` calls and
+    parse their app spec lazily, see `_helpers/client_codecs.py`, `_helpers/client_batches.py`
+    and `_helpers/client_spec_cache.py`.
+    """
     logger.info(f"Exporting {contract_path} to {output_dir}")
+    prefix = contract_path.parent.name
 
-    build_result = subprocess.run(
+    build_result = _run(
         [
             "algokit",
             "--no-color",
@@ -109,9 +215,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "--output-arc56",
             "--output-source-map",
         ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
+        prefix,
     )
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
@@ -121,16 +225,14 @@ def build(output_dir: Path, contract_path: Path) -> Path:
         file.name for file in output_dir.glob("*.arc56.json")
     ]
 
-    client_file: str | None = None
     if not app_spec_file_names:
         logger.warning(
             "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
         )
     else:
         for file_name in app_spec_file_names:
-            client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
+            logger.info(f"[{prefix}] Generating client for {file_name}")
+            generate_result = _run(
                 [
                     "algokit",
                     "generate",
@@ -139,9 +241,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     "--output",
                     str(_get_output_path(output_dir, deployment_extension)),
                 ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
+                prefix,
             )
             if generate_result.returncode:
                 if "No such command" in generate_result.stdout:
@@ -152,15 +252,103 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
-    if client_file:
-        return output_dir / client_file
-    return output_dir
+        if deployment_extension == "py":
+            for client_path in output_dir.glob("*_client.py"):
+                rewritten = add_method_codecs(client_path)
+                logger.info(
+                    f"[{prefix}] Added prebuilt ABI codecs to {client_path.name} ({rewritten} call sites)"
+                )
+                add_batch_calls(client_path)
+                # Runs last, as it also rewrites the codecs' references to APP_SPEC.
+                add_lazy_app_spec(client_path)
+
+
+@dataclasses.dataclass
+class StageTimings:
+    build: dict[str, float] = dataclasses.field(default_factory=dict)
+    deploy: dict[str, float] = dataclasses.field(default_factory=dict)
+
+    def report(self, wall_clock: float) -> None:
+        for stage, timings in (("build", self.build), ("deploy", self.deploy)):
+            for name, seconds in timings.items():
+                logger.info(f"  {stage:<6} {name:<30} {seconds:8.2f}s")
+            if timings:
+                logger.info(f"  {stage:<6} {'total':<30} {sum(timings.values()):8.2f}s")
+        logger.info(f"  {'wall clock':<37} {wall_clock:8.2f}s")
+
+
+def _timed_build(
+    output_dir: Path, contract_path: Path, *, force: bool
+) -> tuple[Path, float]:
+    started = time.perf_counter()
+    result = build(output_dir, contract_path, force=force)
+    return result, time.perf_counter() - started
+
+
+def build_all(
+    to_build: list[SmartContract],
+    artifact_path: Path,
+    *,
+    jobs: int,
+    force: bool = False,
+    on_built: Callable[[SmartContract], None] | None = None,
+) -> StageTimings:
+    """
+    Builds independent contracts concurrently, up to `jobs` at a time. Each build spends
+    its time in compiler subprocesses, so a thread per build is enough to keep `jobs`
+    compilers running. After the first failure no further builds are started; builds
+    already running finish and all failures are reported together.
+
+    `on_built` runs on the calling thread as soon as each contract's artifacts are ready,
+    while the remaining contracts keep compiling. An error raised from it stops the
+    pipeline immediately.
+    """
+    timings = StageTimings()
+    errors: dict[str, Exception] = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {
+            executor.submit(
+                _timed_build, artifact_path / contract.name, contract.path, force=force
+            ): contract
+            for contract in to_build
+        }
+        for future in as_completed(futures):
+            contract = futures[future]
+            try:
+                _, timings.build[contract.name] = future.result()
+                logger.info(f"Built app {contract.name}")
+            except Exception as e:
+                logger.error(f"Failed to build {contract.name}")
+                errors[contract.name] = e
+                for pending in futures:
+                    pending.cancel()
+                continue
+            if on_built:
+                started = time.perf_counter()
+                try:
+                    on_built(contract)
+                except BaseException:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                timings.deploy[contract.name] = time.perf_counter() - started
+    if errors:
+        details = "\n\n".join(f"[{name}] {error}" for name, error in errors.items())
+        raise Exception(f"Could not build {len(errors)} contract(s):\n{details}")
+    return timings
 
 
 # --------------------------- Main Logic --------------------------- #
 
 
-def main(action: str, contract_name: str | None = None) -> None:
+def main(
+    action: str,
+    contract_name: str | None = None,
+    *,
+    force: bool = False,
+    jobs: int | None = None,
+    profile_startup: bool = False,
+) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
     # Filter contracts based on an optional specific contract name.
@@ -169,12 +357,16 @@ def main(action: str, contract_name: str | None = None) -> None:
         for contract in contracts
         if contract_name is None or contract.name == contract_name
     ]
+    jobs = jobs or os.cpu_count() or 1
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            started = time.perf_counter()
+            timings = build_all(
+                filtered_contracts, artifact_path, jobs=jobs, force=force
+            )
+            logger.info("Build timings:")
+            timings.report(time.perf_counter() - started)
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -192,20 +384,67 @@ def main(action: str, contract_name: str | None = None) -> None:
                     logger.info(f"Deploying app {contract.name}")
                     contract.deploy()
         case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            # Two-stage pipeline: each contract is deployed as soon as its artifacts are
+            # ready, while the next contracts are still compiling.
+            def deploy_built(contract: SmartContract) -> None:
                 if contract.deploy:
                     logger.info(f"Deploying {contract.name}")
                     contract.deploy()
+
+            started = time.perf_counter()
+            timings = build_all(
+                filtered_contracts,
+                artifact_path,
+                jobs=jobs,
+                force=force,
+                on_built=deploy_built,
+            )
+            logger.info("Build and deploy timings:")
+            timings.report(time.perf_counter() - started)
         case _:
             logger.error(f"Unknown action: {action}")
+    if profile_startup:
+        print(profile.report())
+
+
+class _Args(argparse.Namespace):
+    action: str
+    contract_name: str | None
+    force: bool
+    jobs: int | None
+    profile_startup: bool
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    parser = argparse.ArgumentParser(description="Build and/or deploy smart contracts.")
+    parser.add_argument(
+        "action", nargs="?", default="all", help="build, deploy or all (default)"
+    )
+    parser.add_argument(
+        "contract_name", nargs="?", help="only build/deploy this contract folder"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild even if the build manifest says nothing changed",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="number of contracts to build in parallel (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print how long the CLI and each deploy hook took to import",
+    )
+    args = parser.parse_args(namespace=_Args())
+    main(
+        args.action,
+        args.contract_name,
+        force=args.force,
+        jobs=args.jobs,
+        profile_startup=args.profile_startup,
+    )
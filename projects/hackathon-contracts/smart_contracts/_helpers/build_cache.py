@@ -0,0 +1,139 @@
+import ast
+import hashlib
+import importlib.metadata
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = ".build_manifest.json"
+
+# Packages whose version changes the compiled output or the generated client.
+TOOL_PACKAGES = ("puyapy", "algorand-python", "algokit-client-generator")
+# Project modules that rewrite the generated client, so a change to them must rebuild it too.
+CLIENT_POSTPROCESSORS = (
+    Path(__file__).with_name("client_batches.py"),
+    Path(__file__).with_name("client_codecs.py"),
+    Path(__file__).with_name("client_spec_cache.py"),
+)
+
+
+def _tool_versions() -> dict[str, str]:
+    versions = {}
+    for package in TOOL_PACKAGES:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = "not installed"
+    return versions
+
+
+def _resolve_local_import(
+    module: str, level: int, importer: Path, root: Path
+) -> Path | None:
+    """Map an import inside a contract to a source file in the project, or None for third-party modules."""
+    if level:
+        base = importer.parent
+        for _ in range(level - 1):
+            base = base.parent
+        candidates = [base / Path(*module.split(".")) if module else base]
+    else:
+        parts = module.split(".")
+        candidates = [
+            root.parent / Path(*parts),  # smart_contracts.<...>
+            importer.parent / Path(*parts),  # sibling module imported by bare name
+        ]
+    for candidate in candidates:
+        for path in (candidate.with_suffix(".py"), candidate / "__init__.py"):
+            if path.is_file() and path.resolve().is_relative_to(root.resolve()):
+                return path
+    return None
+
+
+def contract_sources(contract_path: Path, root: Path) -> list[Path]:
+    """The contract file plus every project module it imports, transitively."""
+    seen: dict[Path, None] = {}
+    pending = [contract_path]
+    while pending:
+        path = pending.pop()
+        if path.resolve() in seen:
+            continue
+        seen[path.resolve()] = None
+        for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+            if isinstance(node, ast.Import):
+                modules = [(alias.name, 0) for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                # `from pkg import name` may name a submodule rather than an attribute.
+                modules = [(base, node.level)] + [
+                    (f"{base}.{alias.name}" if base else alias.name, node.level)
+                    for alias in node.names
+                ]
+            else:
+                continue
+            for module, level in modules:
+                resolved = _resolve_local_import(module, level, path, root)
+                if resolved is not None:
+                    pending.append(resolved)
+    return sorted(seen)
+
+
+def compute_manifest(
+    contract_path: Path, root: Path, deployment_extension: str
+) -> dict[str, object]:
+    """Describe every input of a contract build: source hashes and tool versions."""
+    inputs = {
+        path.relative_to(root.resolve())
+        .as_posix(): hashlib.sha256(path.read_bytes())
+        .hexdigest()
+        for path in contract_sources(contract_path, root)
+    }
+    manifest: dict[str, object] = {
+        "inputs": inputs,
+        "tools": _tool_versions(),
+        "postprocessors": {
+            path.name: hashlib.sha256(path.read_bytes()).hexdigest()
+            for path in CLIENT_POSTPROCESSORS
+        },
+        "deployment_extension": deployment_extension,
+    }
+    manifest["digest"] = hashlib.sha256(
+        json.dumps(manifest, sort_keys=True).encode()
+    ).hexdigest()
+    return manifest
+
+
+def is_up_to_date(output_dir: Path, manifest: dict[str, object]) -> bool:
+    """Whether `output_dir` holds artifacts built from exactly the inputs in `manifest`."""
+    manifest_path = output_dir / MANIFEST_FILE_NAME
+    if not manifest_path.is_file():
+        return False
+    try:
+        previous: dict[str, object] = json.loads(
+            manifest_path.read_text(encoding="utf-8")
+        )
+    except json.JSONDecodeError:
+        return False
+    if previous.get("digest") != manifest["digest"]:
+        return False
+    outputs = previous.get("outputs")
+    return (
+        isinstance(outputs, list)
+        and bool(outputs)
+        and all(
+            isinstance(name, str) and (output_dir / name).is_file() for name in outputs
+        )
+    )
+
+
+def write_manifest(output_dir: Path, manifest: dict[str, object]) -> None:
+    outputs = sorted(
+        path.name
+        for path in output_dir.iterdir()
+        if path.is_file() and path.name != MANIFEST_FILE_NAME
+    )
+    stored: dict[str, object] = {**manifest, "outputs": outputs}
+    (output_dir / MANIFEST_FILE_NAME).write_text(
+        json.dumps(stored, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
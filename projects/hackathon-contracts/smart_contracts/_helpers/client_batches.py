@@ -0,0 +1,189 @@
+"""Bulk calls for generated typed clients.
+
+A generated client sends one ABI call per `send.<method>()`, and its composer leaves the caller
+to chain calls by hand and stay under the 16-transaction group limit. `add_batch_calls` rewrites
+a client that already has prebuilt codecs (see `client_codecs.py`) so that its `send` accessor
+also gets `<method>_many(calls, ...)` for each ABI method that a plain call sends as a single
+transaction. It packs the calls into full groups, optionally simulates each group before sending
+it, keeps several groups in flight and yields the decoded returns in call order.
+
+Read-only methods, which algokit answers by simulating, and methods with transaction arguments,
+which take more than one transaction per call, are left without one.
+"""
+
+import ast
+import re
+from pathlib import Path
+
+MARKER = "# Batched calls, added by smart_contracts/_helpers/client_batches.py."
+
+_IMPORTS = "import collections\n"
+_TRANSACTION_TYPES = {"txn", "pay", "keyreg", "acfg", "axfer", "afrz", "appl"}
+_SEND_SITE = re.compile(r'_CODECS\["(?P<signature>[^"]+)"\]\.send\(self\.app_client, ')
+
+_RUNTIME = '''
+_MAX_GROUP_SIZE = 16
+
+
+def _send_many(
+    codec: _MethodCodec,
+    app_client: algokit_utils.AppClient,
+    calls: typing.Iterable[object],
+    params: algokit_utils.CommonAppCallParams | None,
+    send_params: algokit_utils.SendParams | None,
+    simulate: bool,
+    max_in_flight: int,
+) -> typing.Iterator[object]:
+    """Send one call per item of `calls` in full groups, yielding the decoded returns in call order.
+
+    Groups are sent as the returned iterator is consumed, at most `max_in_flight` ahead of it. If
+    a group fails to simulate or send, the groups not yet sent are abandoned and the error is
+    raised; groups already sent are not rolled back.
+    """
+    import concurrent.futures  # Imported here, to keep it off the client's import time.
+
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+    # Repeats of a call would be the same transaction, so each repeat gets a distinct note.
+    repeats: collections.Counter[str] = collections.Counter()
+
+    def method_call(args: object) -> algokit_utils.AppCallMethodCallParams:
+        call = codec.call_params(app_client, args, params)
+        key = repr((call.args, call.note))
+        repeat = repeats[key]
+        repeats[key] += 1
+        if repeat:
+            note = call.note.encode() if isinstance(call.note, str) else call.note or b""
+            call = dataclasses.replace(call, note=note + f"#{repeat}".encode())
+        return call
+
+    def send_group(group: list[algokit_utils.AppCallMethodCallParams]) -> list[object]:
+        composer = app_client.algorand.new_group()
+        for call in group:
+            composer.add_app_call_method_call(call)
+        if simulate:
+            # Raises if any call in the group fails or runs out of opcode budget.
+            composer.simulate(skip_signatures=True)
+        result = composer.send(send_params)
+        return [codec.decode(abi_return) for abi_return in result.returns]
+
+    pending = iter(calls)
+    in_flight: collections.deque[concurrent.futures.Future[list[object]]] = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="batch-call") as executor:
+        try:
+            while group := [method_call(args) for _, args in zip(range(_MAX_GROUP_SIZE), pending)]:
+                if len(in_flight) >= max_in_flight:
+                    yield from in_flight.popleft().result()
+                in_flight.append(executor.submit(send_group, group))
+            while in_flight:
+                yield from in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+'''
+
+_MANY = '''
+    def {name}_many(
+        self,
+        calls: typing.Iterable[{args}],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        simulate: bool = False,
+        max_in_flight: int = 4,
+    ) -> typing.Iterator[{returns}]:
+        """Send a `{name}` call for each item of `calls` in full groups, yielding the returns in order.
+
+        Calls are sent as the iterator is consumed, up to `max_in_flight` groups at a time. With
+        `simulate`, each group is simulated first and nothing more is sent if one fails.
+        """
+        return typing.cast(typing.Iterator[{returns}], _send_many(
+            _CODECS["{signature}"], self.app_client, calls, params, send_params, simulate, max_in_flight
+        ))
+'''
+
+
+def _batchable(tree: ast.Module) -> set[str]:
+    """Signatures of the methods whose codec sends a plain call directly, as one transaction."""
+    signatures = set()
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "_MethodCodec"
+        ):
+            continue
+        signature: str = ast.literal_eval(node.args[0])
+        # The codec's flags that are set to True, e.g. `direct=True`.
+        flags = {
+            keyword.arg
+            for keyword in node.keywords
+            if isinstance(keyword.value, ast.Constant) and keyword.value.value is True
+        }
+        arg_types = set(re.split(r"[(),\[\]]", signature[signature.index("(") :]))
+        if (
+            "direct" in flags
+            and "readonly" not in flags
+            and not arg_types & _TRANSACTION_TYPES
+        ):
+            signatures.add(signature)
+    return signatures
+
+
+def _many_methods(source: str) -> list[tuple[int, str]]:
+    """The `_many` methods to add, each with the source line it goes after."""
+    tree = ast.parse(source)
+    batchable = _batchable(tree)
+    lines = source.splitlines(keepends=True)
+    methods = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        existing = {
+            item.name for item in node.body if isinstance(item, ast.FunctionDef)
+        }
+        for item in node.body:
+            if not isinstance(item, ast.FunctionDef) or f"{item.name}_many" in existing:
+                continue
+            match = _SEND_SITE.search("".join(lines[item.lineno - 1 : item.end_lineno]))
+            args = next(
+                (arg.annotation for arg in item.args.args if arg.arg == "args"), None
+            )
+            if not match or match["signature"] not in batchable or args is None:
+                continue
+            returns = (
+                item.returns.slice if isinstance(item.returns, ast.Subscript) else None
+            )
+            method = _MANY.format(
+                name=item.name,
+                args=ast.unparse(args),
+                returns=ast.unparse(returns) if returns else "object",
+                signature=match["signature"],
+            )
+            methods.append((item.end_lineno or item.lineno, method))
+    return methods
+
+
+def add_batch_calls(client_path: Path) -> int:
+    """Rewrite a generated Python client with codecs to add `<method>_many` bulk calls.
+
+    Returns the number of methods added. Safe to run again, including after `add_method_codecs`
+    has re-rendered the codecs, which drops the batching runtime that follows them.
+    """
+    source = client_path.read_text(encoding="utf-8")
+    if MARKER in source:
+        source = source[: source.index(MARKER)].rstrip() + "\n"
+    methods = _many_methods(source)
+    lines = source.splitlines(keepends=True)
+    for after, method in sorted(methods, reverse=True):
+        lines.insert(after, method)
+    source = "".join(lines)
+    if _IMPORTS not in source:
+        source = source.replace(
+            "import dataclasses\n", _IMPORTS + "import dataclasses\n", 1
+        )
+    client_path.write_text(
+        f"{source.rstrip()}\n\n\n{MARKER}\n{_RUNTIME.rstrip()}\n", encoding="utf-8"
+    )
+    return len(methods)
@@ -0,0 +1,352 @@
+"""Prebuilt per-method ABI codecs for generated typed clients.
+
+A generated client resolves every call by method signature through algokit's AppClient, which
+re-reads the ARC-56 method description from the app spec and deep-copies the call parameters
+each time, and converts arguments by dataclass reflection. For a `hello`-style call that is most
+of the CPU spent outside signing.
+
+`add_method_codecs` rewrites a freshly generated client so that each ABI method call goes
+through a `_MethodCodec` built once at import: it holds the algosdk Method and its argument
+types, the method's args dataclass and the struct its return decodes to. Calls then
+build `AppCallMethodCallParams` directly. Methods with default argument values, whose defaults
+algokit resolves from chain state, and read-only methods, which algokit simulates, keep the
+algokit path.
+"""
+
+import ast
+import json
+import logging
+import re
+from pathlib import Path
+from typing import NotRequired, TypedDict
+
+logger = logging.getLogger(__name__)
+
+MARKER = "# Prebuilt ABI codecs, added by smart_contracts/_helpers/client_codecs.py."
+
+# The generated call sites for a method, e.g.
+#     method_args = _parse_abi_args(args)
+#     params = params or algokit_utils.CommonAppCallParams()
+#     response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+#         **dataclasses.asdict(params),
+#         "method": "hello(string)string",
+#         "args": method_args,
+#     }), send_params=send_params)
+_CALL_SITE = re.compile(
+    r"method_args = _parse_abi_args\(args\)\s*\n"
+    r"(?P<indent>[ \t]*)params = params or algokit_utils\.CommonAppCallParams\(\)\s*\n"
+    r"[ \t]*(?P<lhs>return|response =) self\.app_client\.(?P<accessor>params|create_transaction|send)\.call\("
+    r"algokit_utils\.AppClientMethodCallParams\(\*\*\{\s*"
+    r"\*\*dataclasses\.asdict\(params\),\s*"
+    r'"method": "(?P<signature>[^"]+)",\s*'
+    r'"args": method_args,\s*'
+    r"\}\)(?P<send_params>, send_params=send_params)?\)"
+)
+_CODEC_METHODS = {
+    "params": "call_params",
+    "create_transaction": "create_transaction",
+    "send": "send",
+}
+
+_DECODE_SITE = re.compile(
+    r"(?P<indent>[ \t]*)arc56_method = self\.app_spec\.get_arc56_method\(method\)\n"
+)
+
+_RUNTIME = '''
+_METHOD_CALL_FIELDS = tuple(
+    field.name
+    for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+    if field.name not in ("method", "args")
+)
+
+
+def _to_abi_tuple(value: object) -> object:
+    if dataclasses.is_dataclass(value):
+        return tuple(_to_abi_tuple(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_to_abi_tuple(item) for item in value)
+    return value
+
+
+class _MethodCodec:
+    """Encodes one ABI method's arguments and decodes its return, prebuilt from the app spec."""
+
+    def __init__(
+        self,
+        signature: str,
+        *,
+        args_class: type | None,
+        arg_structs: dict[int, str],
+        returns_struct: str | None,
+        returns_class: type | None,
+        direct: bool,
+        readonly: bool,
+    ) -> None:
+        self.signature = signature
+        self.method = algosdk.abi.Method.from_signature(signature)
+        self.arg_types = [arg.type for arg in self.method.args]
+        self.returns_type = self.method.returns.type
+        self.args_class = args_class
+        self.arg_fields = tuple(field.name for field in dataclasses.fields(args_class)) if args_class else ()
+        # Only arguments of tuple types can hold dataclasses that need converting.
+        self.tuple_args = tuple(
+            index for index, arg in enumerate(self.method.args) if "(" in str(arg.type)
+        )
+        self.arg_structs = arg_structs
+        self.returns_struct = returns_struct
+        self.returns_class = returns_class
+        self.direct = direct
+        self.readonly = readonly
+
+    @property
+    def selector(self) -> bytes:
+        # Hashed on use rather than at import, where the first hash costs milliseconds.
+        return self.method.get_selector()
+
+    def encode_args(self, args: object | None) -> list[object] | None:
+        if args is None:
+            return None
+        if isinstance(args, tuple):
+            values = list(args)
+        elif type(args) is self.args_class:
+            values = [getattr(args, name) for name in self.arg_fields]
+        else:
+            return _parse_abi_args(args)
+        for index in self.tuple_args:
+            if index < len(values):
+                value = values[index]
+                if index in self.arg_structs and isinstance(value, dict):
+                    struct = self.arg_structs[index]
+                    values[index] = algokit_utils.get_abi_tuple_from_abi_struct(
+                        value, APP_SPEC.structs[struct], APP_SPEC.structs
+                    )
+                elif not isinstance(value, algokit_utils.AppMethodCallTransactionArgument):
+                    values[index] = _to_abi_tuple(value)
+        return values or None
+
+    def arc56_value(self, return_value: algokit_utils.ABIReturn | None) -> object:
+        """The return value as algokit's AppClient returns it: structs as dicts."""
+        if return_value is None or self.returns_type == "void" or return_value.value is None:
+            return None
+        if return_value.decode_error:
+            raise ValueError(return_value.decode_error)
+        if self.returns_struct:
+            return algokit_utils.get_abi_struct_from_abi_tuple(
+                return_value.value, APP_SPEC.structs[self.returns_struct], APP_SPEC.structs
+            )
+        return return_value.value
+
+    def decode(self, return_value: algokit_utils.ABIReturn | None) -> object:
+        """The return value as `decode_return_value` returns it: structs as their dataclass."""
+        decoded = self.arc56_value(return_value)
+        if self.returns_class and isinstance(decoded, dict):
+            return self.returns_class(**decoded)
+        return decoded
+
+    def _method_call_params(
+        self, args: object | None, params: algokit_utils.CommonAppCallParams
+    ) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": self.signature,
+            "args": self.encode_args(args),
+        })
+
+    def call_params(
+        self,
+        app_client: algokit_utils.AppClient,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> algokit_utils.AppCallMethodCallParams:
+        params = params or algokit_utils.CommonAppCallParams()
+        if not self.direct:
+            return app_client.params.call(self._method_call_params(args, params))
+        # The bare call resolves the sender, signer and app ID exactly as a method call would.
+        bare = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**params.__dict__),
+            on_complete=params.on_complete or OnComplete.NoOpOC,
+        )
+        return algokit_utils.AppCallMethodCallParams(
+            **{name: getattr(bare, name) for name in _METHOD_CALL_FIELDS},
+            method=self.method,
+            args=self.encode_args(args),
+        )
+
+    def create_transaction(
+        self,
+        app_client: algokit_utils.AppClient,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> algokit_utils.BuiltTransactions:
+        return app_client.algorand.create_transaction.app_call_method_call(
+            self.call_params(app_client, args, params)
+        )
+
+    def send(
+        self,
+        app_client: algokit_utils.AppClient,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+        send_params: algokit_utils.SendParams | None,
+    ) -> algokit_utils.SendAppTransactionResult:
+        if self.readonly or not self.direct:
+            params = params or algokit_utils.CommonAppCallParams()
+            return app_client.send.call(self._method_call_params(args, params), send_params=send_params)
+        result = app_client.algorand.send.app_call_method_call(
+            self.call_params(app_client, args, params), send_params
+        )
+        return algokit_utils.SendAppTransactionResult(
+            **{**result.__dict__, "abi_return": self.arc56_value(result.abi_return)}
+        )
+
+'''
+
+
+class _Arc56Arg(TypedDict):
+    type: str
+    struct: NotRequired[str]
+    defaultValue: NotRequired[object]
+
+
+class _Arc56Returns(TypedDict):
+    type: str
+    struct: NotRequired[str]
+
+
+class _Arc56Method(TypedDict):
+    """The parts of an ARC-56 method description the codecs are rendered from."""
+
+    name: str
+    args: list[_Arc56Arg]
+    returns: _Arc56Returns
+    readonly: NotRequired[bool]
+
+
+class _Arc56Spec(TypedDict):
+    methods: list[_Arc56Method]
+
+
+def _signature(method: _Arc56Method) -> str:
+    args = ",".join(arg["type"] for arg in method["args"])
+    return f"{method['name']}({args}){method['returns']['type']}"
+
+
+def _app_spec(tree: ast.Module) -> _Arc56Spec:
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == "_APP_SPEC_JSON"
+                for target in node.targets
+            )
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        ):
+            spec: _Arc56Spec = json.loads(node.value.value)
+            return spec
+    raise ValueError("Generated client has no _APP_SPEC_JSON")
+
+
+def _args_classes(tree: ast.Module) -> dict[str, str]:
+    """Map each method signature to the generated dataclass for its arguments."""
+    classes = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for item in node.body:
+            if (
+                isinstance(item, ast.FunctionDef)
+                and item.name == "abi_method_signature"
+            ):
+                returned = next(
+                    (stmt.value for stmt in item.body if isinstance(stmt, ast.Return)),
+                    None,
+                )
+                if isinstance(returned, ast.Constant) and isinstance(
+                    returned.value, str
+                ):
+                    classes[returned.value] = node.name
+    return classes
+
+
+def render_codecs(source: str) -> str:
+    """The codec section for a generated client's source: the runtime plus one codec per ABI method."""
+    tree = ast.parse(source)
+    spec = _app_spec(tree)
+    args_classes = _args_classes(tree)
+    class_names = {node.name for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    codecs = []
+    names: dict[str, list[str]] = {}
+    for method in spec["methods"]:
+        signature = _signature(method)
+        names.setdefault(method["name"], []).append(signature)
+        arg_structs = {
+            index: arg["struct"]
+            for index, arg in enumerate(method["args"])
+            if arg.get("struct")
+        }
+        returns_struct = method["returns"].get("struct")
+        codecs.append(
+            f"    _MethodCodec(\n"
+            f"        {signature!r},\n"
+            f"        args_class={args_classes.get(signature)},\n"
+            f"        arg_structs={arg_structs!r},\n"
+            f"        returns_struct={returns_struct!r},\n"
+            f"        returns_class={returns_struct if returns_struct in class_names else None},\n"
+            f"        direct={not any(arg.get('defaultValue') for arg in method['args'])},\n"
+            f"        readonly={bool(method.get('readonly'))},\n"
+            f"    ),\n"
+        )
+    # Methods can also be looked up by name, where the name is not overloaded.
+    aliases = {
+        name: signatures[0]
+        for name, signatures in sorted(names.items())
+        if len(signatures) == 1
+    }
+    return (
+        f"\n\n{MARKER}\n{_RUNTIME}\n"
+        f"_CODECS: dict[str, _MethodCodec] = {{codec.signature: codec for codec in (\n{''.join(codecs)})}}\n"
+        f"_CODECS.update({{name: _CODECS[signature] for name, signature in {aliases!r}.items()}})\n"
+    )
+
+
+def add_method_codecs(client_path: Path) -> int:
+    """Rewrite a generated Python client to call and decode through prebuilt codecs.
+
+    Returns the number of call sites rewritten. Call sites the generator wrote in a shape this
+    does not recognise are left as generated, so an unfamiliar generator version still produces
+    a working, if slower, client.
+    """
+    source = client_path.read_text(encoding="utf-8")
+    already_added = MARKER in source
+    if already_added:
+        source = source[: source.index(MARKER)].rstrip() + "\n"
+
+    def call_site(match: re.Match[str]) -> str:
+        send_params = ", send_params" if match["send_params"] else ""
+        method = _CODEC_METHODS[match["accessor"]]
+        return f'{match["lhs"]} _CODECS["{match["signature"]}"].{method}(self.app_client, args, params{send_params})'
+
+    def decode_site(match: re.Match[str]) -> str:
+        return (
+            f"{match['indent']}codec = _CODECS.get(method)\n"
+            f"{match['indent']}if codec is not None:\n"
+            f"{match['indent']}    return codec.decode(return_value)\n"
+            f"{match[0]}"
+        )
+
+    if already_added:
+        # Call sites were rewritten when the codecs were first added; only the codecs are refreshed.
+        client_path.write_text(source + render_codecs(source), encoding="utf-8")
+        return 0
+    source, rewritten = _CALL_SITE.subn(call_site, source)
+    source, decoders = _DECODE_SITE.subn(decode_site, source, count=1)
+    if not rewritten or not decoders:
+        logger.warning(
+            f"{client_path.name}: unrecognised generated call sites, some calls skip the prebuilt codecs"
+        )
+    client_path.write_text(
+        source.rstrip() + "\n" + render_codecs(source), encoding="utf-8"
+    )
+    return rewritten
@@ -0,0 +1,101 @@
+"""Lazy, cached app spec parsing for generated typed clients.
+
+A generated client parses its whole `_APP_SPEC_JSON`, base64 TEAL sources included, into an
+`Arc56Contract` at import time, so every process that imports it pays for the parse even if it
+never calls the app. `add_lazy_app_spec` rewrites a freshly generated client so that the spec is
+parsed on first use instead, and pickled next to the artifacts (`<Name>.arc56.pickle`) so later
+processes load it without parsing. `APP_SPEC` stays importable from the module.
+
+The pickle is keyed by the spec JSON and the installed algokit_utils' `Arc56Contract` module,
+so a rebuilt contract or an upgraded algokit_utils reparses. Building never writes the pickle:
+builds do not import algokit_utils, and the artifacts directory is replaced on each rebuild.
+"""
+
+import ast
+import json
+import re
+from pathlib import Path
+
+CACHE_SUFFIX = ".arc56.pickle"
+
+_EAGER_SPEC = re.compile(
+    r"^APP_SPEC = algokit_utils\.Arc56Contract\.from_json\(_APP_SPEC_JSON\)\n",
+    re.MULTILINE,
+)
+# References to the module-level APP_SPEC from inside the module, which module `__getattr__` does not see.
+_SPEC_REFERENCE = re.compile(r'(?<![\w"\'])APP_SPEC(?![\w"\'])')
+
+_LOADER = '''_APP_SPEC_CACHE = Path(__file__).with_name({cache_name!r})
+
+
+def _app_spec_cache_key() -> str:
+    arc56_module = Path(sys.modules[algokit_utils.Arc56Contract.__module__].__file__).stat()
+    spec_digest = hashlib.sha256(_APP_SPEC_JSON.encode()).hexdigest()
+    return f"{{spec_digest}}:{{arc56_module.st_size}}:{{arc56_module.st_mtime_ns}}"
+
+
+@functools.cache
+def _app_spec() -> algokit_utils.Arc56Contract:
+    """The app spec, parsed on first use and pickled next to this module for later processes."""
+    import pickle  # Imported here, as importing pickle costs more than the rest of this module.
+
+    key = _app_spec_cache_key()
+    try:
+        with _APP_SPEC_CACHE.open("rb") as cache:
+            cached_key, spec = pickle.load(cache)
+        if cached_key == key:
+            return spec
+    except Exception:
+        pass
+    spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    try:
+        with tempfile.NamedTemporaryFile("wb", dir=_APP_SPEC_CACHE.parent, delete=False) as cache:
+            pickle.dump((key, spec), cache, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache.name, _APP_SPEC_CACHE)
+    except OSError:
+        pass
+    return spec
+
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _app_spec()
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+'''
+
+_IMPORTS = "import functools\nimport hashlib\nimport os\nimport sys\nimport tempfile\nfrom pathlib import Path\n"
+
+
+def _spec_name(source: str) -> str:
+    for node in ast.parse(source).body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == "_APP_SPEC_JSON"
+                for target in node.targets
+            )
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        ):
+            spec: dict[str, str] = json.loads(node.value.value)
+            return spec["name"]
+    raise ValueError("Generated client has no _APP_SPEC_JSON")
+
+
+def add_lazy_app_spec(client_path: Path) -> bool:
+    """Rewrite a generated Python client to parse its app spec on first use, returning whether it changed.
+
+    Safe to run again, e.g. after other rewrites that refer to `APP_SPEC`.
+    """
+    source = client_path.read_text(encoding="utf-8")
+    original = source
+    eager = _EAGER_SPEC.search(source)
+    if eager:
+        loader = _LOADER.format(cache_name=_spec_name(source) + CACHE_SUFFIX)
+        source = source[: eager.start()] + loader + source[eager.end() :]
+        source = source.replace("import typing\n", "import typing\n" + _IMPORTS, 1)
+    source = _SPEC_REFERENCE.sub("_app_spec()", source)
+    if source != original:
+        client_path.write_text(source, encoding="utf-8")
+    return source != original
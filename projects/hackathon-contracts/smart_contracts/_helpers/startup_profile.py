@@ -0,0 +1,47 @@
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ImportPhase:
+    name: str
+    seconds: float
+    modules: list[str]
+
+
+@dataclass
+class StartupProfile:
+    """Records how long each import phase of the CLI takes and which third-party packages it loads.
+
+    For a per-module breakdown run the same command under `python -X importtime`.
+    """
+
+    phases: list[ImportPhase] = field(default_factory=list)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        before = set(sys.modules)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            packages = {
+                module.partition(".")[0] for module in set(sys.modules) - before
+            }
+            # Third-party and project packages are what make startup slow; skip the standard library.
+            packages -= sys.stdlib_module_names
+            self.phases.append(ImportPhase(name, seconds, sorted(packages)))
+
+    def report(self) -> str:
+        lines = ["Import times:"]
+        for phase in self.phases:
+            lines.append(f"  {phase.name:<32} {phase.seconds * 1000:8.1f}ms")
+            if phase.modules:
+                lines.append(f"    loaded: {', '.join(phase.modules)}")
+        total = sum(phase.seconds for phase in self.phases)
+        lines.append(f"  {'total':<32} {total * 1000:8.1f}ms")
+        return "\n".join(lines)
@@ -6,8 +6,15 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import collections
 import dataclasses
 import typing
+import functools
+import hashlib
+import os
+import sys
+import tempfile
+from pathlib import Path
 # core algosdk
 import algosdk
 from algosdk.transaction import OnComplete
@@ -19,8 +26,44 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}], "name": "HelloWorld", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CzEbQQAYgAQCvs4RNhoAjgEAAQAxGRQxGBBEQgAIMRkUMRgUEEM2GgFJgQBZgQIISwEVEkRXAgCAD0hlbGxvLCB0ZXN0aW5nIExQSRUWVwYCTFCABBUffHVMULCBAUM=", "clear": "C4EBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBIZWxsb1dvcmxkKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUA1CiAgICBwdXNoYnl0ZXMgMHgwMmJlY2UxMSAvLyBtZXRob2QgImhlbGxvKHN0cmluZylzdHJpbmciCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2hlbGxvX3JvdXRlQDMKICAgIGVycgoKbWFpbl9oZWxsb19yb3V0ZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcCAmJiBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBiIGhlbGxvCgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDU6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgJiYKICAgIHJldHVybiAvLyBvbiBlcnJvcjogT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcCAmJiBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKCgovLyBzbWFydF9jb250cmFjdHMuaGVsbG9fd29ybGQuY29udHJhY3QuSGVsbG9Xb3JsZC5oZWxsb1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmhlbGxvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBwdXNoaW50IDAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3V0ZjhbXSkKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6OAogICAgLy8gcmV0dXJuICJIZWxsbywgdGVzdGluZyAiICsgbmFtZQogICAgcHVzaGJ5dGVzICJIZWxsbywgdGVzdGluZyAiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [37], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [26], "errorMessage": "OnCompletion must be NoOp && can only call when not creating"}, {"pc": [52], "errorMessage": "invalid number of bytes for (len+utf8[])"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}], "name": "HelloWorld", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CzEbQQAYgAQCvs4RNhoAjgEAAQAxGRQxGBBEQgAIMRkUMRgUEEM2GgFJgQBZgQIISwEVEkRXAgCAD0hlbGxvLCB0ZXN0aW5nIExQSRUWVwYCTFCABBUffHVMULCBAUM=", "clear": "C4EBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxNwogICAgLy8gY2xhc3MgSGVsbG9Xb3JsZChBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVANQogICAgcHVzaGJ5dGVzIDB4MDJiZWNlMTEgLy8gbWV0aG9kICJoZWxsbyhzdHJpbmcpc3RyaW5nIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9oZWxsb19yb3V0ZUAzCiAgICBlcnIKCm1haW5faGVsbG9fcm91dGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIGFzc2VydAogICAgYiBoZWxsbwoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUA1OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgICYmCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuaGVsbG9fd29ybGQuY29udHJhY3QuSGVsbG9Xb3JsZC5oZWxsb1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmhlbGxvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjE4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgcHVzaGludCAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToyMAogICAgLy8gcmV0dXJuICJIZWxsbywgdGVzdGluZyAiICsgbmFtZQogICAgcHVzaGJ5dGVzICJIZWxsbywgdGVzdGluZyAiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBwdXNoaW50IDEKICAgIHJldHVybgo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [44], "errorMessage": "invalid array length header"}, {"pc": [52], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_CACHE = Path(__file__).with_name('HelloWorld.arc56.pickle')
+
+
+def _app_spec_cache_key() -> str:
+    arc56_module = Path(sys.modules[algokit_utils.Arc56Contract.__module__].__file__).stat()
+    spec_digest = hashlib.sha256(_APP_SPEC_JSON.encode()).hexdigest()
+    return f"{spec_digest}:{arc56_module.st_size}:{arc56_module.st_mtime_ns}"
+
+
+@functools.cache
+def _app_spec() -> algokit_utils.Arc56Contract:
+    """The app spec, parsed on first use and pickled next to this module for later processes."""
+    import pickle  # Imported here, as importing pickle costs more than the rest of this module.
+
+    key = _app_spec_cache_key()
+    try:
+        with _APP_SPEC_CACHE.open("rb") as cache:
+            cached_key, spec = pickle.load(cache)
+        if cached_key == key:
+            return spec
+    except Exception:
+        pass
+    spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    try:
+        with tempfile.NamedTemporaryFile("wb", dir=_APP_SPEC_CACHE.parent, delete=False) as cache:
+            pickle.dump((key, spec), cache, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache.name, _APP_SPEC_CACHE)
+    except OSError:
+        pass
+    return spec
+
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
@@ -83,13 +126,7 @@ class HelloWorldParams:
         args: tuple[str] | HelloArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        return _CODECS["hello(string)string"].call_params(self.app_client, args, params)
 
     def clear_state(
         self,
@@ -111,13 +148,7 @@ class HelloWorldCreateTransactionParams:
         args: tuple[str] | HelloArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        return _CODECS["hello(string)string"].create_transaction(self.app_client, args, params)
 
     def clear_state(
         self,
@@ -140,16 +171,28 @@ class HelloWorldSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        response = _CODECS["hello(string)string"].send(self.app_client, args, params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
+    def hello_many(
+        self,
+        calls: typing.Iterable[tuple[str] | HelloArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        simulate: bool = False,
+        max_in_flight: int = 4,
+    ) -> typing.Iterator[str]:
+        """Send a `hello` call for each item of `calls` in full groups, yielding the returns in order.
+
+        Calls are sent as the iterator is consumed, up to `max_in_flight` groups at a time. With
+        `simulate`, each group is simulated first and nothing more is sent if one fails.
+        """
+        return typing.cast(typing.Iterator[str], _send_many(
+            _CODECS["hello(string)string"], self.app_client, calls, params, send_params, simulate, max_in_flight
+        ))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -204,7 +247,7 @@ class HelloWorldClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -237,7 +280,7 @@ class HelloWorldClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -259,7 +302,7 @@ class HelloWorldClient:
     ) -> "HelloWorldClient":
         return HelloWorldClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -332,6 +375,9 @@ class HelloWorldClient:
         if return_value is None:
             return None
     
+        codec = _CODECS.get(method)
+        if codec is not None:
+            return codec.decode(return_value)
         arc56_method = self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
@@ -370,7 +416,7 @@ class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCall
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -690,3 +736,228 @@ class HelloWorldComposer:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
         return self._composer.send(send_params)
+
+
+# Prebuilt ABI codecs, added by smart_contracts/_helpers/client_codecs.py.
+
+_METHOD_CALL_FIELDS = tuple(
+    field.name
+    for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+    if field.name not in ("method", "args")
+)
+
+
+def _to_abi_tuple(value: object) -> object:
+    if dataclasses.is_dataclass(value):
+        return tuple(_to_abi_tuple(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_to_abi_tuple(item) for item in value)
+    return value
+
+
+class _MethodCodec:
+    """Encodes one ABI method's arguments and decodes its return, prebuilt from the app spec."""
+
+    def __init__(
+        self,
+        signature: str,
+        *,
+        args_class: type | None,
+        arg_structs: dict[int, str],
+        returns_struct: str | None,
+        returns_class: type | None,
+        direct: bool,
+        readonly: bool,
+    ) -> None:
+        self.signature = signature
+        self.method = algosdk.abi.Method.from_signature(signature)
+        self.arg_types = [arg.type for arg in self.method.args]
+        self.returns_type = self.method.returns.type
+        self.args_class = args_class
+        self.arg_fields = tuple(field.name for field in dataclasses.fields(args_class)) if args_class else ()
+        # Only arguments of tuple types can hold dataclasses that need converting.
+        self.tuple_args = tuple(
+            index for index, arg in enumerate(self.method.args) if "(" in str(arg.type)
+        )
+        self.arg_structs = arg_structs
+        self.returns_struct = returns_struct
+        self.returns_class = returns_class
+        self.direct = direct
+        self.readonly = readonly
+
+    @property
+    def selector(self) -> bytes:
+        # Hashed on use rather than at import, where the first hash costs milliseconds.
+        return self.method.get_selector()
+
+    def encode_args(self, args: object | None) -> list[object] | None:
+        if args is None:
+            return None
+        if isinstance(args, tuple):
+            values = list(args)
+        elif type(args) is self.args_class:
+            values = [getattr(args, name) for name in self.arg_fields]
+        else:
+            return _parse_abi_args(args)
+        for index in self.tuple_args:
+            if index < len(values):
+                value = values[index]
+                if index in self.arg_structs and isinstance(value, dict):
+                    struct = self.arg_structs[index]
+                    values[index] = algokit_utils.get_abi_tuple_from_abi_struct(
+                        value, _app_spec().structs[struct], _app_spec().structs
+                    )
+                elif not isinstance(value, algokit_utils.AppMethodCallTransactionArgument):
+                    values[index] = _to_abi_tuple(value)
+        return values or None
+
+    def arc56_value(self, return_value: algokit_utils.ABIReturn | None) -> object:
+        """The return value as algokit's AppClient returns it: structs as dicts."""
+        if return_value is None or self.returns_type == "void" or return_value.value is None:
+            return None
+        if return_value.decode_error:
+            raise ValueError(return_value.decode_error)
+        if self.returns_struct:
+            return algokit_utils.get_abi_struct_from_abi_tuple(
+                return_value.value, _app_spec().structs[self.returns_struct], _app_spec().structs
+            )
+        return return_value.value
+
+    def decode(self, return_value: algokit_utils.ABIReturn | None) -> object:
+        """The return value as `decode_return_value` returns it: structs as their dataclass."""
+        decoded = self.arc56_value(return_value)
+        if self.returns_class and isinstance(decoded, dict):
+            return self.returns_class(**decoded)
+        return decoded
+
+    def _method_call_params(
+        self, args: object | None, params: algokit_utils.CommonAppCallParams
+    ) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": self.signature,
+            "args": self.encode_args(args),
+        })
+
+    def call_params(
+        self,
+        app_client: algokit_utils.AppClient,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> algokit_utils.AppCallMethodCallParams:
+        params = params or algokit_utils.CommonAppCallParams()
+        if not self.direct:
+            return app_client.params.call(self._method_call_params(args, params))
+        # The bare call resolves the sender, signer and app ID exactly as a method call would.
+        bare = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**params.__dict__),
+            on_complete=params.on_complete or OnComplete.NoOpOC,
+        )
+        return algokit_utils.AppCallMethodCallParams(
+            **{name: getattr(bare, name) for name in _METHOD_CALL_FIELDS},
+            method=self.method,
+            args=self.encode_args(args),
+        )
+
+    def create_transaction(
+        self,
+        app_client: algokit_utils.AppClient,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> algokit_utils.BuiltTransactions:
+        return app_client.algorand.create_transaction.app_call_method_call(
+            self.call_params(app_client, args, params)
+        )
+
+    def send(
+        self,
+        app_client: algokit_utils.AppClient,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+        send_params: algokit_utils.SendParams | None,
+    ) -> algokit_utils.SendAppTransactionResult:
+        if self.readonly or not self.direct:
+            params = params or algokit_utils.CommonAppCallParams()
+            return app_client.send.call(self._method_call_params(args, params), send_params=send_params)
+        result = app_client.algorand.send.app_call_method_call(
+            self.call_params(app_client, args, params), send_params
+        )
+        return algokit_utils.SendAppTransactionResult(
+            **{**result.__dict__, "abi_return": self.arc56_value(result.abi_return)}
+        )
+
+
+_CODECS: dict[str, _MethodCodec] = {codec.signature: codec for codec in (
+    _MethodCodec(
+        'hello(string)string',
+        args_class=HelloArgs,
+        arg_structs={},
+        returns_struct=None,
+        returns_class=None,
+        direct=True,
+        readonly=False,
+    ),
+)}
+_CODECS.update({name: _CODECS[signature] for name, signature in {'hello': 'hello(string)string'}.items()})
+
+
+# Batched calls, added by smart_contracts/_helpers/client_batches.py.
+
+_MAX_GROUP_SIZE = 16
+
+
+def _send_many(
+    codec: _MethodCodec,
+    app_client: algokit_utils.AppClient,
+    calls: typing.Iterable[object],
+    params: algokit_utils.CommonAppCallParams | None,
+    send_params: algokit_utils.SendParams | None,
+    simulate: bool,
+    max_in_flight: int,
+) -> typing.Iterator[object]:
+    """Send one call per item of `calls` in full groups, yielding the decoded returns in call order.
+
+    Groups are sent as the returned iterator is consumed, at most `max_in_flight` ahead of it. If
+    a group fails to simulate or send, the groups not yet sent are abandoned and the error is
+    raised; groups already sent are not rolled back.
+    """
+    import concurrent.futures  # Imported here, to keep it off the client's import time.
+
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+    # Repeats of a call would be the same transaction, so each repeat gets a distinct note.
+    repeats: collections.Counter[str] = collections.Counter()
+
+    def method_call(args: object) -> algokit_utils.AppCallMethodCallParams:
+        call = codec.call_params(app_client, args, params)
+        key = repr((call.args, call.note))
+        repeat = repeats[key]
+        repeats[key] += 1
+        if repeat:
+            note = call.note.encode() if isinstance(call.note, str) else call.note or b""
+            call = dataclasses.replace(call, note=note + f"#{repeat}".encode())
+        return call
+
+    def send_group(group: list[algokit_utils.AppCallMethodCallParams]) -> list[object]:
+        composer = app_client.algorand.new_group()
+        for call in group:
+            composer.add_app_call_method_call(call)
+        if simulate:
+            # Raises if any call in the group fails or runs out of opcode budget.
+            composer.simulate(skip_signatures=True)
+        result = composer.send(send_params)
+        return [codec.decode(abi_return) for abi_return in result.returns]
+
+    pending = iter(calls)
+    in_flight: collections.deque[concurrent.futures.Future[list[object]]] = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="batch-call") as executor:
+        try:
+            while group := [method_call(args) for _, args in zip(range(_MAX_GROUP_SIZE), pending)]:
+                if len(in_flight) >= max_in_flight:
+                    yield from in_flight.popleft().result()
+                in_flight.append(executor.submit(send_group, group))
+            while in_flight:
+                yield from in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
@@ -0,0 +1,1356 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import collections
+import dataclasses
+import typing
+import functools
+import hashlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "name": "width"}, {"type": "uint64", "name": "height"}], "name": "create", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "x"}, {"type": "uint64", "name": "y"}, {"type": "uint64", "name": "w"}, {"type": "uint64", "name": "h"}, {"type": "pay", "name": "payment"}], "name": "buy", "returns": {"type": "void"}, "desc": "Buy every pixel in a region for the sender, paying PRICE_PER_PIXEL for each.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "x"}, {"type": "uint64", "name": "y"}, {"type": "uint64", "name": "w"}, {"type": "uint64", "name": "h"}, {"type": "byte[]", "name": "colors"}], "name": "paint", "returns": {"type": "void"}, "desc": "Paint a region owned by the sender with `colors`, w * h packed RGB triples in row-major order.", "events": [], "readonly": false, "recommendations": {}}], "name": "PixelCanvas", "state": {"keys": {"box": {}, "global": {"width": {"key": "d2lkdGg=", "keyType": "AVMString", "valueType": "AVMUint64"}, "height": {"key": "aGVpZ2h0", "keyType": "AVMString", "valueType": "AVMUint64"}, "band_rows": {"key": "YmFuZF9yb3dz", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"canvas": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "Yw=="}, "owners": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "bw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyAEAAgBICYEBXdpZHRoBmhlaWdodAliYW5kX3Jvd3MBbzEYQAAJKCJnKSJnKiJnMRkURDEYQQAWggIECkkbCARkk+mpNhoAjgIAhQEkAIAElHn/YzYaAI4BACcAigIBi/4Vi/8Li/6LARWLAAxBAAmLAUlQjAFC/+6LASKLAFiMAIk2GgFJFSMSRBdJNhoCSRUjEkQXTEEANUlBADEkREsBSSULgYAIDkRJSwJJTgMLgQMLgYCAAg5EKEsBZylPAmeBAwuBgAhMCipMZyRDIkL/zDYaAUkVIxJEFzYaAkkVIxJEFzYaA0kVIxJEFzYaBEkVIxJEFzEWJAlJOBAkEkRLBEsESwRLBIgBfEk4BzIKEkQ4CEsCSwILgYCJegsPRCIoZUQlC04ETwMlC04DSwElC0lOBK9OAzEATwKI/x1OAksBCExJSwIMQQAjRwIWK0xQSUsJuUhJSwhJTgNLCbpLBxJETEsFuyQIRQFC/9YkQyKAAEcCNhoBSRUjEkQXNhoCSRUjEkQXSU4CNhoDSRUjEkQXNhoESRUjEkQXNhoFSSJZgQIISwEVEkRXAgBJTgVLBEsESwRLBIgAy0sCgQMLSU4GTBVMSwILEkQiKmVMTgVEIillTE4FRCIoZUSBAwtOBEsDJQtOBEsBJQtOBE8DgQMLTgMxAE8CiP5fTgIiTgJLAQhMSUsCDEEAeEcCFitMUEsISwi6SwUSRElLC0lOAwpJRRMWgAFjTFBFE0lPAhhFEEsNEkAABUsOQAAhSw9LCklOAgtLCkwJSUUQDEEABEsJRQ5LDUsIC0sRTLlISw5LCAtLBQhLDEsESU4DSw5JTgVYSxROArsIRQNJJAhFAUL/gSRDigQAi/5BAC6L/0EAKSREi/+BBg5Ei/yL/ggiKGVEDkEAEIv9i/8IIillRA5BAAMkRIkiQv/6IkL/1A==", "clear": "C4EBQw=="}, "desc": "A whole pixel canvas in one app, in place of one ASA per pixel.\n\n    Pixels are bought and painted a rectangular region at a time, so a region costs one app\n    call rather than one transaction per pixel. `x` is the column and `y` the row.\n\n    Boxes are created the first time a region touches them, so the app account must be funded\n    for their minimum balance before buying or painting.\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDggMSAzMgogICAgYnl0ZWNibG9jayAid2lkdGgiICJoZWlnaHQiICJiYW5kX3Jvd3MiIDB4NmYKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo0OQogICAgLy8gc2VsZi53aWR0aCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAid2lkdGgiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo1MAogICAgLy8gc2VsZi5oZWlnaHQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gImhlaWdodCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjUxCiAgICAvLyBzZWxmLmJhbmRfcm93cyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAiYmFuZF9yb3dzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTozOAogICAgLy8gY2xhc3MgUGl4ZWxDYW52YXMoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAOAogICAgcHVzaGJ5dGVzcyAweDBhNDkxYjA4IDB4NjQ5M2U5YTkgLy8gbWV0aG9kICJidXkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJwYWludCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYnl0ZVtdKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBidXkgcGFpbnQKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjM4CiAgICAvLyBjbGFzcyBQaXhlbENhbnZhcyhBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4OTQ3OWZmNjMgLy8gbWV0aG9kICJjcmVhdGUodWludDY0LHVpbnQ2NCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCgovLyBzbWFydF9jb250cmFjdHMuaGVsbG9fd29ybGQuY29udHJhY3QuX3JlcGVhdCh2YWx1ZTogYnl0ZXMsIGNvdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpfcmVwZWF0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjE0MS0xNDIKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3JlcGVhdCh2YWx1ZTogQnl0ZXMsIGNvdW50OiBVSW50NjQpIC0+IEJ5dGVzOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTQ0CiAgICAvLyBsZW5ndGggPSB2YWx1ZS5sZW5ndGggKiBjb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgZnJhbWVfZGlnIC0yCgpfcmVwZWF0X3doaWxlX3RvcEAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gd2hpbGUgcmVzdWx0Lmxlbmd0aCA8IGxlbmd0aDoKICAgIGZyYW1lX2RpZyAxCiAgICBsZW4KICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBfcmVwZWF0X2FmdGVyX3doaWxlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxNDcKICAgIC8vIHJlc3VsdCArPSByZXN1bHQKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAxCiAgICBiIF9yZXBlYXRfd2hpbGVfdG9wQDEKCl9yZXBlYXRfYWZ0ZXJfd2hpbGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxNDgKICAgIC8vIHJldHVybiBvcC5leHRyYWN0KHJlc3VsdCwgMCwgbGVuZ3RoKQogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdDMKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmhlbGxvX3dvcmxkLmNvbnRyYWN0LlBpeGVsQ2FudmFzLmNyZWF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo1NQogICAgLy8gQGFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NTcKICAgIC8vIGFzc2VydCB3aWR0aCA+IDAgYW5kIGhlaWdodCA+IDAsICJlbXB0eSBjYW52YXMiCiAgICBieiBjcmVhdGVfYm9vbF9mYWxzZUA0CiAgICBkdXAKICAgIGJ6IGNyZWF0ZV9ib29sX2ZhbHNlQDQKICAgIGludGNfMiAvLyAxCgpjcmVhdGVfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBhc3NlcnQgd2lkdGggPiAwIGFuZCBoZWlnaHQgPiAwLCAiZW1wdHkgY2FudmFzIgogICAgYXNzZXJ0IC8vIGVtcHR5IGNhbnZhcwogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjU5CiAgICAvLyB3aWR0aCAqIEFERFJFU1NfQllURVMgPD0gTUFYX0JPWF9CWVRFUwogICAgZGlnIDEKICAgIGR1cAogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDEwMjQKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NTgtNjAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgd2lkdGggKiBBRERSRVNTX0JZVEVTIDw9IE1BWF9CT1hfQllURVMKICAgIC8vICksICJjYW52YXMgdG9vIHdpZGUgZm9yIG9uZSBvd25lcnMgYm94IHBlciByb3ciCiAgICBhc3NlcnQgLy8gY2FudmFzIHRvbyB3aWRlIGZvciBvbmUgb3duZXJzIGJveCBwZXIgcm93CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NjEKICAgIC8vIGFzc2VydCB3aWR0aCAqIGhlaWdodCAqIENPTE9SX0JZVEVTIDw9IE1BWF9DQU5WQVNfQllURVMsICJjYW52YXMgdG9vIGxhcmdlIgogICAgZHVwCiAgICBkaWcgMgogICAgZHVwCiAgICBjb3ZlciAzCiAgICAqCiAgICBwdXNoaW50IDMKICAgICoKICAgIHB1c2hpbnQgMzI3NjgKICAgIDw9CiAgICBhc3NlcnQgLy8gY2FudmFzIHRvbyBsYXJnZQogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLndpZHRoID0gd2lkdGgKICAgIGJ5dGVjXzAgLy8gIndpZHRoIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NjMKICAgIC8vIHNlbGYuaGVpZ2h0ID0gaGVpZ2h0CiAgICBieXRlY18xIC8vICJoZWlnaHQiCiAgICB1bmNvdmVyIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NjQKICAgIC8vIHNlbGYuYmFuZF9yb3dzID0gTUFYX0JPWF9CWVRFUyAvLyAod2lkdGggKiBDT0xPUl9CWVRFUykKICAgIHB1c2hpbnQgMwogICAgKgogICAgcHVzaGludCAxMDI0CiAgICBzd2FwCiAgICAvCiAgICBieXRlY18yIC8vICJiYW5kX3Jvd3MiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBAYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzIgLy8gMQogICAgcmV0dXJuCgpjcmVhdGVfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgY3JlYXRlX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5oZWxsb193b3JsZC5jb250cmFjdC5QaXhlbENhbnZhcy5idXlbcm91dGluZ10oKSAtPiB2b2lkOgpidXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMiAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzIgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NzYKICAgIC8vIHNlbGYuX2NoZWNrX3JlZ2lvbih4LCB5LCB3LCBoKQogICAgZGlnIDQKICAgIGRpZyA0CiAgICBkaWcgNAogICAgZGlnIDQKICAgIGNhbGxzdWIgX2NoZWNrX3JlZ2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5Ojc3LTc5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgInBheW1lbnQgbXVzdCBnbyB0byB0aGUgYXBwIgogICAgYXNzZXJ0IC8vIHBheW1lbnQgbXVzdCBnbyB0byB0aGUgYXBwCiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6ODAKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA+PSB3ICogaCAqIFBSSUNFX1BFUl9QSVhFTCwgInBheW1lbnQgdG9vIHNtYWxsIGZvciByZWdpb24iCiAgICBndHhucyBBbW91bnQKICAgIGRpZyAyCiAgICBkaWcgMgogICAgKgogICAgcHVzaGludCAyMDAwMDAwCiAgICAqCiAgICA+PQogICAgYXNzZXJ0IC8vIHBheW1lbnQgdG9vIHNtYWxsIGZvciByZWdpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo4MgogICAgLy8gcm93X3NpemUgPSBzZWxmLndpZHRoICogQUREUkVTU19CWVRFUwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIndpZHRoIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndpZHRoIGV4aXN0cwogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBjb3ZlciA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6ODMKICAgIC8vIG9mZnNldCA9IHggKiBBRERSRVNTX0JZVEVTCiAgICB1bmNvdmVyIDMKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5Ojg0CiAgICAvLyB1bm93bmVkID0gb3AuYnplcm8odyAqIEFERFJFU1NfQllURVMpCiAgICBkaWcgMQogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBkdXAKICAgIGNvdmVyIDQKICAgIGJ6ZXJvCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6ODUKICAgIC8vIHNlbmRlcl9ydW4gPSBfcmVwZWF0KFR4bi5zZW5kZXIuYnl0ZXMsIHcpCiAgICB0eG4gU2VuZGVyCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX3JlcGVhdAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBmb3Igcm93IGluIHVyYW5nZSh5LCB5ICsgaCk6CiAgICBkaWcgMQogICAgKwogICAgc3dhcAoKYnV5X2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo4NgogICAgLy8gZm9yIHJvdyBpbiB1cmFuZ2UoeSwgeSArIGgpOgogICAgZHVwCiAgICBkaWcgMgogICAgPAogICAgYnogYnV5X2FmdGVyX2ZvckA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6ODcKICAgIC8vIG93bmVyc19yb3cgPSBzZWxmLm93bmVycy5ib3gocm93KQogICAgZHVwbiAyCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4NmYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5Ojg4LTg5CiAgICAvLyAjIE5vLW9wIGlmIHRoZSByb3cncyBvd25lciBib3ggYWxyZWFkeSBleGlzdHMuCiAgICAvLyBvd25lcnNfcm93LmNyZWF0ZShzaXplPXJvd19zaXplKQogICAgZHVwCiAgICBkaWcgOQogICAgYm94X2NyZWF0ZQogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6OTEKICAgIC8vIG93bmVyc19yb3cuZXh0cmFjdChvZmZzZXQsIHcgKiBBRERSRVNTX0JZVEVTKSA9PSB1bm93bmVkCiAgICBkdXAKICAgIGRpZyA4CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGRpZyA5CiAgICBib3hfZXh0cmFjdAogICAgZGlnIDcKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6OTAtOTIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgb3duZXJzX3Jvdy5leHRyYWN0KG9mZnNldCwgdyAqIEFERFJFU1NfQllURVMpID09IHVub3duZWQKICAgIC8vICksICJwaXhlbCBhbHJlYWR5IG93bmVkIgogICAgYXNzZXJ0IC8vIHBpeGVsIGFscmVhZHkgb3duZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo5MwogICAgLy8gb3duZXJzX3Jvdy5yZXBsYWNlKG9mZnNldCwgc2VuZGVyX3J1bikKICAgIHN3YXAKICAgIGRpZyA1CiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBmb3Igcm93IGluIHVyYW5nZSh5LCB5ICsgaCk6CiAgICBpbnRjXzIgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGJ1eV9mb3JfaGVhZGVyQDIKCmJ1eV9hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo2NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzIgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmhlbGxvX3dvcmxkLmNvbnRyYWN0LlBpeGVsQ2FudmFzLnBhaW50W3JvdXRpbmddKCkgLT4gdm9pZDoKcGFpbnQ6CiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo5NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgZHVwCiAgICBjb3ZlciA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6OTgKICAgIC8vIHNlbGYuX2NoZWNrX3JlZ2lvbih4LCB5LCB3LCBoKQogICAgZGlnIDQKICAgIGRpZyA0CiAgICBkaWcgNAogICAgZGlnIDQKICAgIGNhbGxzdWIgX2NoZWNrX3JlZ2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5Ojk5CiAgICAvLyByb3dfYnl0ZXMgPSB3ICogQ09MT1JfQllURVMKICAgIGRpZyAyCiAgICBwdXNoaW50IDMKICAgICoKICAgIGR1cAogICAgY292ZXIgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEwMQogICAgLy8gY29sb3JzLmxlbmd0aCA9PSByb3dfYnl0ZXMgKiBoCiAgICBzd2FwCiAgICBsZW4KICAgIHN3YXAKICAgIGRpZyAyCiAgICAqCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEwMC0xMDIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY29sb3JzLmxlbmd0aCA9PSByb3dfYnl0ZXMgKiBoCiAgICAvLyApLCAiY29sb3JzIG11c3QgaG9sZCAzIGJ5dGVzIHBlciBwaXhlbCBpbiByZWdpb24iCiAgICBhc3NlcnQgLy8gY29sb3JzIG11c3QgaG9sZCAzIGJ5dGVzIHBlciBwaXhlbCBpbiByZWdpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMDQtMTA2CiAgICAvLyAjIFN0YXRlIGlzIHJlYWQgb25jZSB1cCBmcm9udDogYSByZWdpb24gb2YgTUFYX1JFR0lPTl9IRUlHSFQgZnVsbC13aWR0aCByb3dzIGhhcyB0bwogICAgLy8gIyBmaXQgaW4gb25lIGFwcCBjYWxsJ3Mgb3Bjb2RlIGJ1ZGdldC4KICAgIC8vIGJhbmRfcm93cyA9IHNlbGYuYmFuZF9yb3dzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYmFuZF9yb3dzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGNvdmVyIDUKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJhbmRfcm93cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMDcKICAgIC8vIGhlaWdodCA9IHNlbGYuaGVpZ2h0CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaGVpZ2h0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGNvdmVyIDUKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmhlaWdodCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMDgKICAgIC8vIGNhbnZhc19yb3dfYnl0ZXMgPSBzZWxmLndpZHRoICogQ09MT1JfQllURVMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJ3aWR0aCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53aWR0aCBleGlzdHMKICAgIHB1c2hpbnQgMwogICAgKgogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEwOQogICAgLy8gb2Zmc2V0ID0geCAqIEFERFJFU1NfQllURVMKICAgIGRpZyAzCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIGNvdmVyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMTAKICAgIC8vIHJ1bl9ieXRlcyA9IHcgKiBBRERSRVNTX0JZVEVTCiAgICBkaWcgMQogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBjb3ZlciA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTExCiAgICAvLyBjb2xvcl9vZmZzZXQgPSB4ICogQ09MT1JfQllURVMKICAgIHVuY292ZXIgMwogICAgcHVzaGludCAzCiAgICAqCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTEyCiAgICAvLyBzZW5kZXJfcnVuID0gX3JlcGVhdChUeG4uc2VuZGVyLmJ5dGVzLCB3KQogICAgdHhuIFNlbmRlcgogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIF9yZXBlYXQKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMTMKICAgIC8vIHN0YXJ0ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjExNAogICAgLy8gZm9yIHJvdyBpbiB1cmFuZ2UoeSwgeSArIGgpOgogICAgZGlnIDEKICAgICsKICAgIHN3YXAKCnBhaW50X2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMTQKICAgIC8vIGZvciByb3cgaW4gdXJhbmdlKHksIHkgKyBoKToKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IHBhaW50X2FmdGVyX2ZvckAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjExNgogICAgLy8gc2VsZi5vd25lcnMuYm94KHJvdykuZXh0cmFjdChvZmZzZXQsIHJ1bl9ieXRlcykgPT0gc2VuZGVyX3J1bgogICAgZHVwbiAyCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4NmYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDgKICAgIGRpZyA4CiAgICBib3hfZXh0cmFjdAogICAgZGlnIDUKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTE1LTExNwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLm93bmVycy5ib3gocm93KS5leHRyYWN0KG9mZnNldCwgcnVuX2J5dGVzKSA9PSBzZW5kZXJfcnVuCiAgICAvLyApLCAicGl4ZWwgbm90IG93bmVkIgogICAgYXNzZXJ0IC8vIHBpeGVsIG5vdCBvd25lZAogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjExOAogICAgLy8gYmFuZCA9IHJvdyAvLyBiYW5kX3Jvd3MKICAgIGR1cAogICAgZGlnIDExCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIC8KICAgIGR1cAogICAgYnVyeSAxOQogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjExOQogICAgLy8gYmFuZF9ib3ggPSBzZWxmLmNhbnZhcy5ib3goYmFuZCkKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweDYzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ1cnkgMTkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMjAKICAgIC8vIGJhbmRfcm93ID0gcm93ICUgYmFuZF9yb3dzCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgJQogICAgYnVyeSAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gaWYgcm93ID09IHkgb3IgYmFuZF9yb3cgPT0gMDoKICAgIGRpZyAxMwogICAgPT0KICAgIGJueiBwYWludF9pZl9ib2R5QDUKICAgIGRpZyAxNAogICAgYm56IHBhaW50X2FmdGVyX2lmX2Vsc2VAOAoKcGFpbnRfaWZfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEyMi0xMjQKICAgIC8vICMgVGhlIHJlZ2lvbidzIGZpcnN0IHJvdyBpbiB0aGlzIGJhbmQ6IGNyZWF0ZSB0aGUgYmFuZCdzIGJveCwgYSBuby1vcCBpZiBpdAogICAgLy8gIyBleGlzdHMuIFRoZSBsYXN0IGJhbmQgb25seSBob2xkcyB0aGUgcm93cyBsZWZ0IG92ZXIuCiAgICAvLyByb3dzX2luX2JhbmQgPSBoZWlnaHQgLSBiYW5kICogYmFuZF9yb3dzCiAgICBkaWcgMTUKICAgIGRpZyAxMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICAqCiAgICBkaWcgMTAKICAgIHN3YXAKICAgIC0KICAgIGR1cAogICAgYnVyeSAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEyNQogICAgLy8gaWYgcm93c19pbl9iYW5kID4gYmFuZF9yb3dzOgogICAgPAogICAgYnogcGFpbnRfYWZ0ZXJfaWZfZWxzZUA3CiAgICBkaWcgOQogICAgYnVyeSAxNAoKcGFpbnRfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEyNwogICAgLy8gYmFuZF9ib3guY3JlYXRlKHNpemU9cm93c19pbl9iYW5kICogY2FudmFzX3Jvd19ieXRlcykKICAgIGRpZyAxMwogICAgZGlnIDgKICAgICoKICAgIGRpZyAxNwogICAgc3dhcAogICAgYm94X2NyZWF0ZQogICAgcG9wCgpwYWludF9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTI5CiAgICAvLyBiYW5kX3JvdyAqIGNhbnZhc19yb3dfYnl0ZXMgKyBjb2xvcl9vZmZzZXQsCiAgICBkaWcgMTQKICAgIGRpZyA4CiAgICAqCiAgICBkaWcgNQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gb3AuZXh0cmFjdChjb2xvcnMsIHN0YXJ0LCByb3dfYnl0ZXMpLAogICAgZGlnIDEyCiAgICBkaWcgNAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBkaWcgMTQKICAgIGR1cAogICAgY292ZXIgNQogICAgZXh0cmFjdDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMjgtMTMxCiAgICAvLyBiYW5kX2JveC5yZXBsYWNlKAogICAgLy8gICAgIGJhbmRfcm93ICogY2FudmFzX3Jvd19ieXRlcyArIGNvbG9yX29mZnNldCwKICAgIC8vICAgICBvcC5leHRyYWN0KGNvbG9ycywgc3RhcnQsIHJvd19ieXRlcyksCiAgICAvLyApCiAgICBkaWcgMjAKICAgIGNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTMyCiAgICAvLyBzdGFydCArPSByb3dfYnl0ZXMKICAgICsKICAgIGJ1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjExNAogICAgLy8gZm9yIHJvdyBpbiB1cmFuZ2UoeSwgeSArIGgpOgogICAgZHVwCiAgICBpbnRjXzIgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIHBhaW50X2Zvcl9oZWFkZXJAMgoKcGFpbnRfYWZ0ZXJfZm9yQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMiAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuaGVsbG9fd29ybGQuY29udHJhY3QuUGl4ZWxDYW52YXMuX2NoZWNrX3JlZ2lvbih4OiB1aW50NjQsIHk6IHVpbnQ2NCwgdzogdWludDY0LCBoOiB1aW50NjQpIC0+IHZvaWQ6Cl9jaGVja19yZWdpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTM0LTEzNQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfY2hlY2tfcmVnaW9uKHNlbGYsIHg6IFVJbnQ2NCwgeTogVUludDY0LCB3OiBVSW50NjQsIGg6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gYXNzZXJ0IHcgPiAwIGFuZCBoID4gMCwgImVtcHR5IHJlZ2lvbiIKICAgIGZyYW1lX2RpZyAtMgogICAgYnogX2NoZWNrX3JlZ2lvbl9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAtMQogICAgYnogX2NoZWNrX3JlZ2lvbl9ib29sX2ZhbHNlQDMKICAgIGludGNfMiAvLyAxCgpfY2hlY2tfcmVnaW9uX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMzYKICAgIC8vIGFzc2VydCB3ID4gMCBhbmQgaCA+IDAsICJlbXB0eSByZWdpb24iCiAgICBhc3NlcnQgLy8gZW1wdHkgcmVnaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTM3CiAgICAvLyBhc3NlcnQgaCA8PSBNQVhfUkVHSU9OX0hFSUdIVCwgInJlZ2lvbiB0b28gdGFsbCIKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA2CiAgICA8PQogICAgYXNzZXJ0IC8vIHJlZ2lvbiB0b28gdGFsbAogICAgLy8gc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjEzOAogICAgLy8gYXNzZXJ0IHggKyB3IDw9IHNlbGYud2lkdGggYW5kIHkgKyBoIDw9IHNlbGYuaGVpZ2h0LCAicmVnaW9uIG91dHNpZGUgY2FudmFzIgogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJ3aWR0aCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53aWR0aCBleGlzdHMKICAgIDw9CiAgICBieiBfY2hlY2tfcmVnaW9uX2Jvb2xfZmFsc2VANwogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJoZWlnaHQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaGVpZ2h0IGV4aXN0cwogICAgPD0KICAgIGJ6IF9jaGVja19yZWdpb25fYm9vbF9mYWxzZUA3CiAgICBpbnRjXzIgLy8gMQoKX2NoZWNrX3JlZ2lvbl9ib29sX21lcmdlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTM4CiAgICAvLyBhc3NlcnQgeCArIHcgPD0gc2VsZi53aWR0aCBhbmQgeSArIGggPD0gc2VsZi5oZWlnaHQsICJyZWdpb24gb3V0c2lkZSBjYW52YXMiCiAgICBhc3NlcnQgLy8gcmVnaW9uIG91dHNpZGUgY2FudmFzCiAgICByZXRzdWIKCl9jaGVja19yZWdpb25fYm9vbF9mYWxzZUA3OgogICAgaW50Y18wIC8vIDAKICAgIGIgX2NoZWNrX3JlZ2lvbl9ib29sX21lcmdlQDgKCl9jaGVja19yZWdpb25fYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgX2NoZWNrX3JlZ2lvbl9ib29sX21lcmdlQDQK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [185], "errorMessage": "canvas too large"}, {"pc": [169], "errorMessage": "canvas too wide for one owners box per row"}, {"pc": [467], "errorMessage": "check self.band_rows exists"}, {"pc": [474, 690], "errorMessage": "check self.height exists"}, {"pc": [292, 478, 677], "errorMessage": "check self.width exists"}, {"pc": [460], "errorMessage": "colors must hold 3 bytes per pixel in region"}, {"pc": [159], "errorMessage": "empty canvas"}, {"pc": [662], "errorMessage": "empty region"}, {"pc": [419], "errorMessage": "invalid array length header"}, {"pc": [427], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [138, 148, 218, 227, 236, 245, 382, 391, 403, 412], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [274], "errorMessage": "payment must go to the app"}, {"pc": [288], "errorMessage": "payment too small for region"}, {"pc": [356], "errorMessage": "pixel already owned"}, {"pc": [540], "errorMessage": "pixel not owned"}, {"pc": [696], "errorMessage": "region outside canvas"}, {"pc": [668], "errorMessage": "region too tall"}, {"pc": [256], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_CACHE = Path(__file__).with_name('PixelCanvas.arc56.pickle')
+
+
+def _app_spec_cache_key() -> str:
+    arc56_module = Path(sys.modules[algokit_utils.Arc56Contract.__module__].__file__).stat()
+    spec_digest = hashlib.sha256(_APP_SPEC_JSON.encode()).hexdigest()
+    return f"{spec_digest}:{arc56_module.st_size}:{arc56_module.st_mtime_ns}"
+
+
+@functools.cache
+def _app_spec() -> algokit_utils.Arc56Contract:
+    """The app spec, parsed on first use and pickled next to this module for later processes."""
+    import pickle  # Imported here, as importing pickle costs more than the rest of this module.
+
+    key = _app_spec_cache_key()
+    try:
+        with _APP_SPEC_CACHE.open("rb") as cache:
+            cached_key, spec = pickle.load(cache)
+        if cached_key == key:
+            return spec
+    except Exception:
+        pass
+    spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    try:
+        with tempfile.NamedTemporaryFile("wb", dir=_APP_SPEC_CACHE.parent, delete=False) as cache:
+            pickle.dump((key, spec), cache, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache.name, _APP_SPEC_CACHE)
+    except OSError:
+        pass
+    return spec
+
+
+def __getattr__(name: str) -> object:
+    if name == "APP_SPEC":
+        return _app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BuyArgs:
+    """Dataclass for buy arguments"""
+    x: int
+    y: int
+    w: int
+    h: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "buy(uint64,uint64,uint64,uint64,pay)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PaintArgs:
+    """Dataclass for paint arguments"""
+    x: int
+    y: int
+    w: int
+    h: int
+    colors: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "paint(uint64,uint64,uint64,uint64,byte[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateArgs:
+    """Dataclass for create arguments"""
+    width: int
+    height: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create(uint64,uint64)void"
+
+
+class PixelCanvasParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def buy(
+        self,
+        args: tuple[int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return _CODECS["buy(uint64,uint64,uint64,uint64,pay)void"].call_params(self.app_client, args, params)
+
+    def paint(
+        self,
+        args: tuple[int, int, int, int, bytes | str] | PaintArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return _CODECS["paint(uint64,uint64,uint64,uint64,byte[])void"].call_params(self.app_client, args, params)
+
+    def create(
+        self,
+        args: tuple[int, int] | CreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return _CODECS["create(uint64,uint64)void"].call_params(self.app_client, args, params)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class PixelCanvasCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def buy(
+        self,
+        args: tuple[int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return _CODECS["buy(uint64,uint64,uint64,uint64,pay)void"].create_transaction(self.app_client, args, params)
+
+    def paint(
+        self,
+        args: tuple[int, int, int, int, bytes | str] | PaintArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return _CODECS["paint(uint64,uint64,uint64,uint64,byte[])void"].create_transaction(self.app_client, args, params)
+
+    def create(
+        self,
+        args: tuple[int, int] | CreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return _CODECS["create(uint64,uint64)void"].create_transaction(self.app_client, args, params)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class PixelCanvasSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def buy(
+        self,
+        args: tuple[int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        response = _CODECS["buy(uint64,uint64,uint64,uint64,pay)void"].send(self.app_client, args, params, send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def paint(
+        self,
+        args: tuple[int, int, int, int, bytes | str] | PaintArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        response = _CODECS["paint(uint64,uint64,uint64,uint64,byte[])void"].send(self.app_client, args, params, send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def paint_many(
+        self,
+        calls: typing.Iterable[tuple[int, int, int, int, bytes | str] | PaintArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        simulate: bool = False,
+        max_in_flight: int = 4,
+    ) -> typing.Iterator[None]:
+        """Send a `paint` call for each item of `calls` in full groups, yielding the returns in order.
+
+        Calls are sent as the iterator is consumed, up to `max_in_flight` groups at a time. With
+        `simulate`, each group is simulated first and nothing more is sent if one fails.
+        """
+        return typing.cast(typing.Iterator[None], _send_many(
+            _CODECS["paint(uint64,uint64,uint64,uint64,byte[])void"], self.app_client, calls, params, send_params, simulate, max_in_flight
+        ))
+
+    def create(
+        self,
+        args: tuple[int, int] | CreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        response = _CODECS["create(uint64,uint64)void"].send(self.app_client, args, params, send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def create_many(
+        self,
+        calls: typing.Iterable[tuple[int, int] | CreateArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        simulate: bool = False,
+        max_in_flight: int = 4,
+    ) -> typing.Iterator[None]:
+        """Send a `create` call for each item of `calls` in full groups, yielding the returns in order.
+
+        Calls are sent as the iterator is consumed, up to `max_in_flight` groups at a time. With
+        `simulate`, each group is simulated first and nothing more is sent if one fails.
+        """
+        return typing.cast(typing.Iterator[None], _send_many(
+            _CODECS["create(uint64,uint64)void"], self.app_client, calls, params, send_params, simulate, max_in_flight
+        ))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    width: int
+    height: int
+    band_rows: int
+
+class PixelCanvasState:
+    """Methods to access state for the current PixelCanvas app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def width(self) -> int:
+        """Get the current value of the width key in global_state state"""
+        value = self.app_client.state.global_state.get_value("width")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def height(self) -> int:
+        """Get the current value of the height key in global_state state"""
+        value = self.app_client.state.global_state.get_value("height")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def band_rows(self) -> int:
+        """Get the current value of the band_rows key in global_state state"""
+        value = self.app_client.state.global_state.get_value("band_rows")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def canvas(self) -> "_MapState[int, bytes]":
+        """Get values from the canvas map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "canvas",
+            None
+        )
+
+    @property
+    def owners(self) -> "_MapState[int, bytes]":
+        """Get values from the owners map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "owners",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class PixelCanvasClient:
+    """Client for interacting with PixelCanvas smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=_app_spec(),
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = PixelCanvasParams(self.app_client)
+        self.create_transaction = PixelCanvasCreateTransactionParams(self.app_client)
+        self.send = PixelCanvasSend(self.app_client)
+        self.state = PixelCanvasState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "PixelCanvasClient":
+        return PixelCanvasClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=_app_spec(),
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "PixelCanvasClient":
+        return PixelCanvasClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=_app_spec(),
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "PixelCanvasClient":
+        return PixelCanvasClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "PixelCanvasComposer":
+        return PixelCanvasComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["buy(uint64,uint64,uint64,uint64,pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["paint(uint64,uint64,uint64,uint64,byte[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create(uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        codec = _CODECS.get(method)
+        if codec is not None:
+            return codec.decode(return_value)
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class PixelCanvasMethodCallCreateParams(
+    algokit_utils.AppClientCreateSchema, algokit_utils.BaseAppClientMethodCallParams[
+        CreateArgs,
+        str | None,
+    ]
+):
+    """Parameters for creating PixelCanvas contract using ABI"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallCreateParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallCreateParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+class PixelCanvasFactory(algokit_utils.TypedAppFactoryProtocol[PixelCanvasMethodCallCreateParams, None, None]):
+    """Factory for deploying and managing PixelCanvasClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=_app_spec(),
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = PixelCanvasFactoryParams(self.app_factory)
+        self.create_transaction = PixelCanvasFactoryCreateTransaction(self.app_factory)
+        self.send = PixelCanvasFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: PixelCanvasMethodCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[PixelCanvasClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return PixelCanvasClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> PixelCanvasClient:
+        """Get an app client by creator address and name"""
+        return PixelCanvasClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> PixelCanvasClient:
+        """Get an app client by app ID"""
+        return PixelCanvasClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class PixelCanvasFactoryParams:
+    """Parameters for creating transactions for PixelCanvas contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = PixelCanvasFactoryCreateParams(app_factory)
+        self.update = PixelCanvasFactoryUpdateParams(app_factory)
+        self.delete = PixelCanvasFactoryDeleteParams(app_factory)
+
+class PixelCanvasFactoryCreateParams:
+    """Parameters for 'create' operations of PixelCanvas contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def buy(
+        self,
+        args: tuple[int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the buy(uint64,uint64,uint64,uint64,pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "buy(uint64,uint64,uint64,uint64,pay)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def paint(
+        self,
+        args: tuple[int, int, int, int, bytes | str] | PaintArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the paint(uint64,uint64,uint64,uint64,byte[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "paint(uint64,uint64,uint64,uint64,byte[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create(
+        self,
+        args: tuple[int, int] | CreateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create(uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create(uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class PixelCanvasFactoryUpdateParams:
+    """Parameters for 'update' operations of PixelCanvas contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class PixelCanvasFactoryDeleteParams:
+    """Parameters for 'delete' operations of PixelCanvas contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class PixelCanvasFactoryCreateTransaction:
+    """Create transactions for PixelCanvas contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = PixelCanvasFactoryCreateTransactionCreate(app_factory)
+
+
+class PixelCanvasFactoryCreateTransactionCreate:
+    """Create new instances of PixelCanvas contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class PixelCanvasFactorySend:
+    """Send calls to PixelCanvas contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = PixelCanvasFactorySendCreate(app_factory)
+
+
+class PixelCanvasFactorySendCreate:
+    """Send create calls to PixelCanvas contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[PixelCanvasClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return PixelCanvasClient(result[0]), result[1]
+
+    def create(
+        self,
+        args: tuple[int, int] | CreateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> tuple[PixelCanvasClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
+            """Creates and sends a transaction using the create(uint64,uint64)void ABI method"""
+            params = params or algokit_utils.CommonAppCallCreateParams()
+            client, result = self.app_factory.send.create(
+                algokit_utils.AppFactoryCreateMethodCallParams(
+                    **{
+                    **dataclasses.asdict(params),
+                    "method": "create(uint64,uint64)void",
+                    "args": _parse_abi_args(args),
+                    }
+                ),
+                send_params=send_params,
+                compilation_params=compilation_params
+            )
+            return_value = None if result.abi_return is None else typing.cast(None, result.abi_return)
+    
+            return PixelCanvasClient(client), algokit_utils.AppFactoryCreateMethodCallResult[None](
+                **{
+                    **result.__dict__,
+                    "app_id": result.app_id,
+                    "abi_return": return_value,
+                    "transaction": result.transaction,
+                    "confirmation": result.confirmation,
+                    "group_id": result.group_id,
+                    "tx_ids": result.tx_ids,
+                    "transactions": result.transactions,
+                    "confirmations": result.confirmations,
+                    "app_address": result.app_address,
+                }
+            )
+
+
+class PixelCanvasComposer:
+    """Composer for creating transaction groups for PixelCanvas contract calls"""
+
+    def __init__(self, client: "PixelCanvasClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def buy(
+        self,
+        args: tuple[int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PixelCanvasComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.buy(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "buy(uint64,uint64,uint64,uint64,pay)void", v
+            )
+        )
+        return self
+
+    def paint(
+        self,
+        args: tuple[int, int, int, int, bytes | str] | PaintArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PixelCanvasComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.paint(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "paint(uint64,uint64,uint64,uint64,byte[])void", v
+            )
+        )
+        return self
+
+    def create(
+        self,
+        args: tuple[int, int] | CreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PixelCanvasComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create(uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "PixelCanvasComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "PixelCanvasComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
+
+
+# Prebuilt ABI codecs, added by smart_contracts/_helpers/client_codecs.py.
+
+_METHOD_CALL_FIELDS = tuple(
+    field.name
+    for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+    if field.name not in ("method", "args")
+)
+
+
+def _to_abi_tuple(value: object) -> object:
+    if dataclasses.is_dataclass(value):
+        return tuple(_to_abi_tuple(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_to_abi_tuple(item) for item in value)
+    return value
+
+
+class _MethodCodec:
+    """Encodes one ABI method's arguments and decodes its return, prebuilt from the app spec."""
+
+    def __init__(
+        self,
+        signature: str,
+        *,
+        args_class: type | None,
+        arg_structs: dict[int, str],
+        returns_struct: str | None,
+        returns_class: type | None,
+        direct: bool,
+        readonly: bool,
+    ) -> None:
+        self.signature = signature
+        self.method = algosdk.abi.Method.from_signature(signature)
+        self.arg_types = [arg.type for arg in self.method.args]
+        self.returns_type = self.method.returns.type
+        self.args_class = args_class
+        self.arg_fields = tuple(field.name for field in dataclasses.fields(args_class)) if args_class else ()
+        # Only arguments of tuple types can hold dataclasses that need converting.
+        self.tuple_args = tuple(
+            index for index, arg in enumerate(self.method.args) if "(" in str(arg.type)
+        )
+        self.arg_structs = arg_structs
+        self.returns_struct = returns_struct
+        self.returns_class = returns_class
+        self.direct = direct
+        self.readonly = readonly
+
+    @property
+    def selector(self) -> bytes:
+        # Hashed on use rather than at import, where the first hash costs milliseconds.
+        return self.method.get_selector()
+
+    def encode_args(self, args: object | None) -> list[object] | None:
+        if args is None:
+            return None
+        if isinstance(args, tuple):
+            values = list(args)
+        elif type(args) is self.args_class:
+            values = [getattr(args, name) for name in self.arg_fields]
+        else:
+            return _parse_abi_args(args)
+        for index in self.tuple_args:
+            if index < len(values):
+                value = values[index]
+                if index in self.arg_structs and isinstance(value, dict):
+                    struct = self.arg_structs[index]
+                    values[index] = algokit_utils.get_abi_tuple_from_abi_struct(
+                        value, _app_spec().structs[struct], _app_spec().structs
+                    )
+                elif not isinstance(value, algokit_utils.AppMethodCallTransactionArgument):
+                    values[index] = _to_abi_tuple(value)
+        return values or None
+
+    def arc56_value(self, return_value: algokit_utils.ABIReturn | None) -> object:
+        """The return value as algokit's AppClient returns it: structs as dicts."""
+        if return_value is None or self.returns_type == "void" or return_value.value is None:
+            return None
+        if return_value.decode_error:
+            raise ValueError(return_value.decode_error)
+        if self.returns_struct:
+            return algokit_utils.get_abi_struct_from_abi_tuple(
+                return_value.value, _app_spec().structs[self.returns_struct], _app_spec().structs
+            )
+        return return_value.value
+
+    def decode(self, return_value: algokit_utils.ABIReturn | None) -> object:
+        """The return value as `decode_return_value` returns it: structs as their dataclass."""
+        decoded = self.arc56_value(return_value)
+        if self.returns_class and isinstance(decoded, dict):
+            return self.returns_class(**decoded)
+        return decoded
+
+    def _method_call_params(
+        self, args: object | None, params: algokit_utils.CommonAppCallParams
+    ) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": self.signature,
+            "args": self.encode_args(args),
+        })
+
+    def call_params(
+        self,
+        app_client: algokit_utils.AppClient,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> algokit_utils.AppCallMethodCallParams:
+        params = params or algokit_utils.CommonAppCallParams()
+        if not self.direct:
+            return app_client.params.call(self._method_call_params(args, params))
+        # The bare call resolves the sender, signer and app ID exactly as a method call would.
+        bare = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**params.__dict__),
+            on_complete=params.on_complete or OnComplete.NoOpOC,
+        )
+        return algokit_utils.AppCallMethodCallParams(
+            **{name: getattr(bare, name) for name in _METHOD_CALL_FIELDS},
+            method=self.method,
+            args=self.encode_args(args),
+        )
+
+    def create_transaction(
+        self,
+        app_client: algokit_utils.AppClient,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> algokit_utils.BuiltTransactions:
+        return app_client.algorand.create_transaction.app_call_method_call(
+            self.call_params(app_client, args, params)
+        )
+
+    def send(
+        self,
+        app_client: algokit_utils.AppClient,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+        send_params: algokit_utils.SendParams | None,
+    ) -> algokit_utils.SendAppTransactionResult:
+        if self.readonly or not self.direct:
+            params = params or algokit_utils.CommonAppCallParams()
+            return app_client.send.call(self._method_call_params(args, params), send_params=send_params)
+        result = app_client.algorand.send.app_call_method_call(
+            self.call_params(app_client, args, params), send_params
+        )
+        return algokit_utils.SendAppTransactionResult(
+            **{**result.__dict__, "abi_return": self.arc56_value(result.abi_return)}
+        )
+
+
+_CODECS: dict[str, _MethodCodec] = {codec.signature: codec for codec in (
+    _MethodCodec(
+        'create(uint64,uint64)void',
+        args_class=CreateArgs,
+        arg_structs={},
+        returns_struct=None,
+        returns_class=None,
+        direct=True,
+        readonly=False,
+    ),
+    _MethodCodec(
+        'buy(uint64,uint64,uint64,uint64,pay)void',
+        args_class=BuyArgs,
+        arg_structs={},
+        returns_struct=None,
+        returns_class=None,
+        direct=True,
+        readonly=False,
+    ),
+    _MethodCodec(
+        'paint(uint64,uint64,uint64,uint64,byte[])void',
+        args_class=PaintArgs,
+        arg_structs={},
+        returns_struct=None,
+        returns_class=None,
+        direct=True,
+        readonly=False,
+    ),
+)}
+_CODECS.update({name: _CODECS[signature] for name, signature in {'buy': 'buy(uint64,uint64,uint64,uint64,pay)void', 'create': 'create(uint64,uint64)void', 'paint': 'paint(uint64,uint64,uint64,uint64,byte[])void'}.items()})
+
+
+# Batched calls, added by smart_contracts/_helpers/client_batches.py.
+
+_MAX_GROUP_SIZE = 16
+
+
+def _send_many(
+    codec: _MethodCodec,
+    app_client: algokit_utils.AppClient,
+    calls: typing.Iterable[object],
+    params: algokit_utils.CommonAppCallParams | None,
+    send_params: algokit_utils.SendParams | None,
+    simulate: bool,
+    max_in_flight: int,
+) -> typing.Iterator[object]:
+    """Send one call per item of `calls` in full groups, yielding the decoded returns in call order.
+
+    Groups are sent as the returned iterator is consumed, at most `max_in_flight` ahead of it. If
+    a group fails to simulate or send, the groups not yet sent are abandoned and the error is
+    raised; groups already sent are not rolled back.
+    """
+    import concurrent.futures  # Imported here, to keep it off the client's import time.
+
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+    # Repeats of a call would be the same transaction, so each repeat gets a distinct note.
+    repeats: collections.Counter[str] = collections.Counter()
+
+    def method_call(args: object) -> algokit_utils.AppCallMethodCallParams:
+        call = codec.call_params(app_client, args, params)
+        key = repr((call.args, call.note))
+        repeat = repeats[key]
+        repeats[key] += 1
+        if repeat:
+            note = call.note.encode() if isinstance(call.note, str) else call.note or b""
+            call = dataclasses.replace(call, note=note + f"#{repeat}".encode())
+        return call
+
+    def send_group(group: list[algokit_utils.AppCallMethodCallParams]) -> list[object]:
+        composer = app_client.algorand.new_group()
+        for call in group:
+            composer.add_app_call_method_call(call)
+        if simulate:
+            # Raises if any call in the group fails or runs out of opcode budget.
+            composer.simulate(skip_signatures=True)
+        result = composer.send(send_params)
+        return [codec.decode(abi_return) for abi_return in result.returns]
+
+    pending = iter(calls)
+    in_flight: collections.deque[concurrent.futures.Future[list[object]]] = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="batch-call") as executor:
+        try:
+            while group := [method_call(args) for _, args in zip(range(_MAX_GROUP_SIZE), pending)]:
+                if len(in_flight) >= max_in_flight:
+                    yield from in_flight.popleft().result()
+                in_flight.append(executor.submit(send_group, group))
+            while in_flight:
+                yield from in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
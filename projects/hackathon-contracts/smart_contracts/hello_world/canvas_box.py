@@ -0,0 +1,78 @@
+from collections.abc import Mapping
+
+import numpy as np
+from algokit_utils import AlgorandClient
+from pixel_state import PixelState
+
+# Must match the box keys and layout used by PixelCanvas in contract.py: the canvas is split
+# into bands of whole rows, each in a box of at most MAX_BOX_BYTES keyed by its band index.
+CANVAS_BAND_PREFIX = b"c"
+COLOR_BYTES = 3
+MAX_BOX_BYTES = 1_024
+
+
+def band_rows(cols: int) -> int:
+    """The number of rows in each band of a canvas `cols` pixels wide."""
+    return MAX_BOX_BYTES // (cols * COLOR_BYTES)
+
+
+def band_key(band: int) -> bytes:
+    """The box name of a band, as `BoxMap(UInt64, Bytes, key_prefix=b"c")` derives it."""
+    return CANVAS_BAND_PREFIX + band.to_bytes(8, "big")
+
+
+def join_bands(bands: Mapping[int, bytes], rows: int, cols: int) -> bytes:
+    """Join the canvas's band boxes, by band index, back into one row-major canvas.
+
+    Bands are only created once a pixel in them is painted, so missing bands read as unpainted.
+    """
+    canvas = bytearray(rows * cols * COLOR_BYTES)
+    band_bytes = band_rows(cols) * cols * COLOR_BYTES
+    for band, data in bands.items():
+        start = band * band_bytes
+        if start + len(data) > len(canvas) or len(data) > band_bytes:
+            raise ValueError(
+                f"Band {band} of {len(data)} bytes does not fit a {rows}x{cols} canvas"
+            )
+        canvas[start : start + len(data)] = data
+    return bytes(canvas)
+
+
+def decode_canvas(data: bytes, rows: int, cols: int) -> PixelState:
+    """Unpack the contract's row-major RGB canvas, as joined by `join_bands`, into a PixelState.
+
+    An all-zero triple is an unpainted pixel, so painting pure black reads back as uncolored.
+    """
+    if len(data) != rows * cols * COLOR_BYTES:
+        raise ValueError(
+            f"Canvas holds {len(data)} bytes, expected {rows * cols * COLOR_BYTES}"
+        )
+    rgb = np.frombuffer(data, dtype=np.uint8).reshape(-1, COLOR_BYTES).astype(np.uint32)
+    packed = (rgb[:, 0] << 24) | (rgb[:, 1] << 16) | (rgb[:, 2] << 8)
+    state = PixelState(rows, cols)
+    state.colors[:] = np.where(packed != 0, packed | 0xFF, 0)
+    return state
+
+
+def encode_region(state: PixelState, x: int, y: int, w: int, h: int) -> bytes:
+    """Pack the colors of a region of `state` into the `colors` argument of `PixelCanvas.paint`."""
+    region = state.colors.reshape(state.rows, state.cols)[y : y + h, x : x + w]
+    rgb = np.stack(
+        [(region >> 24) & 0xFF, (region >> 16) & 0xFF, (region >> 8) & 0xFF], axis=-1
+    )
+    return rgb.astype(np.uint8).tobytes()
+
+
+def read_canvas(algorand: AlgorandClient, app_id: int) -> PixelState:
+    """Read the whole canvas of a deployed PixelCanvas app, one box read per painted band."""
+    global_state = algorand.app.get_global_state(app_id)
+    rows = int(global_state["height"].value)
+    cols = int(global_state["width"].value)
+    bands = {
+        int.from_bytes(
+            box.name_raw[len(CANVAS_BAND_PREFIX) :], "big"
+        ): algorand.app.get_box_value(app_id, box.name_raw)
+        for box in algorand.app.get_box_names(app_id)
+        if box.name_raw.startswith(CANVAS_BAND_PREFIX)
+    }
+    return decode_canvas(join_bands(bands, rows, cols), rows, cols)
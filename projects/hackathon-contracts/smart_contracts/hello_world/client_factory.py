@@ -0,0 +1,193 @@
+import functools
+import json
+import logging
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from urllib import parse
+
+import httpx
+from algokit_utils import (
+    AlgoClientNetworkConfig,
+    AlgorandClient,
+    AlgoSdkClients,
+    ClientManager,
+    SigningAccount,
+)
+from algosdk import constants
+from algosdk.error import AlgodHTTPError, AlgodResponseError
+from algosdk.v2client.algod import AlgodClient, api_version_path_prefix
+from instrumentation import (
+    METRICS,
+    TimedSigner,
+    algod_request_phase,
+    export_from_environment,
+    record_phase,
+)
+from pixel_minting import ROUND_TIME_SECONDS
+
+# Enough keep-alive connections for the widest pipelined minting window plus UI reads.
+POOL_SIZE = 32
+# Transactions built from suggested params are valid for algokit's default window of 10 rounds
+# from the round they were fetched in (1000 on LocalNet), so reusing them for longer than about a
+# round eats into that window and can get transactions rejected as expired.
+SUGGESTED_PARAMS_TTL_ROUNDS = 1
+
+_lock = threading.Lock()
+
+# httpx logs every request at INFO, which drowns out the scripts' own INFO logs.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpcore").setLevel(logging.WARNING)
+
+
+class PooledAlgodClient(AlgodClient):
+    """An AlgodClient that sends every request over one pool of keep-alive HTTP connections.
+
+    The SDK's client opens a new connection with `urlopen` for each request; this one keeps up
+    to `pool_size` connections open and shares them across threads. Responses and errors are
+    the same as the SDK's. Each request's time is reported to the submission being tracked.
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        pool_size: int = POOL_SIZE,
+    ) -> None:
+        super().__init__(algod_token, algod_address, headers)
+        self.session = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            )
+        )
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: Mapping[str, object] | Sequence[tuple[str, object]] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> dict[str, object] | bytes:
+        phase = algod_request_phase(method, requrl)
+        header = {
+            "User-Agent": "py-algorand-sdk",
+            **(self.headers or {}),
+            **(headers or {}),
+        }
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            # Encode like the SDK does, so e.g. booleans are sent the same way.
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        started = time.perf_counter()
+        try:
+            response = self.session.request(
+                method,
+                self.algod_address + requrl,
+                content=data,
+                headers=header,
+                timeout=timeout,
+            )
+        finally:
+            record_phase(phase, time.perf_counter() - started)
+            METRICS.inc("algod_requests_total", phase=phase)
+        if response.is_error:
+            try:
+                body: dict[str, str] = response.json()
+            except ValueError:
+                raise AlgodHTTPError(response.text, response.status_code) from None
+            raise AlgodHTTPError(
+                body.get("message", response.text),
+                response.status_code,
+                body.get("data"),
+            )
+        if response_format != "json":
+            return response.content
+        if not response.content:
+            # Some algod endpoints answer 200 OK with an empty body.
+            return {}
+        try:
+            parsed: dict[str, object] = json.loads(response.content)
+        except ValueError as e:
+            raise AlgodResponseError("Failed to parse JSON response from algod") from e
+        return parsed
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def _pooled_algod(config: AlgoClientNetworkConfig) -> PooledAlgodClient:
+    token = config.token or ""
+    return PooledAlgodClient(
+        token, config.full_url(), headers={constants.algod_auth_header: token}
+    )
+
+
+@functools.cache  # type: ignore[misc]
+def get_algorand() -> AlgorandClient:
+    """The process-wide AlgorandClient, configured from the environment (LocalNet by default).
+
+    Its algod connections are pooled and kept alive, and suggested params are cached for
+    about SUGGESTED_PARAMS_TTL_ROUNDS rounds instead of being fetched for every transaction.
+    Submission metrics are exported as configured by the environment, see `instrumentation`.
+    """
+    export_from_environment()
+    config = ClientManager.get_config_from_environment_or_localnet()
+    algorand = AlgorandClient(
+        AlgoSdkClients(
+            algod=_pooled_algod(config.algod_config),
+            indexer=(
+                ClientManager.get_indexer_client(config.indexer_config)
+                if config.indexer_config
+                else None
+            ),
+            kmd=(
+                ClientManager.get_kmd_client(config.kmd_config)
+                if config.kmd_config
+                else None
+            ),
+        )
+    )
+    # algokit documents this timeout in milliseconds but adds it to `time.time()`, i.e. as seconds.
+    algorand.set_suggested_params_cache_timeout(
+        int(SUGGESTED_PARAMS_TTL_ROUNDS * ROUND_TIME_SECONDS)
+    )
+    return algorand
+
+
+def get_account(name: str = "DEPLOYER") -> SigningAccount:
+    """The account for `name` from the environment, resolved once per process.
+
+    On LocalNet resolving an account may be a KMD round trip; after the first call the account
+    and its signer, which stays registered on `get_algorand()` and reports its signing time,
+    are reused.
+    """
+    with _lock:
+        return _get_account(name)
+
+
+@functools.cache  # type: ignore[misc]
+def _get_account(name: str) -> SigningAccount:
+    algorand = get_algorand()
+    account = algorand.account.from_environment(name)
+    algorand.account.set_signer(account.address, TimedSigner(account.signer))
+    return account
+
+
+def reset() -> None:
+    """Close the pooled connections and forget the cached client and accounts."""
+    with _lock:
+        if get_algorand.cache_info().currsize:
+            algod = get_algorand().client.algod
+            if isinstance(algod, PooledAlgodClient):
+                algod.close()
+        get_algorand.cache_clear()
+        _get_account.cache_clear()
@@ -0,0 +1,138 @@
+import dataclasses
+import logging
+import time
+
+from algokit_utils import AlgorandClient, TransactionComposer
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from instrumentation import METRICS, track_submission
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class Confirmation:
+    txid: str
+    confirmed_round: int
+    # Set for asset creates, from the block's apply data.
+    asset_id: int | None = None
+
+
+class ConfirmationTimeout(Exception):  # noqa: N818
+    """Transactions whose validity window passed without them appearing in a block."""
+
+    def __init__(self, txids: list[str]) -> None:
+        super().__init__(
+            f"{len(txids)} transaction(s) expired without confirming: {', '.join(txids[:5])}"
+        )
+        self.txids = txids
+
+
+@dataclasses.dataclass
+class _Tracked:
+    last_valid: int
+    wants_block: bool
+
+
+class ConfirmationTracker:
+    """Submits groups without waiting on each one, then confirms them all with one wait per round.
+
+    `algorand.send.*` and `composer.send()` poll pending info for each transaction until it
+    confirms. The tracker instead waits for the next block with `status/wait-for-block-after`
+    and reads the block's transaction IDs, resolving every tracked transaction in that round
+    with one request. The block itself is only fetched for rounds holding tracked asset creates,
+    whose asset IDs come from its apply data.
+    """
+
+    def __init__(self, algorand: AlgorandClient) -> None:
+        self.algod = algorand.client.algod
+        # Nothing is tracked yet, so no block up to the current one can hold a tracked transaction.
+        self.scanned_round: int = self.algod.status()["last-round"]  # type: ignore[call-overload]
+        self._pending: dict[str, _Tracked] = {}
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(
+        self, composer: TransactionComposer, operation: str = "group"
+    ) -> list[str]:
+        """Build, sign and submit a group without waiting for it, returning its transaction IDs."""
+        with track_submission(operation, composer.count()):
+            atc = composer.build().atc
+            signed = atc.gather_signatures()
+            self.algod.send_transactions(signed)
+        return self._track([stxn.transaction for stxn in signed])
+
+    def submit_group(
+        self,
+        txns: list[transaction.Transaction],
+        signer: TransactionSigner,
+        operation: str = "group",
+    ) -> list[str]:
+        """Sign an already grouped list of transactions with `signer` and submit it without waiting."""
+        with track_submission(operation, len(txns)):
+            signed = signer.sign_transactions(txns, list(range(len(txns))))
+            self.algod.send_transactions(signed)
+        return self._track(txns)
+
+    def _track(self, txns: list[transaction.Transaction]) -> list[str]:
+        txids = []
+        for txn in txns:
+            txid: str = txn.get_txid()
+            last_valid: int = txn.last_valid_round
+            txn_type: str = txn.type
+            self._pending[txid] = _Tracked(last_valid, wants_block=txn_type == "acfg")
+            txids.append(txid)
+        return txids
+
+    def poll(self) -> list[Confirmation]:
+        """Wait for the next round, then resolve every tracked transaction confirmed since the last poll."""
+        if not self._pending:
+            return []
+        started = time.perf_counter()
+        status = self.algod.status_after_block(self.scanned_round)
+        last_round = int(status["last-round"])  # type: ignore[call-overload]
+        METRICS.observe("algorand_round_wait_seconds", time.perf_counter() - started)
+
+        confirmed: list[Confirmation] = []
+        for round_ in range(self.scanned_round + 1, last_round + 1):
+            confirmed.extend(self._resolve_round(round_))
+        self.scanned_round = last_round
+
+        expired = [
+            txid
+            for txid, tracked in self._pending.items()
+            if tracked.last_valid <= last_round
+        ]
+        if expired:
+            for txid in expired:
+                del self._pending[txid]
+            raise ConfirmationTimeout(expired)
+        return confirmed
+
+    def wait_all(self) -> list[Confirmation]:
+        confirmed: list[Confirmation] = []
+        while self._pending:
+            confirmed.extend(self.poll())
+        return confirmed
+
+    def _resolve_round(self, round_: int) -> list[Confirmation]:
+        block_txids: dict[str, list[str] | None] = self.algod.get_block_txids(round_)  # type: ignore[assignment]
+        txids = block_txids["blockTxids"] or []
+        ours = [
+            (index, txid) for index, txid in enumerate(txids) if txid in self._pending
+        ]
+        if not ours:
+            return []
+        block_txns: list[dict[str, int]] | None = None
+        if any(self._pending[txid].wants_block for _, txid in ours):
+            # The block lists transactions in the same order as their IDs.
+            block: dict[str, dict[str, list[dict[str, int]]]] = self.algod.block_info(round_num=round_)  # type: ignore[assignment]
+            block_txns = block["block"]["txns"]
+        confirmed = []
+        for index, txid in ours:
+            del self._pending[txid]
+            asset_id = block_txns[index].get("caid") if block_txns is not None else None
+            confirmed.append(Confirmation(txid, round_, asset_id))
+        return confirmed
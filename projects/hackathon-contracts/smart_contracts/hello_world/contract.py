@@ -1,4 +1,16 @@
-from algopy import ARC4Contract, String
+from algopy import (
+    ARC4Contract,
+    BoxMap,
+    Bytes,
+    Global,
+    String,
+    Txn,
+    UInt64,
+    gtxn,
+    op,
+    subroutine,
+    urange,
+)
 from algopy.arc4 import abimethod
 
 
@@ -6,3 +18,131 @@ class HelloWorld(ARC4Contract):
     @abimethod()
     def hello(self, name: String) -> String:
         return "Hello, testing " + name
+
+
+# Colors are packed as 3 bytes of RGB per pixel, row-major. Each box reference in a transaction
+# only buys 1KB of box I/O and a transaction holds at most 8 references, so the canvas is split
+# into bands of whole rows of at most 1KB each. The whole canvas is capped at 32KB.
+COLOR_BYTES = 3
+ADDRESS_BYTES = 32
+MAX_BOX_BYTES = 1_024
+MAX_CANVAS_BYTES = 32_768
+# Owners are stored one row per box as packed 32-byte addresses, so a region's rows are
+# checked and written with one extract/replace each. A row box must fit in 1KB too, which caps
+# the canvas at 32 pixels wide, and so a band at no fewer than 10 rows. A region of at most
+# 6 rows then touches at most 6 owner rows and 2 bands: 8 box references.
+MAX_REGION_HEIGHT = 6
+PRICE_PER_PIXEL = 2_000_000  # microAlgos
+
+
+class PixelCanvas(ARC4Contract):
+    """A whole pixel canvas in one app, in place of one ASA per pixel.
+
+    Pixels are bought and painted a rectangular region at a time, so a region costs one app
+    call rather than one transaction per pixel. `x` is the column and `y` the row.
+
+    Boxes are created the first time a region touches them, so the app account must be funded
+    for their minimum balance before buying or painting.
+    """
+
+    def __init__(self) -> None:
+        self.width = UInt64(0)
+        self.height = UInt64(0)
+        self.band_rows = UInt64(0)
+        self.canvas = BoxMap(UInt64, Bytes, key_prefix=b"c")
+        self.owners = BoxMap(UInt64, Bytes, key_prefix=b"o")
+
+    @abimethod(create="require")
+    def create(self, width: UInt64, height: UInt64) -> None:
+        assert width > 0 and height > 0, "empty canvas"
+        assert (
+            width * ADDRESS_BYTES <= MAX_BOX_BYTES
+        ), "canvas too wide for one owners box per row"
+        assert width * height * COLOR_BYTES <= MAX_CANVAS_BYTES, "canvas too large"
+        self.width = width
+        self.height = height
+        self.band_rows = MAX_BOX_BYTES // (width * COLOR_BYTES)
+
+    @abimethod()
+    def buy(
+        self,
+        x: UInt64,
+        y: UInt64,
+        w: UInt64,
+        h: UInt64,
+        payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """Buy every pixel in a region for the sender, paying PRICE_PER_PIXEL for each."""
+        self._check_region(x, y, w, h)
+        assert (
+            payment.receiver == Global.current_application_address
+        ), "payment must go to the app"
+        assert payment.amount >= w * h * PRICE_PER_PIXEL, "payment too small for region"
+
+        row_size = self.width * ADDRESS_BYTES
+        offset = x * ADDRESS_BYTES
+        unowned = op.bzero(w * ADDRESS_BYTES)
+        sender_run = _repeat(Txn.sender.bytes, w)
+        for row in urange(y, y + h):
+            owners_row = self.owners.box(row)
+            # No-op if the row's owner box already exists.
+            owners_row.create(size=row_size)
+            assert (
+                owners_row.extract(offset, w * ADDRESS_BYTES) == unowned
+            ), "pixel already owned"
+            owners_row.replace(offset, sender_run)
+
+    @abimethod()
+    def paint(self, x: UInt64, y: UInt64, w: UInt64, h: UInt64, colors: Bytes) -> None:
+        """Paint a region owned by the sender with `colors`, w * h packed RGB triples in row-major order."""
+        self._check_region(x, y, w, h)
+        row_bytes = w * COLOR_BYTES
+        assert (
+            colors.length == row_bytes * h
+        ), "colors must hold 3 bytes per pixel in region"
+
+        # State is read once up front: a region of MAX_REGION_HEIGHT full-width rows has to
+        # fit in one app call's opcode budget.
+        band_rows = self.band_rows
+        height = self.height
+        canvas_row_bytes = self.width * COLOR_BYTES
+        offset = x * ADDRESS_BYTES
+        run_bytes = w * ADDRESS_BYTES
+        color_offset = x * COLOR_BYTES
+        sender_run = _repeat(Txn.sender.bytes, w)
+        start = UInt64(0)
+        for row in urange(y, y + h):
+            assert (
+                self.owners.box(row).extract(offset, run_bytes) == sender_run
+            ), "pixel not owned"
+            band = row // band_rows
+            band_box = self.canvas.box(band)
+            band_row = row % band_rows
+            if row == y or band_row == 0:
+                # The region's first row in this band: create the band's box, a no-op if it
+                # exists. The last band only holds the rows left over.
+                rows_in_band = height - band * band_rows
+                if rows_in_band > band_rows:
+                    rows_in_band = band_rows
+                band_box.create(size=rows_in_band * canvas_row_bytes)
+            band_box.replace(
+                band_row * canvas_row_bytes + color_offset,
+                op.extract(colors, start, row_bytes),
+            )
+            start += row_bytes
+
+    @subroutine
+    def _check_region(self, x: UInt64, y: UInt64, w: UInt64, h: UInt64) -> None:
+        assert w > 0 and h > 0, "empty region"
+        assert h <= MAX_REGION_HEIGHT, "region too tall"
+        assert x + w <= self.width and y + h <= self.height, "region outside canvas"
+
+
+@subroutine
+def _repeat(value: Bytes, count: UInt64) -> Bytes:
+    """`value` `count` times over, for a `count` of at least 1, built by doubling."""
+    length = value.length * count
+    result = value
+    while result.length < length:
+        result += result
+    return op.extract(result, 0, length)
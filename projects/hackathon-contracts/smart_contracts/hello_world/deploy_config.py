@@ -1,6 +1,22 @@
 import logging
-from algokit_utils import AlgorandClient, AssetCreateParams
+import sys
+from pathlib import Path
+
+from client_factory import get_account, get_algorand
 from pixel_grid import PixelGrid
+from pixel_manifest import (
+    MANIFEST_PATH,
+    PixelManifest,
+    find_minted_pixels,
+    write_asset_cache,
+)
+from pixel_minting import (
+    Pixel,
+    mint_pixel_assets_batched,
+    mint_pixel_assets_pipelined,
+    mint_pixel_assets_sequential,
+    mint_pixel_assets_tracked,
+)
 
 # --- Configure logging ---
 logging.basicConfig(
@@ -10,44 +26,81 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # --- Config ---
-GRID_WIDTH = 5   # number of columns
+GRID_WIDTH = 5  # number of columns
 GRID_HEIGHT = 5  # number of rows
 
 
-def create_pixel_assets(rows=GRID_HEIGHT, cols=GRID_WIDTH):
-    """Create ASA assets for each pixel (x,y) on LocalNet."""
-    algorand = AlgorandClient.from_environment()
-    deployer = algorand.account.from_environment("DEPLOYER")
+def create_pixel_assets(
+    rows: int = GRID_HEIGHT,
+    cols: int = GRID_WIDTH,
+    mode: str = "pipelined",
+    window: int | None = None,
+    manifest_path: Path = MANIFEST_PATH,
+) -> dict[Pixel, int]:
+    """Create ASA assets for each pixel (x,y) on LocalNet.
+
+    `mode` selects how the asset creates are submitted:
+      - "sequential": one transaction per pixel, each confirmed before the next.
+      - "batched": atomic groups of up to 16 transactions, submitted back to back.
+      - "pipelined": like "batched", but with up to `window` groups in flight at once
+        (defaults to a small window on LocalNet and a wider one on public networks).
+      - "tracked": keeps up to `window` groups submitted without waiting on each one, and
+        confirms them with one wait per round instead of polling every transaction.
+
+    Progress is written to the manifest at `manifest_path` as each transaction or group
+    confirms. On a rerun, pixels already in the manifest or already created by the deployer
+    on chain are reused, and only the missing ones are minted.
+    """
+    algorand = get_algorand()
+    deployer = get_account("DEPLOYER")
 
     logger.info(f"Using LocalNet deployer: {deployer.address}")
-    created_assets = {}
-
-    for row in range(rows):
-        for col in range(cols):
-            coord_name = f"{row}x{col}"
-            unit_name = coord_name[:8]          # ≤8 chars
-            asset_name = f"Pixel_{coord_name}"  # ≤32 chars
-
-            params = AssetCreateParams(
-                sender=deployer.address,
-                total=1,
-                decimals=0,
-                default_frozen=False,
-                unit_name=unit_name,
-                asset_name=asset_name,
-                url="http://localhost",
-            )
-
-            result = algorand.send.asset_create(params)
-            asset_id = result.asset_id
-            created_assets[(row, col)] = asset_id
-            logger.info(f"Created ASA for pixel ({row},{col}) → Asset ID {asset_id}")
+    manifest = PixelManifest.open(
+        manifest_path, algorand.client.network().genesis_hash, deployer.address
+    )
+    manifest.reconcile(find_minted_pixels(algorand, deployer.address))
+
+    pixels = [(row, col) for row in range(rows) for col in range(cols)]
+    missing = [pixel for pixel in pixels if pixel not in manifest]
+    logger.info(
+        f"{len(pixels) - len(missing)} pixels already minted, minting {len(missing)}"
+    )
+
+    if mode == "pipelined":
+        mint_pixel_assets_pipelined(
+            algorand,
+            deployer.address,
+            missing,
+            window=window,
+            on_minted=manifest.record,
+        )
+    elif mode == "tracked":
+        mint_pixel_assets_tracked(
+            algorand,
+            deployer.address,
+            missing,
+            window=window,
+            on_minted=manifest.record,
+        )
+    elif mode == "batched":
+        mint_pixel_assets_batched(
+            algorand, deployer.address, missing, on_minted=manifest.record
+        )
+    elif mode == "sequential":
+        mint_pixel_assets_sequential(
+            algorand, deployer.address, missing, on_minted=manifest.record
+        )
+    else:
+        raise ValueError(f"Unknown mint mode: {mode}")
+
+    created_assets = {pixel: manifest.entries[pixel].asset_id for pixel in pixels}
+    write_asset_cache(manifest_path.with_suffix(".bin"), rows, cols, created_assets)
 
     logger.info(f"✅ Created {len(created_assets)} pixel ASAs successfully.")
     return created_assets
 
 
-def deploy() -> dict:
+def deploy() -> dict[Pixel, int]:
     """
     AlgoKit-compatible deploy function.
     Will be called automatically via `algokit project deploy`.
@@ -60,15 +113,16 @@ def deploy() -> dict:
 
 
 if __name__ == "__main__":
-    pixel_assets = deploy()
-    app = PixelGrid(rows=GRID_HEIGHT, cols=GRID_WIDTH, pixel_size=25, pixel_assets=pixel_assets)
+    if "--reuse-assets" in sys.argv:
+        app = PixelGrid.from_manifest(MANIFEST_PATH, pixel_size=25)
+    else:
+        pixel_assets = deploy()
+        app = PixelGrid(
+            rows=GRID_HEIGHT, cols=GRID_WIDTH, pixel_size=25, pixel_assets=pixel_assets
+        )
     app.mainloop()
 
 
-
-
-
-
 # import logging
 
 # import algokit_utils
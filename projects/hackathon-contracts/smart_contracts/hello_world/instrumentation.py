@@ -0,0 +1,261 @@
+import atexit
+import bisect
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+logger = logging.getLogger(__name__)
+
+# Every submission is split into these phases. "build" is whatever the other three leave over:
+# suggested params, composing the group and algokit's own bookkeeping.
+PHASES = ("build", "sign", "submit", "confirm")
+# Histogram bucket upper bounds in seconds, spanning a LocalNet round trip to several public-network rounds.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Set to write metrics when the process exits (.prom for Prometheus text, anything else for JSON),
+# or to serve Prometheus text on http://localhost:<port>/metrics.
+METRICS_FILE_ENV = "ALGORAND_METRICS_FILE"
+METRICS_PORT_ENV = "ALGORAND_METRICS_PORT"
+
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclasses.dataclass
+class Histogram:
+    counts: list[int] = dataclasses.field(
+        default_factory=lambda: [0] * (len(BUCKETS) + 1)
+    )
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class Metrics:
+    """Counters and latency histograms for Algorand submissions, safe to update from any thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counters: dict[tuple[str, Labels], float] = {}
+        self.histograms: dict[tuple[str, Labels], Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.histograms.setdefault(key, Histogram()).observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_json(self) -> dict[str, list[dict[str, object]]]:
+        with self._lock:
+            return {
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                "histograms": [
+                    {
+                        "name": name,
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": histogram.total,
+                        "buckets": dict(
+                            zip(
+                                [*map(str, BUCKETS), "+Inf"],
+                                histogram.counts,
+                                strict=True,
+                            )
+                        ),
+                    }
+                    for (name, labels), histogram in sorted(self.histograms.items())
+                ],
+            }
+
+    def to_prometheus(self) -> str:
+        """Render in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f"# TYPE {name} counter")
+                for (counter, labels), value in sorted(self.counters.items()):
+                    if counter == name:
+                        lines.append(f"{name}{_format_labels(labels)} {value:g}")
+            for name in sorted({name for name, _ in self.histograms}):
+                lines.append(f"# TYPE {name} histogram")
+                for (histogram_name, labels), histogram in sorted(
+                    self.histograms.items()
+                ):
+                    if histogram_name != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(
+                        [*map(str, BUCKETS), "+Inf"], histogram.counts, strict=True
+                    ):
+                        cumulative += count
+                        lines.append(
+                            f"{name}_bucket{_format_labels((*labels, ('le', bound)))} {cumulative}"
+                        )
+                    lines.append(
+                        f"{name}_sum{_format_labels(labels)} {histogram.total:g}"
+                    )
+                    lines.append(
+                        f"{name}_count{_format_labels(labels)} {histogram.count}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        text = (
+            self.to_prometheus()
+            if path.suffix == ".prom"
+            else json.dumps(self.to_json(), indent=2) + "\n"
+        )
+        path.write_text(text, encoding="utf-8")
+
+
+def _format_labels(labels: Labels) -> str:
+    return (
+        "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+        if labels
+        else ""
+    )
+
+
+METRICS = Metrics()
+
+_local = threading.local()
+
+
+@contextmanager
+def track_submission(operation: str, transactions: int) -> Iterator[None]:
+    """Time one `send` of `transactions` transactions, split into PHASES.
+
+    Sign, submit and confirm time is reported by `record_phase` from the signer and the algod
+    client while the send runs on this thread.
+    """
+    phases = dict.fromkeys(PHASES, 0.0)
+    _local.phases = phases
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        _local.phases = None
+        elapsed = time.perf_counter() - started
+        phases["build"] = max(
+            0.0, elapsed - phases["sign"] - phases["submit"] - phases["confirm"]
+        )
+        for phase, seconds in phases.items():
+            METRICS.observe(
+                "algorand_submission_phase_seconds",
+                seconds,
+                operation=operation,
+                phase=phase,
+            )
+        METRICS.observe("algorand_submission_seconds", elapsed, operation=operation)
+        METRICS.inc("algorand_submissions_total", operation=operation, outcome=outcome)
+        METRICS.inc(
+            "algorand_transactions_total",
+            transactions,
+            operation=operation,
+            outcome=outcome,
+        )
+        logger.debug(
+            f"{operation} x{transactions} {outcome} in {elapsed:.3f}s: "
+            + ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in phases.items())
+        )
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """Add `seconds` to `phase` of the submission being tracked on this thread, if any."""
+    phases: dict[str, float] | None = getattr(_local, "phases", None)
+    if phases is not None:
+        phases[phase] += seconds
+
+
+def algod_request_phase(method: str, path: str) -> str:
+    """The submission phase an algod request belongs to."""
+    if method == "POST" and path == "/transactions":
+        return "submit"
+    if path.startswith(("/transactions/pending/", "/status", "/blocks/")):
+        return "confirm"
+    return "build"
+
+
+class TimedSigner(TransactionSigner):
+    """Wraps a signer so the time spent signing is reported as the "sign" phase."""
+
+    def __init__(self, signer: TransactionSigner) -> None:
+        super().__init__()
+        self.signer = signer
+
+    def sign_transactions(
+        self, txn_group: list[transaction.Transaction], indexes: list[int]
+    ) -> list[transaction.GenericSignedTransaction]:
+        started = time.perf_counter()
+        try:
+            return self.signer.sign_transactions(txn_group, indexes)
+        finally:
+            record_phase("sign", time.perf_counter() - started)
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve METRICS as Prometheus text on /metrics from a background thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = METRICS.to_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics").start()
+    logger.info(
+        f"Serving Algorand metrics on http://{host}:{server.server_address[1]}/metrics"
+    )
+    return server
+
+
+_exporters_started = False
+
+
+def export_from_environment() -> None:
+    """Start the exporters requested by METRICS_FILE_ENV and METRICS_PORT_ENV, once per process."""
+    global _exporters_started
+    if _exporters_started:
+        return
+    _exporters_started = True
+    if path := os.getenv(METRICS_FILE_ENV):
+        atexit.register(METRICS.write, Path(path))
+    if port := os.getenv(METRICS_PORT_ENV):
+        serve_metrics(int(port))
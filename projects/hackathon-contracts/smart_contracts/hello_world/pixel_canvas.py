@@ -0,0 +1,70 @@
+import tkinter as tk
+from collections.abc import Callable
+
+# Largest side, in screen pixels, the grid is drawn at. Cells shrink (down to 1px) to fit big grids.
+MAX_CANVAS_SIZE = 1000
+# Grid lines are only drawn when cells are big enough for them not to hide the colors.
+MIN_GRID_LINE_CELL_SIZE = 4
+GRID_LINE_COLOR = "gray"
+
+
+class PixelCanvas(tk.Canvas):
+    """Draws a rows x cols pixel grid as a single image on a single canvas.
+
+    Each cell is a block of the backing `PhotoImage`, so painting a cell is one in-place image
+    update and the number of Tk objects does not grow with the grid. Clicks are mapped back to a
+    cell from the mouse coordinates and passed to `on_click(row, col)`.
+    """
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        rows: int,
+        cols: int,
+        pixel_size: int,
+        on_click: Callable[[int, int], None],
+        background: str = "white",
+    ) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = max(1, min(pixel_size, MAX_CANVAS_SIZE // max(rows, cols, 1)))
+        self.on_click = on_click
+        width = cols * self.cell_size
+        height = rows * self.cell_size
+        super().__init__(
+            master, width=width, height=height, highlightthickness=0, bg=background
+        )
+
+        self.image = tk.PhotoImage(width=width, height=height)
+        self.image.put(background, to=(0, 0, width, height))
+        self.create_image(0, 0, image=self.image, anchor="nw")
+        if self.cell_size >= MIN_GRID_LINE_CELL_SIZE:
+            self._draw_grid_lines(width, height)
+
+        self.bind("<Button-1>", self._on_click)
+
+    def _draw_grid_lines(self, width: int, height: int) -> None:
+        for row in range(self.rows + 1):
+            y = min(row * self.cell_size, height - 1)
+            self.create_line(0, y, width, y, fill=GRID_LINE_COLOR)
+        for col in range(self.cols + 1):
+            x = min(col * self.cell_size, width - 1)
+            self.create_line(x, 0, x, height, fill=GRID_LINE_COLOR)
+
+    def cell_at(self, x: float, y: float) -> tuple[int, int] | None:
+        """Return the (row, col) under canvas coordinates (x, y), or None outside the grid."""
+        row, col = int(y) // self.cell_size, int(x) // self.cell_size
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def paint(self, row: int, col: int, color: str) -> None:
+        """Repaint a single cell."""
+        x0, y0 = col * self.cell_size, row * self.cell_size
+        self.image.put(color, to=(x0, y0, x0 + self.cell_size, y0 + self.cell_size))
+
+    def _on_click(self, event: "tk.Event[tk.Misc]") -> None:
+        # The canvas never scrolls, so the event's window coordinates are canvas coordinates.
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_click(*cell)
@@ -1,7 +1,19 @@
+import logging
+import sys
 import tkinter as tk
+from collections.abc import Mapping
+from functools import cached_property
+from pathlib import Path
 from tkinter import colorchooser
-import logging
-from algokit_utils import AlgorandClient, PaymentParams, AlgoAmount, AssetTransferParams
+
+from algokit_utils import AlgorandClient, SigningAccount
+from client_factory import get_account, get_algorand
+from pixel_canvas import PixelCanvas
+from pixel_manifest import MANIFEST_PATH, load_pixel_assets
+from pixel_minting import Pixel
+from pixel_settlement import SettlementSummary, settle_pixels
+from pixel_state import PixelState
+from tx_worker import NULL_REPORTER, Reporter, TransactionWorker
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -10,31 +22,74 @@ logging.basicConfig(
 )
 
 RECIPIENT_ADDRESS = "KIJ4QO2B7IHFJXSBBN2VIALRLCA3XIOFQZZFAWL4H2B3GOAWJ52ENE7NTI"
+# Unsigned opt-in groups for the recipient, written when it still has to opt in to pixels it bought.
+OPT_IN_REQUESTS_PATH = MANIFEST_PATH.with_name("recipient_opt_ins.txn")
+
+# Worker events are drained once per frame (~60 fps), a bounded number at a time so a burst of
+# transfer results can never stall the event loop.
+WORKER_POLL_MS = 16
+WORKER_EVENTS_PER_POLL = 200
 
 
 class PixelGrid(tk.Tk):
-    def __init__(self, rows=16, cols=16, pixel_size=25, pixel_assets=None):
+    def __init__(
+        self,
+        rows: int = 16,
+        cols: int = 16,
+        pixel_size: int = 25,
+        pixel_assets: Mapping[Pixel, int] | None = None,
+    ) -> None:
         super().__init__()
         self.title("Pixel Selection & Coloring")
         self.rows = rows
         self.cols = cols
         self.pixel_size = pixel_size
-        self.pixel_assets = pixel_assets or {}
+        self.pixel_assets: Mapping[Pixel, int] = pixel_assets or {}
 
         # State
         self.mode = "idle"
-        self.selected_pixels = set()
-        self.colored_pixels = {}  # {(r,c): color}
+        self.pixel_state = PixelState(rows, cols)
 
-        self.pixels = {}
+        self._verified_assets: set[int] = set()
+        self.worker = TransactionWorker()
+        self.settled_count = 0
+        self.failed_count = 0
+        self.last_status = ""
         self.create_ui()
         self.create_grid()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.after(WORKER_POLL_MS, self.poll_worker)
+
+    @classmethod
+    def from_manifest(
+        cls, path: Path = MANIFEST_PATH, pixel_size: int = 25
+    ) -> "PixelGrid":
+        """Open the grid over the pixel assets recorded by the last deploy, without minting.
+
+        Asset IDs are read from the memory-mapped cache next to the manifest and are only
+        checked against chain state when a pixel is first settled.
+        """
+        pixel_assets = load_pixel_assets(path)
+        logger.info(
+            f"Loaded {pixel_assets.rows}x{pixel_assets.cols} pixel assets from {path}"
+        )
+        return cls(
+            rows=pixel_assets.rows,
+            cols=pixel_assets.cols,
+            pixel_size=pixel_size,
+            pixel_assets=pixel_assets,
+        )
+
+    # --- Algorand client & deployer, resolved on first use so the window opens immediately ---
+    @cached_property
+    def algorand(self) -> AlgorandClient:
+        return get_algorand()
 
-        # --- Algorand client & deployer ---
-        self.algorand = AlgorandClient.from_environment()
-        self.deployer = self.algorand.account.from_environment("DEPLOYER")
+    @cached_property
+    def deployer(self) -> SigningAccount:
+        return get_account("DEPLOYER")
 
-    def create_ui(self):
+    def create_ui(self) -> None:
         self.participate_button = tk.Button(
             self, text="I want to participate", command=self.enable_selection
         )
@@ -53,62 +108,73 @@ class PixelGrid(tk.Tk):
         self.confirm_button.pack(side=tk.LEFT, padx=10)
         self.confirm_button.config(state="disabled")
 
-    def create_grid(self):
-        for r in range(self.rows):
-            for c in range(self.cols):
-                frame = tk.Frame(
-                    self.grid_frame,
-                    width=self.pixel_size,
-                    height=self.pixel_size,
-                    bg="white",
-                    highlightbackground="gray",
-                    highlightthickness=1
-                )
-                frame.grid(row=r, column=c)
-                frame.bind("<Button-1>", lambda e, row=r, col=c: self.on_pixel_click(row, col))
-                self.pixels[(r, c)] = frame
+        self.status_label = tk.Label(self, text="", fg="gray")
+        self.status_label.pack(pady=(0, 10))
 
-    def enable_selection(self):
+    def create_grid(self) -> None:
+        self.canvas = PixelCanvas(
+            self.grid_frame,
+            rows=self.rows,
+            cols=self.cols,
+            pixel_size=self.pixel_size,
+            on_click=self.on_pixel_click,
+        )
+        self.canvas.pack()
+
+    def enable_selection(self) -> None:
         if self.mode == "idle":
             self.mode = "selecting"
             self.participate_button.config(state="disabled")
             self.confirm_button.config(state="normal")
             self.selection_label.config(text="Select pixels you want")
-            self.selected_pixels.clear()
+            self.pixel_state.clear_selection()
 
-    def on_pixel_click(self, row, col):
+    def on_pixel_click(self, row: int, col: int) -> None:
         if self.mode == "selecting":
-            if (row, col) not in self.selected_pixels:
-                self.selected_pixels.add((row, col))
-                self.pixels[(row, col)].config(bg="lightblue")
+            if self.pixel_state.toggle_selected(row, col):
+                self.canvas.paint(row, col, "lightblue")
             else:
-                self.selected_pixels.remove((row, col))
-                prev_color = self.colored_pixels.get((row, col), "white")
-                self.pixels[(row, col)].config(bg=prev_color)
-            self.selection_label.config(text=f"Selected pixels: {len(self.selected_pixels)}")
+                prev_color = self.pixel_state.color(row, col) or "white"
+                self.canvas.paint(row, col, prev_color)
+            self.selection_label.config(
+                text=f"Selected pixels: {self.pixel_state.selected_count()}"
+            )
 
         elif self.mode == "coloring":
-            if (row, col) in self.selected_pixels:
+            if self.pixel_state.is_selected(row, col):
                 color = colorchooser.askcolor(title="Choose color")[1]
                 if color:
-                    self.pixels[(row, col)].config(bg=color)
-                    self.colored_pixels[(row, col)] = color
+                    self.canvas.paint(row, col, color)
+                    self.pixel_state.set_color(row, col, color)
                     logger.info(f"Pixel ({row},{col}) colored: {color}")
 
-    def toggle_confirm(self):
+    def toggle_confirm(self) -> None:
         if self.mode == "selecting":
-            if not self.selected_pixels:
-                self.selection_label.config(text="Select at least one pixel before confirming.")
+            if not self.pixel_state.selected_count():
+                self.selection_label.config(
+                    text="Select at least one pixel before confirming."
+                )
                 return
             self.mode = "coloring"
             self.selection_label.config(
-                text=f"{len(self.selected_pixels)} pixels confirmed. Now color only these."
+                text=f"{self.pixel_state.selected_count()} pixels confirmed. Now color only these."
             )
             self.confirm_button.config(text="Finish session")
 
         elif self.mode == "coloring":
-            # Send payment for colored pixels
-            self.send_payment_and_transfer_tokens()
+            # Settle only pixels newly colored this session, in the background; take them
+            # from the state first so the worker never reads state the UI thread is mutating
+            pixels = self.pixel_state.take_unsettled()
+            if pixels:
+
+                def settle(report: Reporter) -> None:
+                    self.send_payment_and_transfer_tokens(pixels, report)
+
+                # Pixels the job never reports on, e.g. because it raised, are failed so they
+                # are no longer flagged as settling and get queued again.
+                self.worker.submit("settle", settle, pixels)
+                self.last_status = f"Settling {len(pixels)} pixels..."
+                self.status_label.config(text=self.last_status)
 
             # Reset to idle mode
             self.mode = "idle"
@@ -116,51 +182,94 @@ class PixelGrid(tk.Tk):
             self.confirm_button.config(state="disabled", text="Confirm selection")
             self.participate_button.config(state="normal")
 
-            for (r, c), frame in self.pixels.items():
-                if (r, c) in self.colored_pixels:
-                    frame.config(bg=self.colored_pixels[(r, c)])
-                else:
-                    frame.config(bg="white")
+            # Only selected pixels can still be showing the selection highlight
+            for r, c in self.pixel_state.selected_pixels():
+                self.canvas.paint(r, c, self.pixel_state.color(r, c) or "white")
 
-            self.selected_pixels.clear()
+            self.pixel_state.clear_selection()
 
-    def send_payment_and_transfer_tokens(self):
-        num_pixels = len(self.colored_pixels)
-        if num_pixels == 0:
-            return
+    def poll_worker(self) -> None:
+        """Apply progress posted by the transaction worker, then reschedule."""
+        events = self.worker.drain(WORKER_EVENTS_PER_POLL)
+        for event in events:
+            if event.kind == "pixel_settled" and event.pixel is not None:
+                self.settled_count += 1
+                self.pixel_state.mark_owned([event.pixel])
+            elif event.kind == "pixel_failed" and event.pixel is not None:
+                self.failed_count += 1
+                self.pixel_state.mark_unsettled([event.pixel])
+            elif event.kind == "progress":
+                self.last_status = event.message
+            elif event.kind == "error":
+                self.last_status = f"❌ Settlement failed: {event.message}"
 
-        try:
-            # Payment
-            self.algorand.send.payment(
-                PaymentParams(
-                    amount=AlgoAmount(algo=2 * num_pixels),
-                    sender=self.deployer.address,
-                    receiver=RECIPIENT_ADDRESS
-                )
+        if events:
+            summary = f"Settled {self.settled_count} pixels, {self.failed_count} failed"
+            if self.worker.pending:
+                summary += f" ({self.worker.pending} settlements in flight)"
+            self.status_label.config(
+                text=f"{self.last_status}\n{summary}" if self.last_status else summary
             )
-            logger.info(f"✅ Sent payment for {num_pixels} colored pixels.")
-
-            # Transfer ASA ownership
-            for (row, col) in self.colored_pixels:
-                asset_id = self.pixel_assets.get((row, col))
-                if asset_id:
-                    self.algorand.send.asset_transfer(
-                        AssetTransferParams(
-                            sender=self.deployer.address,
-                            receiver=RECIPIENT_ADDRESS,
-                            asset_id=asset_id,
-                            amount=1
-                        )
-                    )
-                    logger.info(f"✅ Transferred ASA {asset_id} for pixel ({row},{col}) to recipient")
+        self.after(WORKER_POLL_MS, self.poll_worker)
+
+    def on_close(self) -> None:
+        self.worker.shutdown()
+        self.destroy()
+
+    def send_payment_and_transfer_tokens(
+        self, pixels: list[Pixel], report: Reporter = NULL_REPORTER
+    ) -> SettlementSummary | None:
+        """Pay for `pixels` and transfer their ASAs to the recipient.
 
+        Payment and transfers are settled together in atomic groups of up to 16 transactions.
+        Pixels whose ASA the recipient has not opted in to fail without a round trip, and the
+        opt-ins it needs are written to OPT_IN_REQUESTS_PATH for it to sign.
+        Runs on the transaction worker thread, so it reports through `report` rather than Tk;
+        the UI thread updates the owned-pixels ledger from those reports.
+        """
+        if not pixels:
+            return None
+
+        return settle_pixels(
+            self.algorand,
+            sender=self.deployer.address,
+            receiver=RECIPIENT_ADDRESS,
+            pixels=pixels,
+            pixel_assets=self.pixel_assets,
+            report=report,
+            is_deployed_asset=self.is_deployed_asset,
+            opt_in_requests=OPT_IN_REQUESTS_PATH,
+        )
+
+    def is_deployed_asset(self, asset_id: int) -> bool:
+        """Check (once per asset) that a cached asset ID still exists on chain and belongs to the deployer."""
+        if asset_id in self._verified_assets:
+            return True
+        try:
+            info: dict[str, dict[str, str]] = self.algorand.client.algod.asset_info(asset_id)  # type: ignore[assignment]
+            creator = info["params"]["creator"]
         except Exception as e:
-            logger.error(f"❌ Payment or ASA transfer failed: {e}")
+            logger.warning(f"Pixel asset {asset_id} not found on chain, skipping: {e}")
+            return False
+        if creator != self.deployer.address:
+            logger.warning(
+                f"Pixel asset {asset_id} was not created by the deployer, skipping"
+            )
+            return False
+        self._verified_assets.add(asset_id)
+        return True
 
 
 if __name__ == "__main__":
-    # Example usage: pass pixel_assets dictionary created during deploy
-    from deploy_config import create_pixel_assets, GRID_WIDTH, GRID_HEIGHT
-    pixel_assets = create_pixel_assets()
-    app = PixelGrid(rows=GRID_HEIGHT, cols=GRID_WIDTH, pixel_size=25, pixel_assets=pixel_assets)
+    if "--reuse-assets" in sys.argv:
+        # Reuse the pixel assets recorded by the last deploy instead of minting
+        app = PixelGrid.from_manifest(MANIFEST_PATH, pixel_size=25)
+    else:
+        # Example usage: pass pixel_assets dictionary created during deploy
+        from deploy_config import GRID_HEIGHT, GRID_WIDTH, create_pixel_assets
+
+        pixel_assets = create_pixel_assets()
+        app = PixelGrid(
+            rows=GRID_HEIGHT, cols=GRID_WIDTH, pixel_size=25, pixel_assets=pixel_assets
+        )
     app.mainloop()
@@ -0,0 +1,253 @@
+import json
+import logging
+import mmap
+import re
+import struct
+from array import array
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import NotRequired, TypedDict
+
+from algokit_utils import AlgorandClient
+from pixel_minting import MintedPixel, Pixel
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).parent / "pixel_manifest.jsonl"
+ASSET_CACHE_PATH = MANIFEST_PATH.with_suffix(".bin")
+
+# Asset cache layout: magic, rows, cols, padding, then rows * cols native uint64 asset IDs in
+# row-major order, with 0 marking a pixel that has no asset.
+_CACHE_MAGIC = b"PXA1"
+_CACHE_HEADER = struct.Struct("<4sII4x")
+
+_PIXEL_ASSET_NAME = re.compile(r"^Pixel_(\d+)x(\d+)$")
+
+
+class _ManifestHeader(TypedDict):
+    genesis_hash: str
+    creator: str
+
+
+class _ManifestLine(TypedDict):
+    row: int
+    col: int
+    asset_id: int
+    txid: str | None
+    round: int | None
+
+
+class _CreatedAsset(TypedDict):
+    index: int
+    params: dict[str, str | int | bool]
+
+
+_AccountInfo = TypedDict(
+    "_AccountInfo", {"created-assets": NotRequired[list[_CreatedAsset]]}
+)
+
+
+def _read_manifest(path: Path) -> tuple[_ManifestHeader | None, list[_ManifestLine]]:
+    """The header and the pixel lines of the manifest at `path`."""
+    header: _ManifestHeader | None = None
+    lines: list[_ManifestLine] = []
+    with path.open(encoding="utf-8") as f:
+        for text in f:
+            if not text.strip():
+                continue
+            if header is None:
+                read_header: _ManifestHeader = json.loads(text)
+                header = read_header
+            else:
+                line: _ManifestLine = json.loads(text)
+                lines.append(line)
+    return header, lines
+
+
+class PixelManifest:
+    """Append-only record of minted pixel ASAs, so an interrupted deploy can resume.
+
+    The file is JSON Lines: a header naming the network and creator, then one line per minted
+    pixel. Lines are flushed as each group confirms, so at most the groups in flight when the
+    process died are missing, and those are recovered from chain state by `reconcile`.
+    """
+
+    def __init__(self, path: Path, genesis_hash: str, creator: str) -> None:
+        self.path = path
+        self.genesis_hash = genesis_hash
+        self.creator = creator
+        self.entries: dict[Pixel, MintedPixel] = {}
+
+    @classmethod
+    def open(cls, path: Path, genesis_hash: str, creator: str) -> "PixelManifest":
+        """Load the manifest at `path`, starting afresh if it belongs to another network or creator."""
+        manifest = cls(path, genesis_hash, creator)
+        if not path.exists():
+            manifest._write_header()
+            return manifest
+
+        header, lines = _read_manifest(path)
+        if (
+            header is None
+            or header["genesis_hash"] != genesis_hash
+            or header["creator"] != creator
+        ):
+            logger.warning(
+                f"Pixel manifest {path} belongs to another network or creator, starting a new one"
+            )
+            manifest._write_header()
+            return manifest
+
+        for line in lines:
+            minted = MintedPixel(
+                pixel=(line["row"], line["col"]),
+                asset_id=line["asset_id"],
+                txid=line["txid"],
+                confirmed_round=line["round"],
+            )
+            manifest.entries[minted.pixel] = minted
+        logger.info(f"Loaded {len(manifest.entries)} minted pixels from {path}")
+        return manifest
+
+    def __contains__(self, pixel: Pixel) -> bool:
+        return pixel in self.entries
+
+    def asset_ids(self) -> dict[Pixel, int]:
+        return {pixel: minted.asset_id for pixel, minted in self.entries.items()}
+
+    def record(self, minted: list[MintedPixel]) -> None:
+        """Append freshly minted pixels and flush them to disk."""
+        with self.path.open("a", encoding="utf-8") as f:
+            for entry in minted:
+                self.entries[entry.pixel] = entry
+                row, col = entry.pixel
+                line: _ManifestLine = {
+                    "row": row,
+                    "col": col,
+                    "asset_id": entry.asset_id,
+                    "txid": entry.txid,
+                    "round": entry.confirmed_round,
+                }
+                f.write(json.dumps(line) + "\n")
+
+    def reconcile(self, on_chain: dict[Pixel, int]) -> None:
+        """Make the manifest agree with the pixel assets the creator actually holds on chain.
+
+        Entries whose asset no longer exists (e.g. after a LocalNet reset) are dropped, and
+        pixels minted on chain but never written down are added without txid/round.
+        """
+        stale = [
+            pixel
+            for pixel, minted in self.entries.items()
+            if on_chain.get(pixel) != minted.asset_id
+        ]
+        recovered = [
+            MintedPixel(pixel=pixel, asset_id=asset_id)
+            for pixel, asset_id in on_chain.items()
+            if pixel not in self.entries or pixel in stale
+        ]
+        if stale:
+            logger.warning(f"Dropping {len(stale)} manifest entries not found on chain")
+            for pixel in stale:
+                del self.entries[pixel]
+            self._rewrite()
+        if recovered:
+            logger.info(f"Recovered {len(recovered)} minted pixels from chain state")
+            self.record(recovered)
+
+    def _write_header(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8") as f:
+            header: _ManifestHeader = {
+                "genesis_hash": self.genesis_hash,
+                "creator": self.creator,
+            }
+            f.write(json.dumps(header) + "\n")
+
+    def _rewrite(self) -> None:
+        entries = list(self.entries.values())
+        self.entries.clear()
+        self._write_header()
+        self.record(entries)
+
+
+def find_minted_pixels(algorand: AlgorandClient, creator: str) -> dict[Pixel, int]:
+    """Read every `Pixel_{row}x{col}` ASA created by `creator` with a single algod account lookup."""
+    account: _AccountInfo = algorand.client.algod.account_info(creator)  # type: ignore[assignment]
+    minted: dict[Pixel, int] = {}
+    for asset in account.get("created-assets", []):
+        match = _PIXEL_ASSET_NAME.match(str(asset["params"].get("name", "")))
+        if match:
+            pixel = (int(match[1]), int(match[2]))
+            # Earlier non-resumable deploys may have minted duplicates; keep the oldest one.
+            minted[pixel] = min(asset["index"], minted.get(pixel, asset["index"]))
+    return minted
+
+
+class PixelAssetCache(Mapping[Pixel, int]):
+    """Read-only, memory-mapped pixel -> asset ID map.
+
+    Opening it costs one mmap regardless of grid size; pages are only read as pixels are looked up.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header: tuple[bytes, int, int] = _CACHE_HEADER.unpack_from(self._mmap)
+        magic, self.rows, self.cols = header
+        if magic != _CACHE_MAGIC:
+            raise ValueError(f"{path} is not a pixel asset cache")
+        self._ids = memoryview(self._mmap)[_CACHE_HEADER.size :].cast("Q")
+        if len(self._ids) != self.rows * self.cols:
+            raise ValueError(f"Pixel asset cache {path} is truncated")
+
+    def __getitem__(self, pixel: Pixel) -> int:
+        row, col = pixel
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise KeyError(pixel)
+        asset_id = self._ids[row * self.cols + col]
+        if not asset_id:
+            raise KeyError(pixel)
+        return int(asset_id)
+
+    def __iter__(self) -> Iterator[Pixel]:
+        for index, asset_id in enumerate(self._ids):
+            if asset_id:
+                yield divmod(index, self.cols)
+
+    def __len__(self) -> int:
+        return sum(1 for asset_id in self._ids if asset_id)
+
+
+def write_asset_cache(
+    path: Path, rows: int, cols: int, asset_ids: Mapping[Pixel, int]
+) -> None:
+    """Snapshot `asset_ids` into the binary cache read by `PixelAssetCache`."""
+    ids = array("Q", bytes(8 * rows * cols))
+    for (row, col), asset_id in asset_ids.items():
+        if 0 <= row < rows and 0 <= col < cols:
+            ids[row * cols + col] = asset_id
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(_CACHE_HEADER.pack(_CACHE_MAGIC, rows, cols))
+        ids.tofile(f)
+    tmp_path.replace(path)
+
+
+def load_pixel_assets(manifest_path: Path = MANIFEST_PATH) -> PixelAssetCache:
+    """Load the pixel -> asset ID map for the last deploy without touching the network.
+
+    The binary cache next to the manifest is used when it is at least as new as the manifest;
+    otherwise it is rebuilt from the manifest first.
+    """
+    cache_path = manifest_path.with_suffix(".bin")
+    if (
+        not cache_path.exists()
+        or cache_path.stat().st_mtime < manifest_path.stat().st_mtime
+    ):
+        _, lines = _read_manifest(manifest_path)
+        asset_ids = {(line["row"], line["col"]): line["asset_id"] for line in lines}
+        rows = max((row for row, _ in asset_ids), default=-1) + 1
+        cols = max((col for _, col in asset_ids), default=-1) + 1
+        write_asset_cache(cache_path, rows, cols, asset_ids)
+    return PixelAssetCache(cache_path)
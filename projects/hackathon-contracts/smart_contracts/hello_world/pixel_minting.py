@@ -0,0 +1,321 @@
+import dataclasses
+import logging
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+from algokit_utils import AlgorandClient, AssetCreateParams
+from confirmation_tracker import Confirmation, ConfirmationTracker
+from instrumentation import track_submission
+
+logger = logging.getLogger(__name__)
+
+# Algorand caps an atomic group at 16 transactions.
+MAX_GROUP_SIZE = 16
+
+# Number of groups kept in flight by the pipelined minter. LocalNet (dev mode) confirms each group
+# as soon as it lands, so a few concurrent groups saturate it; public networks take ~3s per round
+# and need a wider window to fill each block.
+LOCALNET_WINDOW = 4
+PUBLIC_NETWORK_WINDOW = 16
+ROUND_TIME_SECONDS = 2.8
+# Groups kept submitted but unconfirmed by the tracked minter. It waits on rounds rather than on
+# threads, so it can keep far more groups in flight than the pipelined minter.
+TRACKED_WINDOW = 64
+
+Pixel = tuple[int, int]
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True)
+class MintedPixel:
+    pixel: Pixel
+    asset_id: int
+    txid: str | None = None
+    confirmed_round: int | None = None
+
+
+OnMinted = Callable[[list[MintedPixel]], None]
+
+
+def pixel_asset_params(sender: str, row: int, col: int) -> AssetCreateParams:
+    """Build the ASA create params for the pixel at (row, col)."""
+    coord_name = f"{row}x{col}"
+    return AssetCreateParams(
+        sender=sender,
+        total=1,
+        decimals=0,
+        default_frozen=False,
+        unit_name=coord_name[:8],  # ≤8 chars
+        asset_name=f"Pixel_{coord_name}",  # ≤32 chars
+        url="http://localhost",
+    )
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield consecutive lists of at most `size` items."""
+    if not 1 <= size <= MAX_GROUP_SIZE:
+        raise ValueError(
+            f"Group size must be between 1 and {MAX_GROUP_SIZE}, got {size}"
+        )
+    chunk: list[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def mint_pixel_assets_sequential(
+    algorand: AlgorandClient,
+    sender: str,
+    pixels: Iterable[Pixel],
+    on_minted: OnMinted | None = None,
+) -> dict[Pixel, int]:
+    """Mint pixel ASAs one transaction at a time, waiting for each to confirm before sending the next."""
+    created_assets: dict[Pixel, int] = {}
+    for row, col in pixels:
+        with track_submission("asset_create", 1):
+            result = algorand.send.asset_create(pixel_asset_params(sender, row, col))
+        created_assets[(row, col)] = result.asset_id
+        if on_minted:
+            on_minted(
+                [
+                    MintedPixel(
+                        (row, col),
+                        result.asset_id,
+                        result.tx_id,
+                        result.confirmation.get("confirmed-round"),  # type: ignore[union-attr]
+                    )
+                ]
+            )
+        logger.info(
+            f"✅ Created ASA for pixel ({row},{col}) → Asset ID {result.asset_id}"
+        )
+    return created_assets
+
+
+def mint_pixel_group(
+    algorand: AlgorandClient, sender: str, pixels: list[Pixel]
+) -> list[MintedPixel]:
+    """Mint one ASA per pixel in a single atomic group and map each `asset-index` back to its pixel."""
+    composer = algorand.new_group()
+    for row, col in pixels:
+        composer.add_asset_create(pixel_asset_params(sender, row, col))
+    with track_submission("mint_group", len(pixels)):
+        result = composer.send()
+    # Confirmations come back in the order the transactions were added to the group.
+    return [
+        MintedPixel(
+            pixel=pixel,
+            asset_id=int(confirmation["asset-index"]),  # type: ignore[call-overload]
+            txid=txid,
+            confirmed_round=confirmation.get("confirmed-round"),  # type: ignore[union-attr]
+        )
+        for pixel, txid, confirmation in zip(
+            pixels, result.tx_ids, result.confirmations, strict=True
+        )
+    ]
+
+
+def mint_pixel_assets_batched(
+    algorand: AlgorandClient,
+    sender: str,
+    pixels: Iterable[Pixel],
+    group_size: int = MAX_GROUP_SIZE,
+    on_minted: OnMinted | None = None,
+) -> dict[Pixel, int]:
+    """Mint pixel ASAs in atomic groups of up to `group_size`, submitting the groups back to back.
+
+    `on_minted` is called with each confirmed group, e.g. to persist progress.
+    """
+    created_assets: dict[Pixel, int] = {}
+    for group in chunked(pixels, group_size):
+        created = mint_pixel_group(algorand, sender, group)
+        created_assets.update((minted.pixel, minted.asset_id) for minted in created)
+        if on_minted:
+            on_minted(created)
+        logger.info(
+            f"✅ Minted group of {len(created)} pixel ASAs ({len(created_assets)} total)"
+        )
+    return created_assets
+
+
+@dataclasses.dataclass
+class MintStats:
+    transactions: int = 0
+    groups: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def txns_per_second(self) -> float:
+        return self.transactions / self.elapsed if self.elapsed else 0.0
+
+
+def default_window(algorand: AlgorandClient) -> int:
+    """Pick the in-flight group window for the network `algorand` points at."""
+    return LOCALNET_WINDOW if algorand.client.is_localnet() else PUBLIC_NETWORK_WINDOW
+
+
+class _RoundParams:
+    """Fetch suggested params at most once per round and share them with every group built in it."""
+
+    def __init__(
+        self, algorand: AlgorandClient, round_time: float = ROUND_TIME_SECONDS
+    ) -> None:
+        self.algorand = algorand
+        self.round_time = round_time
+        self.fetched_at: float | None = None
+
+    def refresh(self) -> None:
+        now = time.monotonic()
+        if self.fetched_at is not None and now - self.fetched_at < self.round_time:
+            return
+        params = self.algorand.client.algod.suggested_params()
+        self.algorand.set_suggested_params_cache(
+            params, until=time.time() + self.round_time
+        )
+        self.fetched_at = now
+
+
+def mint_pixel_assets_pipelined(
+    algorand: AlgorandClient,
+    sender: str,
+    pixels: Iterable[Pixel],
+    group_size: int = MAX_GROUP_SIZE,
+    window: int | None = None,
+    on_minted: OnMinted | None = None,
+) -> tuple[dict[Pixel, int], MintStats]:
+    """Mint pixel ASAs keeping up to `window` atomic groups in flight at once.
+
+    Confirmations are collected as they arrive rather than in submission order; `on_minted` is
+    called on the calling thread for each confirmed group. If any group fails the groups not yet
+    submitted are abandoned and the error is re-raised.
+    """
+    window = window or default_window(algorand)
+    if window < 1:
+        raise ValueError(f"Window must be at least 1, got {window}")
+
+    round_params = _RoundParams(algorand)
+    created_assets: dict[Pixel, int] = {}
+    stats = MintStats()
+    started = time.perf_counter()
+
+    def collect(done: set[Future[list[MintedPixel]]]) -> None:
+        for future in done:
+            created = future.result()
+            created_assets.update((minted.pixel, minted.asset_id) for minted in created)
+            stats.transactions += len(created)
+            stats.groups += 1
+            if on_minted:
+                on_minted(created)
+        logger.info(
+            f"✅ {len(created_assets)} pixel ASAs confirmed ({len(in_flight)} groups in flight)"
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=window, thread_name_prefix="pixel-mint"
+    ) as executor:
+        in_flight: set[Future[list[MintedPixel]]] = set()
+        try:
+            for group in chunked(pixels, group_size):
+                if len(in_flight) >= window:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+                round_params.refresh()
+                in_flight.add(
+                    executor.submit(mint_pixel_group, algorand, sender, group)
+                )
+            done, in_flight = wait(in_flight)
+            collect(done)
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+            raise
+
+    stats.elapsed = time.perf_counter() - started
+    logger.info(
+        f"Minted {stats.transactions} pixel ASAs in {stats.groups} groups over {stats.elapsed:.2f}s "
+        f"({stats.txns_per_second:.1f} txns/sec, window={window})"
+    )
+    return created_assets, stats
+
+
+def _created_asset_id(algorand: AlgorandClient, confirmation: Confirmation) -> int:
+    """The ID of the asset a confirmed create made, from pending info when the block lacked it."""
+    if confirmation.asset_id is not None:
+        return confirmation.asset_id
+    info: dict[str, int] = algorand.client.algod.pending_transaction_info(confirmation.txid)  # type: ignore[assignment]
+    if "asset-index" not in info:
+        raise ValueError(f"Asset create {confirmation.txid} reported no asset ID")
+    return int(info["asset-index"])
+
+
+def mint_pixel_assets_tracked(
+    algorand: AlgorandClient,
+    sender: str,
+    pixels: Iterable[Pixel],
+    group_size: int = MAX_GROUP_SIZE,
+    window: int | None = None,
+    on_minted: OnMinted | None = None,
+) -> tuple[dict[Pixel, int], MintStats]:
+    """Mint pixel ASAs by submitting up to `window` groups without waiting, then confirming them per round.
+
+    Instead of a pending-info poll loop per transaction, a ConfirmationTracker waits once per
+    round and resolves every group that landed in it. `on_minted` is called once per round with
+    the pixels confirmed in it. `window` defaults to TRACKED_WINDOW.
+    """
+    window = window or TRACKED_WINDOW
+    if window < 1:
+        raise ValueError(f"Window must be at least 1, got {window}")
+
+    round_params = _RoundParams(algorand)
+    tracker = ConfirmationTracker(algorand)
+    pixel_by_txid: dict[str, Pixel] = {}
+    created_assets: dict[Pixel, int] = {}
+    stats = MintStats()
+    started = time.perf_counter()
+
+    def collect() -> None:
+        created = [
+            MintedPixel(
+                pixel_by_txid.pop(confirmation.txid),
+                _created_asset_id(algorand, confirmation),
+                confirmation.txid,
+                confirmation.confirmed_round,
+            )
+            for confirmation in tracker.poll()
+        ]
+        if not created:
+            return
+        created_assets.update((minted.pixel, minted.asset_id) for minted in created)
+        stats.transactions += len(created)
+        if on_minted:
+            on_minted(created)
+        logger.info(
+            f"✅ {len(created_assets)} pixel ASAs confirmed ({tracker.pending} transactions in flight)"
+        )
+
+    for group in chunked(pixels, group_size):
+        while tracker.pending >= window * group_size:
+            collect()
+        round_params.refresh()
+        composer = algorand.new_group()
+        for row, col in group:
+            composer.add_asset_create(pixel_asset_params(sender, row, col))
+        pixel_by_txid.update(
+            zip(tracker.submit(composer, "mint_group"), group, strict=True)
+        )
+        stats.groups += 1
+    while tracker.pending:
+        collect()
+
+    stats.elapsed = time.perf_counter() - started
+    logger.info(
+        f"Minted {stats.transactions} pixel ASAs in {stats.groups} groups over {stats.elapsed:.2f}s "
+        f"({stats.txns_per_second:.1f} txns/sec, window={window})"
+    )
+    return created_assets, stats
@@ -0,0 +1,267 @@
+import dataclasses
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AssetOptInParams,
+    AssetTransferParams,
+    PaymentParams,
+)
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.error import AlgodHTTPError
+from confirmation_tracker import ConfirmationTracker
+from instrumentation import track_submission
+from pixel_minting import MAX_GROUP_SIZE, Pixel, chunked
+from tx_worker import NULL_REPORTER, Reporter
+
+logger = logging.getLogger(__name__)
+
+PRICE_PER_PIXEL_ALGO = 2
+# Each settlement group is one payment plus one ASA transfer per pixel.
+PIXELS_PER_GROUP = MAX_GROUP_SIZE - 1
+OPT_INS_PER_GROUP = MAX_GROUP_SIZE
+MAX_ATTEMPTS = 3
+RETRY_DELAY_SECONDS = 1.0
+
+
+@dataclasses.dataclass
+class SettlementSummary:
+    settled: list[Pixel] = dataclasses.field(default_factory=list)
+    failed: dict[Pixel, str] = dataclasses.field(default_factory=dict)
+    groups: int = 0
+
+    def __str__(self) -> str:
+        return f"{len(self.settled)} pixels settled in {self.groups} groups, {len(self.failed)} failed"
+
+
+@dataclasses.dataclass
+class OptInPreflight:
+    """The assets a receiver still has to opt in to, as unsigned groups of opt-ins for it to sign."""
+
+    receiver: str
+    missing: list[int]
+    groups: list[list[transaction.Transaction]]
+
+
+def preflight_opt_ins(
+    algorand: AlgorandClient, receiver: str, asset_ids: Iterable[int]
+) -> OptInPreflight:
+    """Read the receiver's holdings once and group an opt-in for every asset it does not hold yet.
+
+    Each group holds up to OPT_INS_PER_GROUP opt-ins and already has its group ID assigned, so it
+    can be signed as is, by `send_opt_ins` or by the receiver's own wallet.
+    """
+    info: dict[str, list[dict[str, int]]] = algorand.client.algod.account_info(receiver)  # type: ignore[assignment]
+    held = {asset["asset-id"] for asset in info.get("assets", [])}
+    missing = [
+        asset_id for asset_id in dict.fromkeys(asset_ids, True) if asset_id not in held
+    ]
+    groups = []
+    for chunk in chunked(missing, OPT_INS_PER_GROUP):
+        composer = algorand.new_group()
+        for asset_id in chunk:
+            composer.add_asset_opt_in(
+                AssetOptInParams(sender=receiver, asset_id=asset_id)
+            )
+        group: list[transaction.Transaction] = transaction.assign_group_id(
+            composer.build_transactions().transactions
+        )
+        groups.append(group)
+    return OptInPreflight(receiver, missing, groups)
+
+
+def send_opt_ins(
+    algorand: AlgorandClient, preflight: OptInPreflight, signer: TransactionSigner
+) -> None:
+    """Sign and submit every opt-in group of `preflight`, then wait until all of them are confirmed."""
+    if not preflight.groups:
+        return
+    tracker = ConfirmationTracker(algorand)
+    for group in preflight.groups:
+        tracker.submit_group(group, signer, "opt_in_group")
+    tracker.wait_all()
+    logger.info(
+        f"✅ Opted {preflight.receiver} in to {len(preflight.missing)} pixel ASAs"
+    )
+
+
+def write_opt_in_requests(preflight: OptInPreflight, path: Path) -> None:
+    """Write the unsigned opt-in groups to `path`, e.g. for `goal clerk sign` on the receiver's side."""
+    txns: list[transaction.Transaction] = [
+        txn for group in preflight.groups for txn in group
+    ]
+    transaction.write_to_file(txns, str(path))
+
+
+def settle_group(
+    algorand: AlgorandClient,
+    sender: str,
+    receiver: str,
+    pixel_assets: list[tuple[Pixel, int]],
+) -> list[str]:
+    """Pay for and transfer a chunk of pixels in one atomic group, returning the transaction IDs.
+
+    If sending raises, the group is looked up before the error is passed on: when it was
+    committed after all, its transaction IDs are returned as if the send had succeeded.
+    """
+    composer = algorand.new_group().add_payment(
+        PaymentParams(
+            sender=sender,
+            receiver=receiver,
+            amount=AlgoAmount(algo=PRICE_PER_PIXEL_ALGO * len(pixel_assets)),
+        )
+    )
+    for _, asset_id in pixel_assets:
+        composer.add_asset_transfer(
+            AssetTransferParams(
+                sender=sender, receiver=receiver, asset_id=asset_id, amount=1
+            )
+        )
+    txns: list[transaction.Transaction] = [
+        signed.txn for signed in composer.build().transactions
+    ]
+    txids: list[str] = [txn.get_txid() for txn in txns]  # type: ignore[misc]
+    try:
+        with track_submission("settle_group", len(pixel_assets) + 1):
+            composer.send()
+    except Exception as e:
+        if not group_committed(algorand, txns[0]):
+            raise
+        logger.warning(
+            f"Settlement group {txids[0]} was committed although sending it failed: {e}"
+        )
+    return txids
+
+
+def group_committed(algorand: AlgorandClient, txn: transaction.Transaction) -> bool:
+    """Whether the group holding `txn`, whose send raised, was committed after all.
+
+    A send can fail after the group reached the pool, e.g. when the response is lost or waiting
+    for confirmation times out. A group commits as a whole, so one of its transactions stands for
+    all of them. While it is still pooled this waits round by round until it confirms, is evicted
+    or its validity window passes.
+    """
+    algod = algorand.client.algod
+    txid: str = txn.get_txid()
+    last_valid: int = txn.last_valid_round
+    while True:
+        last_round = int(algod.status()["last-round"])  # type: ignore[call-overload]
+        try:
+            info: dict[str, int | str] = algod.pending_transaction_info(txid)  # type: ignore[assignment]
+        except AlgodHTTPError as e:  # type: ignore[misc]
+            code: int | None = e.code
+            if code == 404:
+                # Neither pooled nor recently confirmed: the node never accepted it.
+                return False
+            raise
+        if info.get("confirmed-round"):
+            return True
+        if info.get("pool-error") or last_round >= last_valid:
+            return False
+        algod.status_after_block(last_round)
+
+
+def settle_pixels(
+    algorand: AlgorandClient,
+    sender: str,
+    receiver: str,
+    pixels: Iterable[Pixel],
+    pixel_assets: Mapping[Pixel, int],
+    report: Reporter = NULL_REPORTER,
+    is_deployed_asset: Callable[[int], bool] | None = None,
+    max_attempts: int = MAX_ATTEMPTS,
+    retry_delay: float = RETRY_DELAY_SECONDS,
+    pixels_per_group: int = PIXELS_PER_GROUP,
+    receiver_signer: TransactionSigner | None = None,
+    opt_in_requests: Path | None = None,
+) -> SettlementSummary:
+    """Settle `pixels` in atomic groups, each paying only for the pixels it transfers.
+
+    A group either settles all its pixels or none of them. A group whose send raised is only
+    retried once it is known not to have been committed; one that was committed after all
+    counts as settled, see `settle_group`.
+
+    `pixels_per_group` caps the transfers in each group, at most PIXELS_PER_GROUP.
+
+    Before any transfer, the receiver's holdings are read once to find the assets it has not
+    opted in to. With `receiver_signer` those opt-ins are sent first; without it the pixels fail
+    straight away instead of each costing a failed group, and the unsigned opt-in groups are
+    written to `opt_in_requests`, if given, for the receiver to sign.
+    If that read fails, every pixel fails with it.
+    """
+    if not 1 <= pixels_per_group <= PIXELS_PER_GROUP:
+        raise ValueError(
+            f"pixels_per_group must be between 1 and {PIXELS_PER_GROUP}, got {pixels_per_group}"
+        )
+    summary = SettlementSummary()
+    settleable: list[tuple[Pixel, int]] = []
+    for pixel in pixels:
+        asset_id = pixel_assets.get(pixel)
+        if not asset_id or (is_deployed_asset and not is_deployed_asset(asset_id)):
+            summary.failed[pixel] = "no deployed asset for this pixel"
+            report.pixel_failed(pixel, summary.failed[pixel])
+        else:
+            settleable.append((pixel, asset_id))
+
+    try:
+        preflight = preflight_opt_ins(
+            algorand, receiver, (asset_id for _, asset_id in settleable)
+        )
+    except Exception as e:
+        # Without the receiver's holdings no transfer can be checked, so none is attempted.
+        for pixel, _ in settleable:
+            summary.failed[pixel] = f"reading the receiver's holdings failed: {e}"
+            report.pixel_failed(pixel, summary.failed[pixel])
+        settleable = []
+        preflight = OptInPreflight(receiver, [], [])
+    if preflight.missing and receiver_signer:
+        send_opt_ins(algorand, preflight, receiver_signer)
+    elif preflight.missing:
+        if opt_in_requests:
+            write_opt_in_requests(preflight, opt_in_requests)
+            report.progress(
+                f"Receiver must sign {len(preflight.groups)} opt-in groups in {opt_in_requests}"
+            )
+        not_opted_in = set(preflight.missing)
+        for pixel, asset_id in settleable:
+            if asset_id in not_opted_in:
+                summary.failed[pixel] = f"receiver has not opted in to asset {asset_id}"
+                report.pixel_failed(pixel, summary.failed[pixel])
+        settleable = [
+            (pixel, asset_id)
+            for pixel, asset_id in settleable
+            if asset_id not in not_opted_in
+        ]
+
+    for group in chunked(settleable, pixels_per_group):
+        group_pixels = [pixel for pixel, _ in group]
+        for attempt in range(1, max_attempts + 1):
+            try:
+                tx_ids = settle_group(algorand, sender, receiver, group)
+            except Exception as e:
+                if attempt < max_attempts:
+                    logger.warning(
+                        f"Settlement group failed (attempt {attempt}/{max_attempts}), retrying: {e}"
+                    )
+                    time.sleep(retry_delay)
+                    continue
+                for pixel in group_pixels:
+                    summary.failed[pixel] = f"settlement group failed: {e}"
+                    report.pixel_failed(pixel, summary.failed[pixel])
+            else:
+                summary.groups += 1
+                summary.settled.extend(group_pixels)
+                for pixel in group_pixels:
+                    report.pixel_settled(pixel)
+                logger.info(
+                    f"✅ Settled {len(group_pixels)} pixels in group {tx_ids[0]}"
+                )
+            break
+
+    report.progress(f"Settlement finished: {summary}")
+    return summary
@@ -0,0 +1,153 @@
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+Pixel = tuple[int, int]
+
+# Colors are stored as 0xRRGGBBAA. Alpha is always 0xFF for a colored pixel, so 0 means "not colored".
+UNCOLORED = 0
+
+
+def hex_to_rgba(color: str) -> int:
+    """Convert '#rrggbb' to the packed 0xRRGGBBAA value stored in `PixelState.colors`."""
+    return (int(color.lstrip("#"), 16) << 8) | 0xFF
+
+
+def rgba_to_hex(rgba: int) -> str:
+    return f"#{int(rgba) >> 8:06x}"
+
+
+class PixelState:
+    """Selection and color state of a rows x cols pixel grid, held in flat row-major arrays.
+
+    `colors` is a uint32 RGBA buffer (4 bytes per pixel) and `selected` a boolean selection map
+    (1 byte per pixel), so bulk operations are vectorized NumPy calls rather than Python loops
+    over per-pixel dicts and sets. Both the UI and the settlement code read from it.
+
+    Settlement is incremental: `owned` records pixels whose ASA has already been transferred,
+    and every color change marks its pixel dirty, so `take_unsettled()` returns only what
+    changed since the last settlement instead of the grid's whole history.
+    """
+
+    def __init__(self, rows: int, cols: int) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.colors: npt.NDArray[np.uint32] = np.zeros(rows * cols, dtype=np.uint32)
+        self.selected: npt.NDArray[np.bool_] = np.zeros(rows * cols, dtype=np.bool_)
+        self.owned: npt.NDArray[np.bool_] = np.zeros(rows * cols, dtype=np.bool_)
+        self.settling: npt.NDArray[np.bool_] = np.zeros(rows * cols, dtype=np.bool_)
+        self._dirty: set[int] = set()
+
+    # --- Indexing ---
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.cols + col
+
+    def indices(self, pixels: Iterable[Pixel]) -> npt.NDArray[np.intp]:
+        coords = np.array(list(pixels), dtype=np.intp).reshape(-1, 2)
+        return coords[:, 0] * self.cols + coords[:, 1]
+
+    def pixels(self, indices: npt.NDArray[np.intp]) -> list[Pixel]:
+        rows, cols = np.divmod(indices, self.cols)
+        return list(zip(rows.tolist(), cols.tolist(), strict=True))
+
+    # --- Selection ---
+
+    def is_selected(self, row: int, col: int) -> bool:
+        return bool(self.selected[self.index(row, col)])
+
+    def toggle_selected(self, row: int, col: int) -> bool:
+        """Flip the selection of one pixel and return whether it is now selected."""
+        index = self.index(row, col)
+        self.selected[index] = not self.selected[index]
+        return bool(self.selected[index])
+
+    def select(self, pixels: Iterable[Pixel]) -> None:
+        self.selected[self.indices(pixels)] = True
+
+    def select_rect(self, row0: int, col0: int, row1: int, col1: int) -> None:
+        """Select every pixel in rows [row0, row1) and columns [col0, col1)."""
+        self.selected.reshape(self.rows, self.cols)[row0:row1, col0:col1] = True
+
+    def clear_selection(self) -> None:
+        self.selected[:] = False
+
+    def selected_count(self) -> int:
+        return int(np.count_nonzero(self.selected))
+
+    def selected_pixels(self) -> list[Pixel]:
+        return self.pixels(np.flatnonzero(self.selected))
+
+    # --- Colors ---
+
+    def color(self, row: int, col: int) -> str | None:
+        rgba = self.colors[self.index(row, col)]
+        return rgba_to_hex(rgba) if rgba != UNCOLORED else None
+
+    def set_color(self, row: int, col: int, color: str) -> None:
+        index = self.index(row, col)
+        self.colors[index] = hex_to_rgba(color)
+        self._dirty.add(index)
+
+    def color_many(self, pixels: Iterable[Pixel], color: str) -> None:
+        indices = self.indices(pixels)
+        self.colors[indices] = hex_to_rgba(color)
+        self._dirty.update(indices.tolist())
+
+    def color_selected(self, color: str) -> None:
+        self.colors[self.selected] = hex_to_rgba(color)
+        self._dirty.update(np.flatnonzero(self.selected).tolist())
+
+    def colored_count(self) -> int:
+        return int(np.count_nonzero(self.colors))
+
+    def colored_pixels(self) -> Iterator[tuple[Pixel, str]]:
+        """Yield ((row, col), '#rrggbb') for every colored pixel, in row-major order."""
+        indices = np.flatnonzero(self.colors)
+        for pixel, rgba in zip(
+            self.pixels(indices), self.colors[indices].tolist(), strict=True
+        ):
+            yield pixel, rgba_to_hex(rgba)
+
+    # --- Settlement ledger ---
+
+    def take_unsettled(self) -> list[Pixel]:
+        """Return the pixels colored since the last call that still need settling, and reset the dirty set.
+
+        Returned pixels are flagged as settling until `mark_owned` or `mark_unsettled` reports
+        the outcome, so a pixel recolored mid-settlement is not sent twice.
+        """
+        dirty = np.fromiter(self._dirty, dtype=np.intp, count=len(self._dirty))
+        dirty.sort()
+        self._dirty.clear()
+        unsettled = dirty[
+            ~self.owned[dirty]
+            & ~self.settling[dirty]
+            & (self.colors[dirty] != UNCOLORED)
+        ]
+        self.settling[unsettled] = True
+        return self.pixels(unsettled)
+
+    def mark_owned(self, pixels: Iterable[Pixel]) -> None:
+        indices = self.indices(pixels)
+        self.owned[indices] = True
+        self.settling[indices] = False
+
+    def mark_unsettled(self, pixels: Iterable[Pixel]) -> None:
+        """Queue pixels again, e.g. after their settlement failed."""
+        indices = self.indices(pixels)
+        self.settling[indices] = False
+        self._dirty.update(indices.tolist())
+
+    def owned_count(self) -> int:
+        return int(np.count_nonzero(self.owned))
+
+    # --- Diffing ---
+
+    def snapshot(self) -> npt.NDArray[np.uint32]:
+        return self.colors.copy()
+
+    def changed_since(self, snapshot: npt.NDArray[np.uint32]) -> list[Pixel]:
+        """Pixels whose color differs from an earlier `snapshot()`."""
+        return self.pixels(np.flatnonzero(self.colors != snapshot))
@@ -0,0 +1,101 @@
+import dataclasses
+import logging
+import queue
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+Pixel = tuple[int, int]
+
+
+@dataclasses.dataclass(frozen=True)
+class WorkerEvent:
+    job: str
+    kind: str  # "progress", "pixel_settled", "pixel_failed", "done" or "error"
+    pixel: Pixel | None = None
+    message: str = ""
+
+
+class Reporter:
+    """Handed to each job so it can post progress back to the UI thread without touching Tk."""
+
+    def __init__(self, events: "queue.Queue[WorkerEvent] | None", job: str) -> None:
+        self._events = events
+        self.job = job
+        # Pixels whose outcome this reporter has posted.
+        self.reported: set[Pixel] = set()
+
+    def _post(self, event: WorkerEvent) -> None:
+        if self._events is not None:
+            self._events.put(event)
+            if event.pixel is not None:
+                self.reported.add(event.pixel)
+
+    def progress(self, message: str) -> None:
+        logger.info(message)
+        self._post(WorkerEvent(self.job, "progress", message=message))
+
+    def pixel_settled(self, pixel: Pixel, message: str = "") -> None:
+        self._post(WorkerEvent(self.job, "pixel_settled", pixel, message))
+
+    def pixel_failed(self, pixel: Pixel, message: str) -> None:
+        logger.error(f"❌ Pixel {pixel}: {message}")
+        self._post(WorkerEvent(self.job, "pixel_failed", pixel, message))
+
+
+NULL_REPORTER = Reporter(None, "inline")
+
+Job = Callable[[Reporter], None]
+
+
+class TransactionWorker:
+    """Runs Algorand submission jobs off the Tk main loop.
+
+    Jobs run on a background thread pool and report through a thread-safe queue. The UI drains
+    that queue from `after()` callbacks, so the event loop never blocks on algod.
+    """
+
+    def __init__(self, max_workers: int = 1) -> None:
+        # A single worker keeps settlements ordered; jobs parallelise their own submissions.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tx-worker"
+        )
+        self.events: queue.Queue[WorkerEvent] = queue.Queue()
+        self.pending = 0
+
+    def submit(
+        self, name: str, job: Job, pixels: Sequence[Pixel] = ()
+    ) -> "Future[None]":
+        """Queue `job`; if it raises, each of `pixels` it has not reported on is reported failed."""
+        self.pending += 1
+        return self._executor.submit(self._run, name, job, pixels)
+
+    def _run(self, name: str, job: Job, pixels: Sequence[Pixel]) -> None:
+        report = Reporter(self.events, name)
+        try:
+            job(report)
+        except Exception as e:
+            logger.exception(f"❌ Job {name} failed")
+            for pixel in pixels:
+                if pixel not in report.reported:
+                    report.pixel_failed(pixel, f"job {name} failed: {e}")
+            self.events.put(WorkerEvent(name, "error", message=str(e)))
+        else:
+            self.events.put(WorkerEvent(name, "done"))
+
+    def drain(self, limit: int) -> list[WorkerEvent]:
+        """Return up to `limit` queued events without blocking."""
+        events: list[WorkerEvent] = []
+        while len(events) < limit:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event.kind in ("done", "error"):
+                self.pending -= 1
+            events.append(event)
+        return events
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,149 @@
+import base64
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from algosdk import abi
+
+from benchmarks import budget_matrix
+from benchmarks.budget_matrix import (
+    UnsupportedArgument,
+    _paint_args,
+    abi_argument,
+    check_matrix,
+    is_sized,
+    measure,
+    superlinear_metrics,
+)
+from benchmarks.opcode_budget import BUY, OWNED_ROW, PAINT
+
+APP = SimpleNamespace(
+    app_id=1234, app_address="APPADDRESS", app_spec=SimpleNamespace(name="HelloWorld")
+)
+HELLO = abi.Method.from_signature("hello(string)string")
+
+
+def _points(costs: dict[int, int]) -> dict[str, dict[str, Any]]:
+    return {
+        str(size): {"budget": cost, "log_bytes": 21 + size, "fee": 1000}
+        for size, cost in costs.items()
+    }
+
+
+def _fake_simulate(
+    app_client: object, method: str, args: list[Any], sender: str
+) -> tuple[list[int], dict[str, Any]]:
+    """Answers like the hello contract: a fixed budget, and a log that fails past the AVM's 1KB."""
+    log = b"\x15\x1f\x7c\x75" + b"\x00\x00" + f"Hello, testing {args[0]}".encode()
+    if len(log) > 1024:
+        raise RuntimeError(
+            "logic eval error: program logs too large. 1045 bytes > 1024 bytes limit"
+        )
+    return [], {
+        "app-budget-consumed": 37,
+        "txn-result": {
+            "logs": [base64.b64encode(log).decode()],
+            "txn": {"txn": {"fee": 1000}},
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    ("arg_type", "expected"),
+    [
+        ("string", "aaaa"),
+        ("byte[]", b"aaaa"),
+        ("byte[2]", b"\x00\x00"),
+        ("uint64", 1),
+        ("bool", True),
+        ("uint16[]", [1, 1]),
+        ("(uint64,string)", (1, "aaaa")),
+        ("string[]", ["aaaa"]),
+    ],
+)
+def test_generates_arguments_from_abi_types(arg_type: str, expected: object) -> None:
+    assert abi_argument(abi.ABIType.from_string(arg_type), 4, APP) == expected  # type: ignore[arg-type]
+
+
+def test_reference_arguments() -> None:
+    assert abi_argument("account", 4, APP) == "APPADDRESS"  # type: ignore[arg-type]
+    assert abi_argument("application", 4, APP) == 1234  # type: ignore[arg-type]
+    with pytest.raises(UnsupportedArgument):
+        abi_argument("asset", 4, APP)  # type: ignore[arg-type]
+
+
+def test_only_variable_length_arguments_are_swept() -> None:
+    assert is_sized(HELLO)
+    assert not is_sized(abi.Method.from_signature("add(uint64,byte[32])uint64"))
+
+
+def test_measures_budget_logs_and_fee(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(budget_matrix, "simulate_trace", _fake_simulate)
+
+    assert measure(APP, HELLO, 10, "DEPLOYER") == {"budget": 37, "log_bytes": 31, "fee": 1000}  # type: ignore[arg-type]
+    error = measure(APP, HELLO, 1024, "DEPLOYER")["error"]  # type: ignore[arg-type]
+    assert error.startswith("logic eval error: program logs too large")
+
+
+def test_sweeps_every_method_in_the_artifacts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(budget_matrix, "simulate_trace", _fake_simulate)
+    monkeypatch.setattr(
+        budget_matrix,
+        "deploy_app",
+        lambda algorand, app_spec, deployer: SimpleNamespace(
+            app_id=1234, app_address="APPADDRESS", app_spec=app_spec
+        ),
+    )
+
+    matrix = budget_matrix.run(None, "DEPLOYER", [1, 64, 256, 4096])  # type: ignore[arg-type]
+
+    points = matrix["HelloWorld"]["hello(string)string"]
+    assert [point.get("log_bytes") for point in points.values()] == [22, 85, 277, None]
+    assert "error" in points["4096"]
+    canvas = matrix["PixelCanvas"]
+    assert sorted(canvas) == sorted(["create(uint64,uint64)void", BUY, PAINT])
+    # Only paint takes a variable-length argument.
+    assert [len(canvas[method]) for method in sorted(canvas)] == [1, 1, 4]
+    assert check_matrix(matrix, matrix) == []
+
+
+def test_paint_regions_hold_whole_pixels_in_canvas_wide_rows() -> None:
+    assert _paint_args(1) == (0, OWNED_ROW, 1, 1, bytes(3))
+    assert _paint_args(64) == (0, OWNED_ROW, 21, 1, bytes(63))
+    assert _paint_args(256)[2:4] == (29, 3)
+    assert _paint_args(1024)[2:4] == (31, 11)
+
+
+def test_detects_superlinear_growth() -> None:
+    sizes = (1, 16, 64, 256, 1024)
+    assert superlinear_metrics(_points({size: 37 for size in sizes})) == []
+    assert superlinear_metrics(_points({size: 40 + 3 * size for size in sizes})) == []
+    # A loop over every 8 bytes grows in steps but is still linear.
+    assert (
+        superlinear_metrics(_points({size: 40 + 9 * (size // 8) for size in sizes}))
+        == []
+    )
+    assert superlinear_metrics(
+        _points({size: 40 + size * size // 64 for size in sizes})
+    ) == ["budget"]
+    assert superlinear_metrics(_points({1: 37, 1024: 5000})) == []
+
+
+def test_check_matrix_against_baseline() -> None:
+    baseline = {
+        "HelloWorld": {"hello(string)string": _points({1: 37, 64: 37, 1024: 37})}
+    }
+    baseline["HelloWorld"]["hello(string)string"]["4096"] = {"error": "too large"}
+
+    measured = {
+        "HelloWorld": {"hello(string)string": _points({1: 37, 64: 38, 4096: 50})}
+    }
+    measured["HelloWorld"]["hello(string)string"]["1024"] = {"error": "logs too large"}
+
+    assert check_matrix(measured, baseline) == [
+        "HelloWorld.hello(string)string with 64B inputs: budget 38, up from 37",
+        "HelloWorld.hello(string)string fails with 1024B inputs, which it used to handle: logs too large",
+    ]
+    assert check_matrix(measured, baseline, tolerance=0.1) == [
+        "HelloWorld.hello(string)string fails with 1024B inputs, which it used to handle: logs too large",
+    ]
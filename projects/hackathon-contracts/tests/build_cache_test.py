@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from smart_contracts._helpers.build_cache import (
+    compute_manifest,
+    contract_sources,
+    is_up_to_date,
+    write_manifest,
+)
+
+
+def _make_project(tmp_path: Path) -> tuple[Path, Path]:
+    root = tmp_path / "smart_contracts"
+    (root / "shared").mkdir(parents=True)
+    (root / "shared" / "__init__.py").write_text("")
+    (root / "shared" / "constants.py").write_text("PRICE = 1\n")
+    (root / "my_app").mkdir()
+    (root / "my_app" / "helpers.py").write_text(
+        "from smart_contracts.shared import constants\n"
+    )
+    contract = root / "my_app" / "contract.py"
+    contract.write_text("import algopy\nfrom helpers import thing\n")
+    return root, contract
+
+
+def test_contract_sources_follows_local_imports(tmp_path: Path) -> None:
+    root, contract = _make_project(tmp_path)
+
+    sources = {
+        path.relative_to(root.resolve()).as_posix()
+        for path in contract_sources(contract, root)
+    }
+
+    assert sources == {
+        "my_app/contract.py",
+        "my_app/helpers.py",
+        "shared/__init__.py",
+        "shared/constants.py",
+    }
+
+
+def test_manifest_detects_changes_in_imported_modules(tmp_path: Path) -> None:
+    root, contract = _make_project(tmp_path)
+    output_dir = tmp_path / "artifacts"
+    output_dir.mkdir()
+    (output_dir / "MyApp.arc56.json").write_text("{}")
+
+    manifest = compute_manifest(contract, root, "py")
+    assert not is_up_to_date(output_dir, manifest)
+    write_manifest(output_dir, manifest)
+    assert is_up_to_date(output_dir, compute_manifest(contract, root, "py"))
+
+    (root / "shared" / "constants.py").write_text("PRICE = 2\n")
+    assert not is_up_to_date(output_dir, compute_manifest(contract, root, "py"))
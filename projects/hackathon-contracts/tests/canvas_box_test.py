@@ -0,0 +1,20 @@
+from canvas_box import decode_canvas, encode_region
+from pixel_state import PixelState
+
+
+def test_encode_region_round_trips_through_canvas_box() -> None:
+    state = PixelState(3, 4)
+    state.set_color(1, 1, "#112233")
+    state.set_color(2, 3, "#ff8000")
+
+    region = encode_region(state, x=1, y=1, w=3, h=2)
+    assert len(region) == 3 * 2 * 3
+    assert region[:3] == bytes.fromhex("112233")
+
+    canvas = bytearray(3 * 4 * 3)
+    for i in range(2):
+        start = ((1 + i) * 4 + 1) * 3
+        canvas[start : start + 9] = region[i * 9 : (i + 1) * 9]
+    decoded = decode_canvas(bytes(canvas), rows=3, cols=4)
+
+    assert list(decoded.colored_pixels()) == [((1, 1), "#112233"), ((2, 3), "#ff8000")]
@@ -0,0 +1,142 @@
+import threading
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import pytest
+from algokit_utils import (
+    ABIReturn,
+    AlgorandClient,
+    AppCallMethodCallParams,
+    CommonAppCallParams,
+)
+from algosdk.abi import ABIType
+from algosdk.atomic_transaction_composer import ABIResult
+from algosdk.v2client.algod import AlgodClient
+
+from benchmarks.fake_algod import FakeAlgod
+from smart_contracts.artifacts.hello_world.hello_world_client import (
+    HelloArgs,
+    HelloWorldClient,
+)
+
+STRING = ABIType.from_string("string")
+
+
+class _FakeComposer:
+    """Answers each `hello` call as the contract would, without sending anything."""
+
+    def __init__(self, sent: "_Sent") -> None:
+        self.sent = sent
+        self.calls: list[AppCallMethodCallParams] = []
+
+    def add_app_call_method_call(
+        self, params: AppCallMethodCallParams
+    ) -> "_FakeComposer":
+        self.calls.append(params)
+        return self
+
+    def simulate(self, **kwargs: object) -> None:
+        self.sent.simulated.append(kwargs)
+        if any(call.args == ["fail"] for call in self.calls):
+            raise RuntimeError("logic eval error: budget exceeded")
+
+    def send(self, params: object = None) -> SimpleNamespace:
+        with self.sent.lock:
+            self.sent.in_flight += 1
+            self.sent.max_in_flight = max(self.sent.max_in_flight, self.sent.in_flight)
+        # The first group is the slowest to confirm, so later groups finish before it.
+        time.sleep(0.1 if not self.sent.groups else 0.01)
+        with self.sent.lock:
+            self.sent.in_flight -= 1
+            self.sent.groups.append(self.calls)
+        returns = []
+        for call in self.calls:
+            value = f"Hello, {call.args[0]}"
+            returns.append(
+                ABIReturn(
+                    ABIResult("TX", STRING.encode(value), value, None, {}, call.method)
+                )
+            )
+        return SimpleNamespace(returns=returns)
+
+
+class _Sent:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.groups: list[list[AppCallMethodCallParams]] = []
+        self.simulated: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+@pytest.fixture()
+def sent() -> _Sent:
+    return _Sent()
+
+
+@pytest.fixture()
+def client(sent: _Sent, monkeypatch: pytest.MonkeyPatch) -> Iterator[HelloWorldClient]:
+    with FakeAlgod().running() as fake:
+        algorand = AlgorandClient.from_clients(algod=AlgodClient(fake.token, fake.url))
+        sender = algorand.account.from_mnemonic(mnemonic=fake.deployer_mnemonic)
+        client = HelloWorldClient(
+            algorand=algorand, app_id=1234, default_sender=sender.address
+        )
+        monkeypatch.setattr(algorand, "new_group", lambda: _FakeComposer(sent))
+        yield client
+
+
+def test_sends_full_groups_and_yields_returns_in_order(
+    client: HelloWorldClient, sent: _Sent
+) -> None:
+    names = [f"name {index}" for index in range(40)]
+    calls = [
+        (name,) if index % 2 else HelloArgs(name=name)
+        for index, name in enumerate(names)
+    ]
+
+    returns = list(client.send.hello_many(calls, max_in_flight=3))
+
+    assert returns == [f"Hello, {name}" for name in names]
+    assert sorted(len(group) for group in sent.groups) == [8, 16, 16]
+    assert 1 < sent.max_in_flight <= 3
+    assert sent.simulated == []
+
+
+def test_nothing_is_sent_until_iterated(client: HelloWorldClient, sent: _Sent) -> None:
+    returns = client.send.hello_many([("world",)] * 20)
+    assert sent.groups == []
+
+    assert next(returns) == "Hello, world"
+    returns.close()
+    assert len(sent.groups) <= 2
+
+
+def test_repeated_calls_get_distinct_notes(
+    client: HelloWorldClient, sent: _Sent
+) -> None:
+    params = CommonAppCallParams(note=b"batch")
+
+    list(
+        client.send.hello_many([("world",), ("world",), ("jane",), ("world",)], params)
+    )
+
+    notes = [call.note for call in sent.groups[0]]
+    assert notes == [b"batch", b"batch#1", b"batch", b"batch#2"]
+
+
+def test_failed_simulation_stops_sending(client: HelloWorldClient, sent: _Sent) -> None:
+    calls = [("world",)] * 16 + [("fail",)] + [("world",)] * 40
+
+    returns = client.send.hello_many(calls, simulate=True, max_in_flight=1)
+    with pytest.raises(RuntimeError, match="budget exceeded"):
+        list(returns)
+
+    assert len(sent.groups) == 1
+    assert sent.simulated[0] == {"skip_signatures": True}
+
+
+def test_rejects_an_empty_window(client: HelloWorldClient) -> None:
+    with pytest.raises(ValueError, match="max_in_flight"):
+        next(client.send.hello_many([("world",)], max_in_flight=0))
@@ -0,0 +1,93 @@
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from algokit_utils import (
+    ABIReturn,
+    AlgorandClient,
+    AppClientMethodCallParams,
+    CommonAppCallParams,
+)
+from algosdk.abi import ABIType
+from algosdk.atomic_transaction_composer import ABIResult
+from algosdk.v2client.algod import AlgodClient
+
+from benchmarks.fake_algod import FakeAlgod
+from smart_contracts._helpers.client_batches import add_batch_calls
+from smart_contracts._helpers.client_codecs import MARKER, add_method_codecs
+from smart_contracts._helpers.client_spec_cache import add_lazy_app_spec
+from smart_contracts.artifacts.hello_world import hello_world_client
+from smart_contracts.artifacts.hello_world.hello_world_client import (
+    HelloArgs,
+    HelloWorldClient,
+)
+
+CLIENT_PATH = Path(hello_world_client.__file__)
+SIGNATURE = "hello(string)string"
+
+
+@pytest.fixture()
+def client() -> Iterator[HelloWorldClient]:
+    with FakeAlgod().running() as fake:
+        algorand = AlgorandClient.from_clients(algod=AlgodClient(fake.token, fake.url))
+        sender = algorand.account.from_mnemonic(mnemonic=fake.deployer_mnemonic)
+        yield HelloWorldClient(
+            algorand=algorand, app_id=1234, default_sender=sender.address
+        )
+
+
+def test_generated_client_calls_through_codecs() -> None:
+    source = CLIENT_PATH.read_text(encoding="utf-8")
+
+    assert source.count(MARKER) == 1
+    assert (
+        f'_CODECS["{SIGNATURE}"].send(self.app_client, args, params, send_params)'
+        in source
+    )
+    assert hello_world_client._CODECS["hello"] is hello_world_client._CODECS[SIGNATURE]
+
+
+def test_adding_codecs_again_changes_nothing(tmp_path: Path) -> None:
+    client_path = tmp_path / CLIENT_PATH.name
+    shutil.copy(CLIENT_PATH, client_path)
+
+    assert add_method_codecs(client_path) == 0
+    assert add_batch_calls(client_path) == 0
+    add_lazy_app_spec(client_path)
+    assert client_path.read_text(encoding="utf-8") == CLIENT_PATH.read_text(
+        encoding="utf-8"
+    )
+
+
+@pytest.mark.parametrize("args", [("world",), HelloArgs(name="world")])
+def test_codec_builds_the_same_transaction_as_algokit(
+    client: HelloWorldClient, args: object
+) -> None:
+    params = CommonAppCallParams(note=b"same note")
+
+    built = client.create_transaction.hello(args, params).transactions[0]
+    expected = client.app_client.create_transaction.call(
+        AppClientMethodCallParams(method=SIGNATURE, args=["world"], note=b"same note")
+    ).transactions[0]
+
+    assert built.app_args == expected.app_args
+    assert built.app_args[0] == hello_world_client._CODECS[SIGNATURE].selector
+    assert (built.sender, built.index, built.on_complete, built.note) == (
+        expected.sender,
+        expected.index,
+        expected.on_complete,
+        expected.note,
+    )
+
+
+def test_decode_return_value_uses_codec(client: HelloWorldClient) -> None:
+    codec = hello_world_client._CODECS[SIGNATURE]
+    raw = ABIType.from_string("string").encode("Hello, testing world")
+    result = ABIReturn(
+        ABIResult("TX", raw, "Hello, testing world", None, {}, codec.method)
+    )
+
+    assert client.decode_return_value(SIGNATURE, result) == "Hello, testing world"
+    assert client.decode_return_value("hello", result) == "Hello, testing world"
+    assert client.decode_return_value(SIGNATURE, None) is None
@@ -0,0 +1,133 @@
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import ClassVar
+
+import client_factory
+import pytest
+from algosdk import transaction
+from algosdk.error import AlgodHTTPError
+from client_factory import SUGGESTED_PARAMS_TTL_ROUNDS, PooledAlgodClient
+from pixel_minting import ROUND_TIME_SECONDS
+
+
+class _AlgodHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: ClassVar[set[tuple[str, int]]] = set()
+    requests: ClassVar[list[tuple[str, str, dict[str, str]]]] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.connections.add(self.client_address)
+        self.requests.append(("GET", self.path, dict(self.headers)))
+        if self.path.startswith("/v2/missing"):
+            self._reply(
+                404, json.dumps({"message": "not found", "data": {"id": 1}}).encode()
+            )
+        elif self.path == "/v2/empty":
+            self._reply(200, b"")
+        else:
+            self._reply(200, json.dumps({"last-round": 7}).encode())
+
+    def _reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def algod() -> Iterator[PooledAlgodClient]:
+    _AlgodHandler.connections = set()
+    _AlgodHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _AlgodHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    client = PooledAlgodClient("secret", f"http://127.0.0.1:{server.server_address[1]}")
+    yield client
+    client.close()
+    server.shutdown()
+
+
+def test_requests_reuse_one_keep_alive_connection(algod: PooledAlgodClient) -> None:
+    for _ in range(5):
+        assert algod.algod_request("GET", "/status") == {"last-round": 7}
+
+    assert len(_AlgodHandler.connections) == 1
+
+
+def test_request_sends_auth_header_and_sdk_encoded_params(
+    algod: PooledAlgodClient,
+) -> None:
+    algod.algod_request("GET", "/status", params={"format": "json", "flag": True})
+
+    _, path, headers = _AlgodHandler.requests[0]
+    assert path == "/v2/status?format=json&flag=True"
+    assert headers["X-Algo-API-Token"] == "secret"
+
+
+def test_error_response_raises_algod_http_error(algod: PooledAlgodClient) -> None:
+    with pytest.raises(AlgodHTTPError) as error:
+        algod.algod_request("GET", "/missing")
+
+    assert str(error.value) == "not found"
+    assert error.value.code == 404
+    assert error.value.data == {"id": 1}
+
+
+def test_empty_json_response_is_empty_dict(algod: PooledAlgodClient) -> None:
+    assert algod.algod_request("GET", "/empty") == {}
+
+
+def test_account_is_resolved_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    client_factory.reset()
+    resolved: list[str] = []
+
+    def from_environment(self: object, name: str) -> SimpleNamespace:
+        resolved.append(name)
+        return SimpleNamespace(address=f"address:{name}", signer=object())
+
+    monkeypatch.setattr(
+        "algokit_utils.AccountManager.from_environment", from_environment
+    )
+    try:
+        assert client_factory.get_account() is client_factory.get_account()
+        assert client_factory.get_account().address == "address:DEPLOYER"
+        assert client_factory.get_algorand() is client_factory.get_algorand()
+        assert resolved == ["DEPLOYER"]
+    finally:
+        client_factory.reset()
+
+
+def test_suggested_params_are_cached_for_about_a_round(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client_factory.reset()
+    fetched: list[transaction.SuggestedParams] = []
+
+    def suggested_params(self: PooledAlgodClient) -> transaction.SuggestedParams:
+        params = transaction.SuggestedParams(fee=0, first=1, last=1001, gh="A" * 44)
+        fetched.append(params)
+        return params
+
+    monkeypatch.setattr(PooledAlgodClient, "suggested_params", suggested_params)
+    try:
+        algorand = client_factory.get_algorand()
+        algorand.get_suggested_params()
+        algorand.get_suggested_params()
+
+        expiry = algorand._cached_suggested_params_expiry
+        assert expiry is not None
+        assert (
+            0 < expiry - time.time() <= SUGGESTED_PARAMS_TTL_ROUNDS * ROUND_TIME_SECONDS
+        )
+        assert len(fetched) == 1
+    finally:
+        client_factory.reset()
@@ -0,0 +1,98 @@
+import importlib.util
+import pickle
+import shutil
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import algokit_utils
+import pytest
+
+from smart_contracts._helpers.client_spec_cache import CACHE_SUFFIX, add_lazy_app_spec
+from smart_contracts.artifacts.hello_world import hello_world_client
+
+CLIENT_PATH = Path(hello_world_client.__file__)
+CACHE_NAME = "HelloWorld" + CACHE_SUFFIX
+
+
+def _load_client(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"client_spec_cache_test_{id(path)}", path
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def client_path(tmp_path: Path) -> Path:
+    path = tmp_path / CLIENT_PATH.name
+    shutil.copy(CLIENT_PATH, path)
+    return path
+
+
+def _count_parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    parsed = []
+    from_json = algokit_utils.Arc56Contract.from_json
+
+    def counting_from_json(application_spec: str) -> algokit_utils.Arc56Contract:
+        parsed.append(application_spec)
+        return from_json(application_spec)
+
+    monkeypatch.setattr(algokit_utils.Arc56Contract, "from_json", counting_from_json)
+    return parsed
+
+
+def test_app_spec_is_parsed_on_first_use(
+    client_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    parsed = _count_parses(monkeypatch)
+
+    client = _load_client(client_path)
+    assert parsed == []
+
+    assert client.APP_SPEC.name == "HelloWorld"
+    assert client.APP_SPEC is client.APP_SPEC
+    assert len(parsed) == 1
+    assert (client_path.parent / CACHE_NAME).exists()
+
+
+def test_later_imports_load_the_pickled_spec(
+    client_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = _load_client(client_path).APP_SPEC
+    parsed = _count_parses(monkeypatch)
+
+    spec = _load_client(client_path).APP_SPEC
+
+    assert parsed == []
+    assert spec == expected
+
+
+@pytest.mark.parametrize(
+    "stale", [b"not a pickle", pickle.dumps(("another key", None))]
+)
+def test_stale_or_corrupt_cache_is_reparsed(
+    client_path: Path, monkeypatch: pytest.MonkeyPatch, stale: bytes
+) -> None:
+    (client_path.parent / CACHE_NAME).write_bytes(stale)
+    parsed = _count_parses(monkeypatch)
+
+    spec = _load_client(client_path).APP_SPEC
+
+    assert len(parsed) == 1
+    assert spec.name == "HelloWorld"
+    cached_key, cached_spec = pickle.loads(
+        (client_path.parent / CACHE_NAME).read_bytes()
+    )
+    assert cached_spec == spec
+
+
+def test_lazy_spec_is_added_once(client_path: Path) -> None:
+    source = client_path.read_text(encoding="utf-8")
+
+    assert "APP_SPEC = algokit_utils.Arc56Contract.from_json" not in source
+    assert not add_lazy_app_spec(client_path)
+    assert client_path.read_text(encoding="utf-8") == source
@@ -0,0 +1,201 @@
+import dataclasses
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import deploy_config
+import pytest
+from algokit_utils import AlgoAmount, AlgorandClient, PaymentParams, SigningAccount
+from algosdk.v2client.algod import AlgodClient
+from confirmation_tracker import (
+    Confirmation,
+    ConfirmationTimeout,
+    ConfirmationTracker,
+)
+from pixel_manifest import find_minted_pixels
+from pixel_minting import mint_pixel_assets_tracked, pixel_asset_params
+
+from benchmarks.fake_algod import FakeAlgod
+
+
+class _CountingAlgodClient(AlgodClient):
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.requests: Counter[str] = Counter()
+
+    def algod_request(
+        self, method: str, requrl: str, *args: Any, **kwargs: Any
+    ) -> Any:  # noqa: ANN401
+        self.requests[requrl.split("/")[1]] += 1
+        return super().algod_request(method, requrl, *args, **kwargs)
+
+
+@pytest.fixture()
+def fake() -> Iterator[FakeAlgod]:
+    with FakeAlgod(block_time=0.05).running() as fake:
+        yield fake
+
+
+@pytest.fixture()
+def algod(fake: FakeAlgod) -> _CountingAlgodClient:
+    return _CountingAlgodClient(fake.token, fake.url)
+
+
+@pytest.fixture()
+def algorand(algod: _CountingAlgodClient) -> AlgorandClient:
+    return AlgorandClient.from_clients(algod=algod)
+
+
+@pytest.fixture()
+def deployer(fake: FakeAlgod, algorand: AlgorandClient) -> SigningAccount:
+    return algorand.account.from_mnemonic(mnemonic=fake.deployer_mnemonic)
+
+
+def test_resolves_groups_with_asset_ids(
+    algorand: AlgorandClient, deployer: SigningAccount
+) -> None:
+    tracker = ConfirmationTracker(algorand)
+    submitted = []
+    for row in range(3):
+        composer = algorand.new_group()
+        for col in range(4):
+            composer.add_asset_create(pixel_asset_params(deployer.address, row, col))
+        submitted.extend(tracker.submit(composer, "mint_group"))
+
+    confirmed = tracker.wait_all()
+
+    assert tracker.pending == 0
+    assert [confirmation.txid for confirmation in confirmed] == submitted
+    assert all(
+        confirmation.confirmed_round > tracker.scanned_round - 10
+        for confirmation in confirmed
+    )
+    held = {
+        asset["index"]
+        for asset in algorand.client.algod.account_info(deployer.address)[
+            "created-assets"
+        ]
+    }
+    assert {confirmation.asset_id for confirmation in confirmed} == held
+
+
+def test_waits_once_per_round_not_per_transaction(
+    algorand: AlgorandClient, algod: _CountingAlgodClient, deployer: SigningAccount
+) -> None:
+    tracker = ConfirmationTracker(algorand)
+    first_round = tracker.scanned_round
+    for group in range(4):
+        composer = algorand.new_group()
+        for index in range(16):
+            composer.add_payment(
+                PaymentParams(
+                    sender=deployer.address,
+                    receiver=deployer.address,
+                    amount=AlgoAmount(micro_algo=0),
+                    note=f"{group}:{index}".encode(),
+                )
+            )
+        tracker.submit(composer)
+    algod.requests.clear()
+
+    confirmed = tracker.wait_all()
+
+    assert len(confirmed) == 64
+    # One transaction ID lookup per round, and payments never need the block itself.
+    assert algod.requests["blocks"] == tracker.scanned_round - first_round
+    assert algod.requests["status"] <= algod.requests["blocks"] < len(confirmed)
+    assert algod.requests["transactions"] == 0
+
+
+def test_expired_transactions_raise(
+    algorand: AlgorandClient, deployer: SigningAccount
+) -> None:
+    tracker = ConfirmationTracker(algorand)
+    composer = algorand.new_group().add_payment(
+        PaymentParams(
+            sender=deployer.address,
+            receiver=deployer.address,
+            amount=AlgoAmount(micro_algo=0),
+        )
+    )
+    txid = tracker.submit(composer)[0]
+    # Pretend the transaction was never included: skip past the rounds it could have landed in.
+    tracker._pending[txid].last_valid = tracker.scanned_round + 1
+    tracker.scanned_round += 5
+
+    with pytest.raises(ConfirmationTimeout) as error:
+        tracker.poll()
+
+    assert error.value.txids == [txid]
+    assert tracker.pending == 0
+
+
+def test_tracked_minting_records_every_pixel(
+    algorand: AlgorandClient, deployer: SigningAccount
+) -> None:
+    pixels = [(row, col) for row in range(5) for col in range(7)]
+    minted = []
+
+    created, stats = mint_pixel_assets_tracked(
+        algorand, deployer.address, pixels, window=1, on_minted=minted.extend
+    )
+
+    assert stats.transactions == len(pixels)
+    assert stats.groups == 3
+    assert {pixel.pixel: pixel.asset_id for pixel in minted} == created
+    assert find_minted_pixels(algorand, deployer.address) == created
+
+
+def test_tracked_minting_reads_asset_ids_the_block_lacked(
+    algorand: AlgorandClient,
+    deployer: SigningAccount,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    resolve_round = ConfirmationTracker._resolve_round
+
+    def without_asset_ids(
+        tracker: ConfirmationTracker, round_: int
+    ) -> list[Confirmation]:
+        return [
+            dataclasses.replace(confirmation, asset_id=None)
+            for confirmation in resolve_round(tracker, round_)
+        ]
+
+    monkeypatch.setattr(ConfirmationTracker, "_resolve_round", without_asset_ids)
+    pixels = [(0, col) for col in range(4)]
+
+    created, _ = mint_pixel_assets_tracked(algorand, deployer.address, pixels)
+
+    assert 0 not in created.values()
+    assert find_minted_pixels(algorand, deployer.address) == created
+
+
+def test_deploy_passes_the_window_to_the_tracked_minter(
+    algorand: AlgorandClient,
+    deployer: SigningAccount,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    windows = []
+
+    def mint(
+        *args: Any, window: int | None = None, **kwargs: Any
+    ) -> Any:  # noqa: ANN401
+        windows.append(window)
+        return mint_pixel_assets_tracked(*args, window=window, **kwargs)
+
+    monkeypatch.setattr(deploy_config, "get_algorand", lambda: algorand)
+    monkeypatch.setattr(deploy_config, "get_account", lambda name: deployer)
+    monkeypatch.setattr(deploy_config, "mint_pixel_assets_tracked", mint)
+
+    created = deploy_config.create_pixel_assets(
+        rows=2,
+        cols=3,
+        mode="tracked",
+        window=1,
+        manifest_path=tmp_path / "manifest.jsonl",
+    )
+
+    assert windows == [1]
+    assert sorted(created) == [(row, col) for row in range(2) for col in range(3)]
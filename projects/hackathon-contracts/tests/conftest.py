@@ -1,6 +1,7 @@
 import pytest
 from algokit_utils import AlgorandClient
 from algokit_utils.config import config
+from client_factory import get_algorand
 
 # Uncomment if you want to load network specific or generic .env file
 # @pytest.fixture(autouse=True, scope="session")
@@ -16,5 +17,5 @@ config.configure(
 
 @pytest.fixture(scope="session")
 def algorand_client() -> AlgorandClient:
-    # by default we are using localnet algod
-    return AlgorandClient.from_environment()
+    # by default we are using localnet algod, shared with the deploy scripts and pixel UI
+    return get_algorand()
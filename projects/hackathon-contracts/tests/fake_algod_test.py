@@ -0,0 +1,198 @@
+from collections.abc import Iterator
+
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AssetOptInParams,
+    AssetTransferParams,
+    PaymentParams,
+    SigningAccount,
+)
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+from pixel_manifest import find_minted_pixels
+from pixel_minting import mint_pixel_assets_batched
+from pixel_settlement import settle_pixels
+
+from benchmarks.fake_algod import FakeAlgod
+
+
+@pytest.fixture()
+def fake() -> Iterator[FakeAlgod]:
+    with FakeAlgod().running() as fake:
+        yield fake
+
+
+@pytest.fixture()
+def algorand(fake: FakeAlgod) -> AlgorandClient:
+    return AlgorandClient.from_clients(algod=AlgodClient(fake.token, fake.url))
+
+
+@pytest.fixture()
+def deployer(fake: FakeAlgod, algorand: AlgorandClient) -> SigningAccount:
+    return algorand.account.from_mnemonic(mnemonic=fake.deployer_mnemonic)
+
+
+def _funded(
+    algorand: AlgorandClient, deployer: SigningAccount, algo: int
+) -> SigningAccount:
+    account = algorand.account.random()
+    algorand.send.payment(
+        PaymentParams(
+            sender=deployer.address,
+            receiver=account.address,
+            amount=AlgoAmount(algo=algo),
+        )
+    )
+    return account
+
+
+def test_fake_looks_like_localnet(algorand: AlgorandClient) -> None:
+    assert algorand.client.is_localnet()
+
+
+def test_minted_pixels_are_visible_to_account_lookups(
+    algorand: AlgorandClient, deployer: SigningAccount
+) -> None:
+    pixels = [(row, col) for row in range(3) for col in range(7)]
+
+    created = mint_pixel_assets_batched(algorand, deployer.address, pixels)
+
+    assert len(set(created.values())) == len(pixels)
+    assert find_minted_pixels(algorand, deployer.address) == created
+
+
+def test_failed_group_is_rolled_back(
+    algorand: AlgorandClient, deployer: SigningAccount
+) -> None:
+    pixels = [(0, 0), (0, 1)]
+    created = mint_pixel_assets_batched(algorand, deployer.address, pixels)
+    receiver = _funded(algorand, deployer, 1)
+    for asset_id in created.values():
+        algorand.send.asset_opt_in(
+            AssetOptInParams(sender=receiver.address, asset_id=asset_id)
+        )
+    # Hand the second asset over early, so the deployer no longer holds it and its transfer fails.
+    algorand.send.asset_transfer(
+        AssetTransferParams(
+            sender=deployer.address,
+            receiver=receiver.address,
+            asset_id=created[(0, 1)],
+            amount=1,
+        )
+    )
+    balance_before = algorand.account.get_information(receiver.address).amount
+
+    summary = settle_pixels(
+        algorand, deployer.address, receiver.address, pixels, created, max_attempts=1
+    )
+
+    assert set(summary.failed) == set(pixels)
+    assert algorand.account.get_information(receiver.address).amount == balance_before
+
+
+def test_settlement_transfers_assets_and_payment(
+    algorand: AlgorandClient, deployer: SigningAccount
+) -> None:
+    pixels = [(0, col) for col in range(3)]
+    created = mint_pixel_assets_batched(algorand, deployer.address, pixels)
+    receiver = _funded(algorand, deployer, 1)
+    composer = algorand.new_group()
+    for asset_id in created.values():
+        composer.add_asset_opt_in(
+            AssetOptInParams(sender=receiver.address, asset_id=asset_id)
+        )
+    composer.send()
+
+    summary = settle_pixels(
+        algorand, deployer.address, receiver.address, pixels, created
+    )
+
+    assert summary.settled == pixels
+    held = {
+        asset["asset-id"]: asset["amount"]
+        for asset in algorand.client.algod.account_info(receiver.address)["assets"]
+    }
+    assert held == {asset_id: 1 for asset_id in created.values()}
+
+
+def test_settlement_keeps_a_group_committed_despite_a_lost_response(
+    algorand: AlgorandClient, deployer: SigningAccount, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pixels = [(0, col) for col in range(3)]
+    created = mint_pixel_assets_batched(algorand, deployer.address, pixels)
+    receiver = _funded(algorand, deployer, 1)
+    composer = algorand.new_group()
+    for asset_id in created.values():
+        composer.add_asset_opt_in(
+            AssetOptInParams(sender=receiver.address, asset_id=asset_id)
+        )
+    composer.send()
+    balance_before = algorand.account.get_information(receiver.address).amount
+    algod = algorand.client.algod
+    send_transactions = algod.send_transactions
+
+    def send_then_drop_the_response(*args: object, **kwargs: object) -> str:
+        send_transactions(*args, **kwargs)
+        raise ConnectionResetError("connection reset by peer")
+
+    monkeypatch.setattr(algod, "send_transactions", send_then_drop_the_response)
+
+    summary = settle_pixels(
+        algorand, deployer.address, receiver.address, pixels, created, retry_delay=0
+    )
+
+    assert summary.settled == pixels
+    assert summary.failed == {}
+    paid = algorand.account.get_information(receiver.address).amount - balance_before
+    assert paid.algo == 2 * len(pixels)
+
+
+def test_settlement_opts_the_receiver_in_first(
+    algorand: AlgorandClient, deployer: SigningAccount
+) -> None:
+    pixels = [(0, col) for col in range(20)]
+    created = mint_pixel_assets_batched(algorand, deployer.address, pixels)
+    receiver = _funded(algorand, deployer, 5)
+
+    summary = settle_pixels(
+        algorand,
+        deployer.address,
+        receiver.address,
+        pixels,
+        created,
+        max_attempts=1,
+        receiver_signer=receiver.signer,
+    )
+
+    assert summary.settled == pixels
+    held = {
+        asset["asset-id"]: asset["amount"]
+        for asset in algorand.client.algod.account_info(receiver.address)["assets"]
+    }
+    assert held == {asset_id: 1 for asset_id in created.values()}
+
+
+def test_unsupported_endpoint_is_404(algorand: AlgorandClient) -> None:
+    with pytest.raises(AlgodHTTPError) as error:
+        algorand.client.algod.application_info(1)
+
+    assert error.value.code == 404
+
+
+def test_block_time_confirms_in_later_blocks() -> None:
+    with FakeAlgod(block_time=0.05).running() as fake:
+        algorand = AlgorandClient.from_clients(algod=AlgodClient(fake.token, fake.url))
+        deployer = algorand.account.from_mnemonic(mnemonic=fake.deployer_mnemonic)
+        start_round = algorand.client.algod.status()["last-round"]
+
+        result = algorand.send.payment(
+            PaymentParams(
+                sender=deployer.address,
+                receiver=deployer.address,
+                amount=AlgoAmount(micro_algo=0),
+            )
+        )
+
+    assert result.confirmation["confirmed-round"] > start_round
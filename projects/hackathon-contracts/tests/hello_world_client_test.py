@@ -5,6 +5,7 @@ from algokit_utils import (
     AlgorandClient,
     SigningAccount,
 )
+from client_factory import get_account
 
 from smart_contracts.artifacts.hello_world.hello_world_client import (
     HelloWorldClient,
@@ -14,7 +15,7 @@ from smart_contracts.artifacts.hello_world.hello_world_client import (
 
 @pytest.fixture()
 def deployer(algorand_client: AlgorandClient) -> SigningAccount:
-    account = algorand_client.account.from_environment("DEPLOYER")
+    account = get_account("DEPLOYER")
     algorand_client.account.ensure_funded_from_environment(
         account_to_fund=account.address, min_spending_balance=AlgoAmount.from_algo(10)
     )
@@ -53,3 +54,13 @@ def test_simulate_says_hello_with_correct_budget_consumed(
     assert result.returns[0].value == "Hello, World"
     assert result.returns[1].value == "Hello, Jane"
     assert result.simulate_response["txn-groups"][0]["app-budget-consumed"] < 100
+
+
+def test_says_hello_many(hello_world_client: HelloWorldClient) -> None:
+    names = [f"World {index % 5}" for index in range(40)]
+
+    returns = hello_world_client.send.hello_many(
+        [(name,) for name in names], simulate=True
+    )
+
+    assert list(returns) == [f"Hello, testing {name}" for name in names]
@@ -0,0 +1,134 @@
+import json
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from instrumentation import (
+    METRICS,
+    TimedSigner,
+    algod_request_phase,
+    record_phase,
+    serve_metrics,
+    track_submission,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics() -> Iterator[None]:
+    METRICS.reset()
+    yield
+    METRICS.reset()
+
+
+def _phase_sums(operation: str) -> dict[str, float]:
+    return {
+        dict(labels)["phase"]: histogram.total
+        for (name, labels), histogram in METRICS.histograms.items()
+        if name == "algorand_submission_phase_seconds"
+        and dict(labels)["operation"] == operation
+    }
+
+
+def test_track_submission_splits_time_into_phases() -> None:
+    with track_submission("mint_group", 16):
+        record_phase("sign", 0.0)
+        record_phase("submit", 0.0)
+        record_phase("confirm", 0.0)
+
+    phases = _phase_sums("mint_group")
+    assert set(phases) == {"build", "sign", "submit", "confirm"}
+    assert (
+        METRICS.counters[
+            (
+                "algorand_transactions_total",
+                (("operation", "mint_group"), ("outcome", "ok")),
+            )
+        ]
+        == 16
+    )
+
+
+def test_failed_submission_is_counted_and_reraised() -> None:
+    with pytest.raises(RuntimeError), track_submission("settle_group", 3):
+        raise RuntimeError("rejected")
+
+    assert (
+        METRICS.counters[
+            (
+                "algorand_submissions_total",
+                (("operation", "settle_group"), ("outcome", "error")),
+            )
+        ]
+        == 1
+    )
+
+
+def test_record_phase_outside_a_submission_is_ignored() -> None:
+    record_phase("submit", 1.0)
+
+    assert not METRICS.histograms
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "phase"),
+    [
+        ("POST", "/transactions", "submit"),
+        ("GET", "/transactions/pending/ABC", "confirm"),
+        ("GET", "/status/wait-for-block-after/5", "confirm"),
+        ("GET", "/blocks/12/txids", "confirm"),
+        ("GET", "/transactions/params", "build"),
+    ],
+)
+def test_algod_request_phase(method: str, path: str, phase: str) -> None:
+    assert algod_request_phase(method, path) == phase
+
+
+def test_timed_signer_reports_sign_phase() -> None:
+    class _Signer:
+        def sign_transactions(self, txn_group: list, indexes: list[int]) -> list:
+            return [f"signed {i}" for i in indexes]
+
+    with track_submission("asset_create", 1):
+        assert TimedSigner(_Signer()).sign_transactions([], [0]) == ["signed 0"]  # type: ignore[arg-type]
+
+    assert _phase_sums("asset_create")["sign"] >= 0
+
+
+def test_prometheus_text_has_cumulative_buckets() -> None:
+    METRICS.observe("latency_seconds", 0.003, operation="x")
+    METRICS.observe("latency_seconds", 40.0, operation="x")
+    METRICS.inc("sends_total", operation="x")
+
+    text = METRICS.to_prometheus()
+
+    assert '# TYPE sends_total counter\nsends_total{operation="x"} 1' in text
+    assert 'latency_seconds_bucket{operation="x",le="0.005"} 1' in text
+    assert 'latency_seconds_bucket{operation="x",le="+Inf"} 2' in text
+    assert 'latency_seconds_count{operation="x"} 2' in text
+
+
+def test_write_picks_format_from_suffix(tmp_path: Path) -> None:
+    METRICS.inc("sends_total", operation="x")
+
+    METRICS.write(tmp_path / "metrics.json")
+    METRICS.write(tmp_path / "metrics.prom")
+
+    assert (
+        json.loads((tmp_path / "metrics.json").read_text())["counters"][0]["value"] == 1
+    )
+    assert (
+        (tmp_path / "metrics.prom").read_text().startswith("# TYPE sends_total counter")
+    )
+
+
+def test_serve_metrics() -> None:
+    METRICS.inc("sends_total", operation="x")
+    server = serve_metrics(0)
+    try:
+        with urllib.request.urlopen(
+            f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        ) as response:
+            assert b'sends_total{operation="x"} 1' in response.read()
+    finally:
+        server.shutdown()
@@ -0,0 +1,113 @@
+import pytest
+
+from benchmarks.opcode_budget import (
+    ARTIFACTS_DIR,
+    CREATE_ARGS,
+    PROFILE_CALLS,
+    ProgramMap,
+    _vlq_values,
+    artifact_specs,
+    check_baseline,
+    format_profile,
+    is_create_only,
+    profile_trace,
+)
+
+HELLO_MAP = ARTIFACTS_DIR / "hello_world" / "HelloWorld.approval.puya.map"
+# The program counters a `hello` call executes: the router, the NoOp check and the method body.
+HELLO_TRACE = [
+    1, 3, 6, 12, 15, 20, 22, 23, 25, 26, 27, 38, 41, 42, 44, 45, 47, 48, 50, 51, 52,
+    53, 56, 73, 74, 75, 76, 77, 78, 81, 82, 83, 89, 90, 91, 92, 94,
+]  # fmt: skip
+ROUTING = "smart_contracts.hello_world.contract.HelloWorld.hello[routing]"
+
+
+@pytest.fixture(scope="module")
+def program() -> ProgramMap:
+    return ProgramMap.load(HELLO_MAP)
+
+
+def test_decodes_vlq_segments() -> None:
+    assert _vlq_values("AAIA") == [0, 0, 4, 0]
+    assert _vlq_values("AAEU") == [0, 0, 2, 10]
+    assert _vlq_values("AACD") == [0, 0, 1, -1]
+    assert _vlq_values("gBAAA") == [16, 0, 0, 0]
+
+
+def test_maps_program_counters_to_ops_and_lines(program: ProgramMap) -> None:
+    assert program.sources[0].name == "contract.py"
+    assert program.ops[44] == "extract_uint16"
+    # The TEAL comments name the same lines: the router, @abimethod() and the method body.
+    assert [program.lines[pc][1] for pc in (1, 20, 56)] == [17, 18, 20]
+    assert program.subroutine_at(37) == "algopy.arc4.ARC4Contract.approval_program"
+    assert program.subroutine_at(94) == ROUTING
+
+
+def test_profiles_cost_by_line_and_stack(program: ProgramMap) -> None:
+    profile = profile_trace(
+        program, HELLO_TRACE, "HelloWorld", "hello(string)string", budget=37
+    )
+
+    assert {line.line: line.cost for line in profile.lines} == {17: 5, 18: 29, 20: 3}
+    assert profile.unattributed == 0
+    assert sum(profile.stacks.values()) == 37
+    assert (
+        profile.stacks[f"HelloWorld.hello(string)string;{ROUTING};contract.py:20"] == 3
+    )
+    assert "37 opcode budget" in format_profile(profile)
+
+
+def test_costly_and_unknown_opcodes(program: ProgramMap) -> None:
+    costly = ProgramMap(
+        program.sources,
+        program.lines,
+        {**program.ops, 74: "sha256"},
+        program.subroutines,
+    )
+
+    profile = profile_trace(
+        costly, HELLO_TRACE, "HelloWorld", "hello(string)string", budget=80
+    )
+
+    assert {line.line: line.cost for line in profile.lines}[20] == 3 - 1 + 35
+    assert profile.unattributed == 80 - 37 - 34
+    assert "unattributed" in format_profile(profile)
+
+
+def test_check_baseline_flags_regressions_only() -> None:
+    baseline = {"HelloWorld": {"hello(string)string": 37, "gone()void": 5}}
+
+    assert check_baseline({"HelloWorld": {"hello(string)string": 37}}, baseline) == []
+    assert (
+        check_baseline(
+            {"HelloWorld": {"hello(string)string": 30, "new()void": 9}}, baseline
+        )
+        == []
+    )
+    assert (
+        check_baseline(
+            {"HelloWorld": {"hello(string)string": 40}}, baseline, tolerance=0.1
+        )
+        == []
+    )
+    assert check_baseline(
+        {"HelloWorld": {"hello(string)string": 41}}, baseline, tolerance=0.1
+    ) == ["HelloWorld.hello(string)string used 41 opcode budget, up from 37"]
+
+
+def test_every_app_can_be_deployed_and_every_method_profiled() -> None:
+    for _, app_spec in artifact_specs():
+        assert "NoOp" in app_spec.bare_actions.create or app_spec.name in CREATE_ARGS
+        assert {
+            method.to_abi_method().get_signature() for method in app_spec.methods
+        } == set(PROFILE_CALLS[app_spec.name])
+
+
+def test_create_only_methods() -> None:
+    specs = {app_spec.name: app_spec for _, app_spec in artifact_specs()}
+
+    assert is_create_only(specs["PixelCanvas"], "create(uint64,uint64)void")
+    assert not is_create_only(
+        specs["PixelCanvas"], "paint(uint64,uint64,uint64,uint64,byte[])void"
+    )
+    assert not is_create_only(specs["HelloWorld"], "hello(string)string")
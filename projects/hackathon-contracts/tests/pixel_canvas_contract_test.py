@@ -0,0 +1,121 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Bytes, UInt64
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+from canvas_box import band_key, band_rows, decode_canvas, encode_region, join_bands
+from pixel_state import PixelState
+
+from smart_contracts.hello_world.contract import (
+    MAX_BOX_BYTES,
+    MAX_REGION_HEIGHT,
+    PRICE_PER_PIXEL,
+    PixelCanvas,
+)
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def _canvas(width: int, height: int) -> PixelCanvas:
+    contract = PixelCanvas()
+    contract.create(UInt64(width), UInt64(height))
+    return contract
+
+
+def _buy(
+    context: AlgopyTestContext,
+    contract: PixelCanvas,
+    x: int,
+    y: int,
+    w: int,
+    h: int,
+) -> None:
+    payment = context.any.txn.payment(
+        receiver=context.ledger.get_app(contract).address,
+        amount=UInt64(w * h * PRICE_PER_PIXEL),
+    )
+    contract.buy(UInt64(x), UInt64(y), UInt64(w), UInt64(h), payment)
+
+
+def _paint(
+    contract: PixelCanvas, x: int, y: int, w: int, h: int, colors: bytes
+) -> None:
+    contract.paint(UInt64(x), UInt64(y), UInt64(w), UInt64(h), Bytes(colors))
+
+
+@pytest.mark.parametrize(
+    ("width", "height", "error"),
+    [
+        (33, 1, "canvas too wide"),
+        (32, 342, "canvas too large"),
+        (0, 10, "empty canvas"),
+    ],
+)
+def test_create_rejects_canvases_beyond_box_limits(
+    context: AlgopyTestContext, width: int, height: int, error: str
+) -> None:
+    with pytest.raises(AssertionError, match=error):
+        _canvas(width, height)
+
+
+def test_create_fits_each_band_in_one_box(context: AlgopyTestContext) -> None:
+    contract = _canvas(32, 341)
+
+    assert contract.band_rows == band_rows(32) == 10
+    assert contract.band_rows * 32 * 3 <= MAX_BOX_BYTES
+
+
+def test_paint_writes_rows_across_bands(context: AlgopyTestContext) -> None:
+    # 20 columns make bands of 17 rows, so rows 15 to 20 straddle the first two bands.
+    contract = _canvas(20, 30)
+    state = PixelState(30, 20)
+    for row in range(15, 21):
+        state.set_color(row, 2, f"#{row:02x}8000")
+        state.set_color(row, 4, "#0000ff")
+    region = encode_region(state, x=2, y=15, w=3, h=6)
+
+    _buy(context, contract, x=2, y=15, w=3, h=6)
+    _paint(contract, x=2, y=15, w=3, h=6, colors=region)
+
+    bands = {
+        band: context.ledger.get_box(contract, band_key(band)) for band in range(2)
+    }
+    # The last band only holds the 13 rows left over.
+    assert [len(data) for data in bands.values()] == [17 * 20 * 3, 13 * 20 * 3]
+    decoded = decode_canvas(join_bands(bands, 30, 20), 30, 20)
+    assert list(decoded.colored_pixels()) == list(state.colored_pixels())
+
+
+def test_paint_creates_only_the_bands_it_touches(context: AlgopyTestContext) -> None:
+    contract = _canvas(20, 60)
+
+    _buy(context, contract, x=0, y=40, w=1, h=1)
+    _paint(contract, x=0, y=40, w=1, h=1, colors=bytes.fromhex("abcdef"))
+
+    assert [
+        context.ledger.box_exists(contract, band_key(band)) for band in range(4)
+    ] == [False, False, True, False]
+
+
+def test_paint_rejects_pixels_not_owned_by_the_sender(
+    context: AlgopyTestContext,
+) -> None:
+    contract = _canvas(10, 10)
+    _buy(context, contract, x=0, y=0, w=2, h=1)
+
+    with pytest.raises(AssertionError, match="pixel not owned"):
+        _paint(contract, x=1, y=0, w=2, h=1, colors=bytes(6))
+
+
+def test_buy_rejects_regions_owned_or_too_tall(context: AlgopyTestContext) -> None:
+    contract = _canvas(10, 10)
+    _buy(context, contract, x=0, y=0, w=2, h=2)
+
+    with pytest.raises(AssertionError, match="pixel already owned"):
+        _buy(context, contract, x=1, y=1, w=2, h=2)
+    with pytest.raises(AssertionError, match="region too tall"):
+        _buy(context, contract, x=5, y=0, w=1, h=MAX_REGION_HEIGHT + 1)
@@ -0,0 +1,117 @@
+import tkinter as tk
+from types import SimpleNamespace
+
+import pixel_canvas
+import pytest
+from pixel_canvas import MAX_CANVAS_SIZE, PixelCanvas
+
+
+class _FakePhotoImage:
+    """Records the regions written to it instead of drawing them."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.puts: list[tuple[str, tuple[int, int, int, int]]] = []
+
+    def put(self, color: str, to: tuple[int, int, int, int]) -> None:
+        self.puts.append((color, to))
+
+
+@pytest.fixture(autouse=True)
+def fake_tk(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Build canvases without a display: Tk calls on the canvas only record what they would draw."""
+
+    def init(self: PixelCanvas, master: object, **options: object) -> None:
+        self.options = options
+        self.lines: list[tuple[int, ...]] = []
+        self.bindings: dict[str, object] = {}
+
+    monkeypatch.setattr(tk.Canvas, "__init__", init)
+    monkeypatch.setattr(tk.Canvas, "create_image", lambda self, *args, **kwargs: 1)
+    monkeypatch.setattr(
+        tk.Canvas, "create_line", lambda self, *args, **kwargs: self.lines.append(args)
+    )
+    monkeypatch.setattr(
+        tk.Canvas,
+        "bind",
+        lambda self, sequence, func: self.bindings.update({sequence: func}),
+    )
+    monkeypatch.setattr(pixel_canvas.tk, "PhotoImage", _FakePhotoImage)
+
+
+def _canvas(rows: int, cols: int, pixel_size: int = 25) -> PixelCanvas:
+    clicks: list[tuple[int, int]] = []
+    canvas = PixelCanvas(
+        None,
+        rows=rows,
+        cols=cols,
+        pixel_size=pixel_size,
+        on_click=lambda *cell: clicks.append(cell),
+    )
+    canvas.clicks = clicks
+    return canvas
+
+
+@pytest.mark.parametrize(
+    ("rows", "cols", "pixel_size", "cell_size"),
+    [
+        (10, 10, 25, 25),
+        (50, 20, 25, 20),
+        (100, 100, 25, 10),
+        (1000, 10, 25, 1),
+        (4000, 4000, 25, 1),
+        (0, 0, 25, 25),
+    ],
+)
+def test_cells_shrink_to_fit_the_largest_side(
+    rows: int, cols: int, pixel_size: int, cell_size: int
+) -> None:
+    canvas = _canvas(rows, cols, pixel_size)
+
+    assert canvas.cell_size == cell_size
+    assert (canvas.options["width"], canvas.options["height"]) == (
+        cols * cell_size,
+        rows * cell_size,
+    )
+    assert max(canvas.image.width, canvas.image.height) <= max(
+        MAX_CANVAS_SIZE, rows, cols
+    )
+
+
+def test_grid_lines_only_on_cells_big_enough_for_them() -> None:
+    assert len(_canvas(3, 4).lines) == (3 + 1) + (4 + 1)
+    assert _canvas(1000, 1000).lines == []
+
+
+def test_cell_at_maps_coordinates_to_cells() -> None:
+    canvas = _canvas(rows=4, cols=6, pixel_size=10)
+
+    assert canvas.cell_at(0, 0) == (0, 0)
+    assert canvas.cell_at(9.9, 9.9) == (0, 0)
+    assert canvas.cell_at(10, 0) == (0, 1)
+    assert canvas.cell_at(59, 39) == (3, 5)
+    assert canvas.cell_at(60, 0) is None
+    assert canvas.cell_at(0, 40) is None
+    assert canvas.cell_at(-1, 5) is None
+
+
+def test_paint_writes_exactly_the_cells_block() -> None:
+    canvas = _canvas(rows=4, cols=6, pixel_size=10)
+
+    canvas.paint(2, 3, "#ff0000")
+
+    assert canvas.image.puts == [
+        ("white", (0, 0, 60, 40)),
+        ("#ff0000", (30, 20, 40, 30)),
+    ]
+
+
+def test_clicks_report_the_cell_under_the_mouse() -> None:
+    canvas = _canvas(rows=4, cols=6, pixel_size=10)
+    on_click = canvas.bindings["<Button-1>"]
+
+    on_click(SimpleNamespace(x=35, y=25))
+    on_click(SimpleNamespace(x=75, y=5))
+
+    assert canvas.clicks == [(2, 3)]
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from pixel_manifest import PixelManifest, load_pixel_assets
+from pixel_minting import MintedPixel
+
+
+def test_manifest_resumes_from_disk(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.jsonl"
+    manifest = PixelManifest.open(path, "GH", "CREATOR")
+    manifest.record(
+        [MintedPixel((0, 0), 101, "TX1", 5), MintedPixel((0, 1), 102, "TX2", 5)]
+    )
+
+    reopened = PixelManifest.open(path, "GH", "CREATOR")
+
+    assert reopened.asset_ids() == {(0, 0): 101, (0, 1): 102}
+    assert reopened.entries[(0, 1)].txid == "TX2"
+    assert reopened.entries[(0, 1)].confirmed_round == 5
+
+
+def test_manifest_starts_fresh_on_other_network(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.jsonl"
+    PixelManifest.open(path, "GH", "CREATOR").record([MintedPixel((0, 0), 101)])
+
+    reopened = PixelManifest.open(path, "OTHER", "CREATOR")
+
+    assert (0, 0) not in reopened
+
+
+def test_reconcile_recovers_and_drops_entries(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.jsonl"
+    manifest = PixelManifest.open(path, "GH", "CREATOR")
+    manifest.record([MintedPixel((0, 0), 101), MintedPixel((0, 1), 999)])
+
+    manifest.reconcile({(0, 0): 101, (0, 1): 102, (1, 0): 103})
+
+    expected = {(0, 0): 101, (0, 1): 102, (1, 0): 103}
+    assert manifest.asset_ids() == expected
+    assert PixelManifest.open(path, "GH", "CREATOR").asset_ids() == expected
+
+
+def test_load_pixel_assets_builds_cache_from_manifest(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.jsonl"
+    PixelManifest.open(path, "GH", "CREATOR").record(
+        [MintedPixel((0, 0), 101), MintedPixel((2, 1), 102)]
+    )
+
+    pixel_assets = load_pixel_assets(path)
+
+    assert path.with_suffix(".bin").exists()
+    assert (pixel_assets.rows, pixel_assets.cols) == (3, 2)
+    assert dict(pixel_assets) == {(0, 0): 101, (2, 1): 102}
+    assert pixel_assets.get((1, 1)) is None
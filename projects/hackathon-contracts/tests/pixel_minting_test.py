@@ -0,0 +1,118 @@
+import itertools
+import threading
+from types import SimpleNamespace
+
+import pytest
+from pixel_minting import (
+    MAX_GROUP_SIZE,
+    chunked,
+    mint_pixel_assets_pipelined,
+    mint_pixel_assets_sequential,
+    pixel_asset_params,
+)
+
+
+class _FakeComposer:
+    def __init__(self, algorand: "_FakeAlgorand") -> None:
+        self.algorand = algorand
+        self.params: list = []
+
+    def add_asset_create(self, params: object) -> "_FakeComposer":
+        self.params.append(params)
+        return self
+
+    def send(self) -> SimpleNamespace:
+        with self.algorand.lock:
+            asset_ids = [next(self.algorand.asset_ids) for _ in self.params]
+        return SimpleNamespace(
+            tx_ids=[f"TX{asset_id}" for asset_id in asset_ids],
+            confirmations=[
+                {"asset-index": asset_id, "confirmed-round": 1}
+                for asset_id in asset_ids
+            ],
+        )
+
+
+class _FakeAlgorand:
+    """Just enough of AlgorandClient for the minting helpers."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.asset_ids = itertools.count(1000)
+        self.params_fetches = 0
+        self.client = SimpleNamespace(
+            is_localnet=lambda: True,
+            algod=SimpleNamespace(suggested_params=self._suggested_params),
+        )
+
+    def _suggested_params(self) -> object:
+        self.params_fetches += 1
+        return object()
+
+    def set_suggested_params_cache(
+        self, params: object, until: float | None = None
+    ) -> None:
+        pass
+
+    def new_group(self) -> _FakeComposer:
+        return _FakeComposer(self)
+
+    @property
+    def send(self) -> SimpleNamespace:
+        return SimpleNamespace(asset_create=self._asset_create)
+
+    def _asset_create(self, params: object) -> SimpleNamespace:
+        asset_id = next(self.asset_ids)
+        return SimpleNamespace(
+            asset_id=asset_id,
+            tx_id=f"TX{asset_id}",
+            confirmation={"confirmed-round": 1},
+        )
+
+
+def test_chunked_packs_full_groups_and_remainder() -> None:
+    pixels = [(0, col) for col in range(35)]
+
+    groups = list(chunked(pixels, MAX_GROUP_SIZE))
+
+    assert [len(group) for group in groups] == [16, 16, 3]
+    assert [pixel for group in groups for pixel in group] == pixels
+
+
+@pytest.mark.parametrize("size", [0, MAX_GROUP_SIZE + 1])
+def test_chunked_rejects_invalid_group_size(size: int) -> None:
+    with pytest.raises(ValueError, match="Group size"):
+        list(chunked([(0, 0)], size))
+
+
+def test_pixel_asset_params_names_pixel() -> None:
+    params = pixel_asset_params("SENDER", 12, 345)
+
+    assert params.asset_name == "Pixel_12x345"
+    assert params.unit_name == "12x345"
+    assert params.total == 1
+
+
+def test_mint_pixel_assets_pipelined_maps_every_pixel() -> None:
+    algorand = _FakeAlgorand()
+    pixels = [(row, col) for row in range(10) for col in range(10)]
+
+    created, stats = mint_pixel_assets_pipelined(algorand, "SENDER", pixels, window=3)  # type: ignore[arg-type]
+
+    assert set(created) == set(pixels)
+    assert len(set(created.values())) == len(pixels)
+    assert stats.transactions == 100
+    assert stats.groups == 7
+    # Every group is built in the same round, so params are fetched once.
+    assert algorand.params_fetches == 1
+
+
+def test_sequential_mint_reports_each_pixel() -> None:
+    algorand = _FakeAlgorand()
+    pixels = [(0, 0), (0, 1), (1, 0)]
+    reported: list = []
+
+    created = mint_pixel_assets_sequential(algorand, "SENDER", pixels, on_minted=reported.extend)  # type: ignore[arg-type]
+
+    assert created == {(0, 0): 1000, (0, 1): 1001, (1, 0): 1002}
+    assert [minted.txid for minted in reported] == ["TX1000", "TX1001", "TX1002"]
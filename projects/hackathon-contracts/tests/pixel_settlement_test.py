@@ -0,0 +1,202 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from algosdk import account, transaction
+from algosdk.error import AlgodHTTPError
+from pixel_settlement import OPT_INS_PER_GROUP, PIXELS_PER_GROUP, settle_pixels
+
+RECEIVER = account.generate_account()[1]
+SUGGESTED_PARAMS = transaction.SuggestedParams(
+    fee=1000, first=1, last=1001, gh="A" * 44, flat_fee=True
+)
+
+
+class _FakeComposer:
+    def __init__(self, algorand: "_FakeAlgorand") -> None:
+        self.algorand = algorand
+        algorand.composers += 1
+        self.txid = f"TX{algorand.composers}"
+        self.payments: list = []
+        self.transfers: list = []
+        self.opt_ins: list = []
+
+    def add_payment(self, params: object) -> "_FakeComposer":
+        self.payments.append(params)
+        return self
+
+    def add_asset_transfer(self, params: object) -> "_FakeComposer":
+        self.transfers.append(params)
+        return self
+
+    def add_asset_opt_in(self, params: SimpleNamespace) -> "_FakeComposer":
+        self.opt_ins.append(params)
+        return self
+
+    def build_transactions(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            transactions=[
+                transaction.AssetOptInTxn(
+                    params.sender, SUGGESTED_PARAMS, params.asset_id
+                )
+                for params in self.opt_ins
+            ]
+        )
+
+    def build(self) -> SimpleNamespace:
+        txn = SimpleNamespace(get_txid=lambda: self.txid, last_valid_round=1001)
+        return SimpleNamespace(transactions=[SimpleNamespace(txn=txn)])
+
+    def send(self) -> SimpleNamespace:
+        self.algorand.attempts += 1
+        if self.algorand.attempts in self.algorand.fail_attempts:
+            raise RuntimeError("pool error")
+        self.algorand.groups.append(self)
+        if self.algorand.attempts in self.algorand.lost_responses:
+            raise RuntimeError("connection reset")
+        return SimpleNamespace(tx_ids=[self.txid])
+
+
+class _Report:
+    def __init__(self) -> None:
+        self.settled: list[tuple[int, int]] = []
+
+    def pixel_settled(self, pixel: tuple[int, int]) -> None:
+        self.settled.append(pixel)
+
+    def pixel_failed(self, pixel: tuple[int, int], reason: str) -> None:
+        raise AssertionError(f"{pixel} failed: {reason}")
+
+    def progress(self, message: str) -> None:
+        pass
+
+
+class _FakeAlgorand:
+    def __init__(
+        self,
+        fail_attempts: set[int] | None = None,
+        held: set[int] | None = None,
+        lost_responses: set[int] | None = None,
+        account_info_error: Exception | None = None,
+    ) -> None:
+        self.fail_attempts = fail_attempts or set()
+        self.account_info_error = account_info_error
+        # Attempts whose group is committed, but whose send raises anyway.
+        self.lost_responses = lost_responses or set()
+        self.attempts = 0
+        self.composers = 0
+        self.groups: list[_FakeComposer] = []
+        # The receiver holds every asset unless told otherwise.
+        self.held = held
+        self.account_reads = 0
+        self.client = SimpleNamespace(
+            algod=SimpleNamespace(
+                account_info=self._account_info,
+                status=lambda: {"last-round": 10},
+                pending_transaction_info=self._pending_transaction_info,
+            )
+        )
+
+    def _pending_transaction_info(self, txid: str) -> dict:
+        if not any(group.txid == txid for group in self.groups):
+            raise AlgodHTTPError("txn does not exist", 404)
+        return {"confirmed-round": 10, "pool-error": ""}
+
+    def _account_info(self, address: str) -> dict:
+        self.account_reads += 1
+        if self.account_info_error:
+            raise self.account_info_error
+        held = self.held if self.held is not None else range(1000)
+        return {
+            "address": address,
+            "assets": [{"asset-id": asset_id, "amount": 0} for asset_id in held],
+        }
+
+    def new_group(self) -> _FakeComposer:
+        return _FakeComposer(self)
+
+
+def test_settle_pixels_pays_per_group() -> None:
+    algorand = _FakeAlgorand()
+    pixels = [(0, col) for col in range(20)]
+    pixel_assets = {pixel: 100 + col for col, pixel in enumerate(pixels)}
+
+    summary = settle_pixels(algorand, "S", "R", pixels, pixel_assets)  # type: ignore[arg-type]
+
+    assert summary.settled == pixels
+    assert summary.groups == 2
+    assert [len(group.transfers) for group in algorand.groups] == [PIXELS_PER_GROUP, 5]
+    assert [group.payments[0].amount.algo for group in algorand.groups] == [30, 10]
+
+
+def test_settle_pixels_retries_and_reports_failures() -> None:
+    # First group fails once then succeeds; second group fails every attempt.
+    algorand = _FakeAlgorand(fail_attempts={1, 3, 4, 5})
+    pixels = [(0, col) for col in range(16)] + [(1, 0)]
+    pixel_assets = {pixel: 1 for pixel in pixels if pixel != (1, 0)}
+
+    summary = settle_pixels(algorand, "S", "R", pixels, pixel_assets, retry_delay=0)  # type: ignore[arg-type]
+
+    assert summary.settled == pixels[:PIXELS_PER_GROUP]
+    assert set(summary.failed) == {(0, 15), (1, 0)}
+    assert "no deployed asset" in summary.failed[(1, 0)]
+
+
+def test_settle_pixels_does_not_resend_a_group_committed_despite_an_error() -> None:
+    algorand = _FakeAlgorand(lost_responses={1})
+    pixels = [(0, col) for col in range(3)]
+    report = _Report()
+
+    summary = settle_pixels(algorand, "S", "R", pixels, {pixel: 1 for pixel in pixels}, report, retry_delay=0)  # type: ignore[arg-type]
+
+    assert summary.settled == pixels
+    assert summary.failed == {}
+    assert algorand.attempts == 1
+    assert report.settled == pixels
+
+
+def test_settle_pixels_respects_pixels_per_group() -> None:
+    algorand = _FakeAlgorand()
+    pixels = [(0, col) for col in range(3)]
+
+    summary = settle_pixels(algorand, "S", "R", pixels, {pixel: 1 for pixel in pixels}, pixels_per_group=1)  # type: ignore[arg-type]
+
+    assert summary.groups == 3
+    assert [group.payments[0].amount.algo for group in algorand.groups] == [2, 2, 2]
+
+
+def test_settle_pixels_fails_pixels_the_receiver_has_not_opted_in_to(
+    tmp_path: Path,
+) -> None:
+    algorand = _FakeAlgorand(held={100, 101})
+    pixels = [(0, col) for col in range(20)]
+    pixel_assets = {pixel: 100 + col for col, pixel in enumerate(pixels)}
+    requests = tmp_path / "opt_ins.txn"
+
+    summary = settle_pixels(algorand, "S", RECEIVER, pixels, pixel_assets, opt_in_requests=requests)  # type: ignore[arg-type]
+
+    assert summary.settled == pixels[:2]
+    assert set(summary.failed) == set(pixels[2:])
+    assert "not opted in" in summary.failed[(0, 2)]
+    # Holdings are read once, and no transfer of an asset the receiver cannot hold is attempted.
+    assert algorand.account_reads == 1
+    assert algorand.attempts == 1
+    opt_ins = transaction.retrieve_from_file(str(requests))
+    assert [txn.index for txn in opt_ins] == list(range(102, 120))
+    assert len({txn.group for txn in opt_ins[:OPT_INS_PER_GROUP]}) == 1
+    assert opt_ins[OPT_INS_PER_GROUP - 1].group != opt_ins[OPT_INS_PER_GROUP].group
+
+
+def test_settle_pixels_fails_every_pixel_when_holdings_cannot_be_read() -> None:
+    algorand = _FakeAlgorand(account_info_error=AlgodHTTPError("unavailable", 503))
+    pixels = [(0, col) for col in range(3)] + [(1, 0)]
+    pixel_assets = {pixel: 1 for pixel in pixels[:3]}
+
+    summary = settle_pixels(algorand, "S", "R", pixels, pixel_assets)  # type: ignore[arg-type]
+
+    assert summary.settled == []
+    assert set(summary.failed) == set(pixels)
+    assert (
+        "reading the receiver's holdings failed: unavailable" in summary.failed[(0, 0)]
+    )
+    assert "no deployed asset" in summary.failed[(1, 0)]
+    assert algorand.attempts == 0
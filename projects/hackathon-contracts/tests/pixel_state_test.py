@@ -0,0 +1,70 @@
+from pixel_state import PixelState, hex_to_rgba, rgba_to_hex
+
+
+def test_hex_rgba_round_trip() -> None:
+    assert hex_to_rgba("#12abef") == 0x12ABEFFF
+    assert rgba_to_hex(0x12ABEFFF) == "#12abef"
+    # Black is still a color, distinct from "uncolored".
+    assert hex_to_rgba("#000000") != 0
+
+
+def test_selection() -> None:
+    state = PixelState(4, 5)
+
+    assert state.toggle_selected(1, 2) is True
+    state.select_rect(2, 0, 4, 2)
+    state.select([(0, 4)])
+
+    assert state.selected_count() == 6
+    assert state.selected_pixels() == [(0, 4), (1, 2), (2, 0), (2, 1), (3, 0), (3, 1)]
+    assert state.toggle_selected(1, 2) is False
+    state.clear_selection()
+    assert state.selected_count() == 0
+
+
+def test_colors_and_diff() -> None:
+    state = PixelState(3, 3)
+    state.set_color(0, 0, "#ff0000")
+    before = state.snapshot()
+
+    state.select([(1, 1), (2, 2)])
+    state.color_selected("#00ff00")
+    state.color_many([(0, 0)], "#ff0000")
+
+    assert state.color(1, 1) == "#00ff00"
+    assert state.color(0, 1) is None
+    assert state.colored_count() == 3
+    assert list(state.colored_pixels()) == [
+        ((0, 0), "#ff0000"),
+        ((1, 1), "#00ff00"),
+        ((2, 2), "#00ff00"),
+    ]
+    assert state.changed_since(before) == [(1, 1), (2, 2)]
+
+
+def test_take_unsettled_returns_only_the_session_delta() -> None:
+    state = PixelState(3, 3)
+    state.set_color(0, 0, "#ff0000")
+    state.set_color(1, 1, "#00ff00")
+
+    assert state.take_unsettled() == [(0, 0), (1, 1)]
+    state.mark_owned([(0, 0)])
+    state.mark_unsettled([(1, 1)])  # settlement failed
+
+    # Next session: recolor an owned pixel and color a new one.
+    state.set_color(0, 0, "#0000ff")
+    state.set_color(2, 2, "#0000ff")
+
+    assert state.take_unsettled() == [(1, 1), (2, 2)]
+    assert state.take_unsettled() == []
+    assert state.owned_count() == 1
+
+
+def test_pixels_in_flight_are_not_taken_twice() -> None:
+    state = PixelState(2, 2)
+    state.set_color(0, 0, "#ff0000")
+    assert state.take_unsettled() == [(0, 0)]
+
+    state.set_color(0, 0, "#00ff00")  # recolored while its settlement is in flight
+
+    assert state.take_unsettled() == []
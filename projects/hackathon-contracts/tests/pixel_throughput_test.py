@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.pixel_throughput import RecordingAlgorand, Submission, summarize
+
+
+class _FakeComposer:
+    def __init__(self) -> None:
+        self.added: list[object] = []
+
+    def add_payment(self, params: object) -> "_FakeComposer":
+        self.added.append(params)
+        return self
+
+    def send(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            confirmations=[{"txn": {"txn": {"fee": 1000}}} for _ in self.added]
+        )
+
+
+def _fake_algorand() -> SimpleNamespace:
+    return SimpleNamespace(
+        new_group=_FakeComposer,
+        send=SimpleNamespace(
+            asset_create=lambda params: SimpleNamespace(
+                confirmation={"txn": {"txn": {}}}
+            )
+        ),
+        client="client",
+    )
+
+
+def test_recording_algorand_records_groups_and_single_sends() -> None:
+    recorder = RecordingAlgorand(_fake_algorand())  # type: ignore[arg-type]
+
+    recorder.new_group().add_payment("a").add_payment("b").send()
+    recorder.send.asset_create("c")
+
+    assert [(s.transactions, s.fees) for s in recorder.submissions] == [
+        (2, 2000),
+        (1, 0),
+    ]
+    assert recorder.client == "client"
+
+
+def test_summarize_weights_latency_by_transactions() -> None:
+    submissions = [
+        Submission(transactions=15, latency=0.1, fees=15_000),
+        Submission(1, 2.0, 1_000),
+    ]
+
+    result = summarize("mint", "batched", 4, 4, elapsed=2.0, submissions=submissions)
+
+    assert result["transactions"] == 16
+    assert result["txns_per_second"] == 8.0
+    assert result["confirmation_latency_seconds"]["p50"] == pytest.approx(0.1)
+    assert result["confirmation_latency_seconds"]["p99"] > 1.0
+    assert result["fees_microalgos"] == {"total": 16_000, "per_transaction": 1000.0}
+
+
+def test_summarize_without_submissions() -> None:
+    result = summarize("settle", "batched", 0, 0, elapsed=0.0, submissions=[])
+
+    assert result["txns_per_second"] == 0.0
+    assert result["confirmation_latency_seconds"] == {"p50": 0.0, "p99": 0.0}
@@ -0,0 +1,32 @@
+import sys
+
+import pytest
+
+from smart_contracts._helpers.startup_profile import StartupProfile
+
+
+def test_phase_records_third_party_packages_only(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    profile = StartupProfile()
+    with profile.phase("imports"):
+        monkeypatch.setitem(sys.modules, "fake_sdk.client", object())
+        monkeypatch.setitem(sys.modules, "json.decoder_copy", object())
+
+    (phase,) = profile.phases
+    assert phase.name == "imports"
+    assert phase.modules == ["fake_sdk"]
+    assert phase.seconds >= 0
+
+
+def test_report_lists_phases_and_total() -> None:
+    profile = StartupProfile()
+    with profile.phase("first"):
+        pass
+    with profile.phase("second"):
+        pass
+
+    report = profile.report().splitlines()
+
+    assert report[0] == "Import times:"
+    assert [line.split()[0] for line in report[1:]] == ["first", "second", "total"]
@@ -0,0 +1,65 @@
+import threading
+
+from tx_worker import Reporter, TransactionWorker, WorkerEvent
+
+
+def _drain_all(worker: TransactionWorker) -> list[WorkerEvent]:
+    events: list[WorkerEvent] = []
+    while worker.pending:
+        events.extend(worker.drain(limit=10))
+    return events
+
+
+def test_worker_reports_pixels_and_completion() -> None:
+    worker = TransactionWorker()
+    ran_on: list[str] = []
+
+    def job(report: Reporter) -> None:
+        ran_on.append(threading.current_thread().name)
+        report.pixel_settled((0, 0))
+        report.pixel_failed((0, 1), "boom")
+
+    worker.submit("settle", job).result(timeout=5)
+    events = _drain_all(worker)
+    worker.shutdown()
+
+    assert ran_on[0].startswith("tx-worker")
+    assert [(event.kind, event.pixel) for event in events] == [
+        ("pixel_settled", (0, 0)),
+        ("pixel_failed", (0, 1)),
+        ("done", None),
+    ]
+
+
+def test_worker_reports_job_errors() -> None:
+    worker = TransactionWorker()
+
+    def job(report: Reporter) -> None:
+        raise RuntimeError("algod unreachable")
+
+    worker.submit("settle", job).result(timeout=5)
+    events = _drain_all(worker)
+    worker.shutdown()
+
+    assert events == [WorkerEvent("settle", "error", message="algod unreachable")]
+    assert worker.pending == 0
+
+
+def test_worker_fails_unreported_pixels_of_a_job_that_raises() -> None:
+    worker = TransactionWorker()
+
+    def job(report: Reporter) -> None:
+        report.pixel_settled((0, 0))
+        raise RuntimeError("algod unreachable")
+
+    worker.submit("settle", job, [(0, 0), (0, 1), (0, 2)]).result(timeout=5)
+    events = _drain_all(worker)
+    worker.shutdown()
+
+    assert [(event.kind, event.pixel) for event in events] == [
+        ("pixel_settled", (0, 0)),
+        ("pixel_failed", (0, 1)),
+        ("pixel_failed", (0, 2)),
+        ("error", None),
+    ]
+    assert events[1].message == "job settle failed: algod unreachable"